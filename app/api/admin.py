@@ -13,7 +13,10 @@ from datetime import datetime
 from app.core.database import get_db
 from app.middleware.auth import get_current_active_user
 from app.services.admin_service import AdminService
+from app.repositories.audit_log_repository import encode_cursor
 from app.models.user import User
+from app.models.venue import Venue
+from app.core.fastjson import RowsJSONResponse, dumps_rows, dumps_model
 from app.schemas.admin import (
     OrganizerApprovalsResponse,
     ApprovalActionRequest,
@@ -35,7 +38,7 @@ from app.schemas.admin import (
     PaginationInfo
 )
 from app.schemas.category import CategoryCreate, CategoryUpdate, CategoryResponse, CategoriesResponse
-from app.schemas.venue import VenueCreate, VenueUpdate, VenueResponse, VenuesResponse
+from app.schemas.venue import VenueCreate, VenueUpdate, VenuesResponse
 
 router = APIRouter(prefix="/api/admin", tags=["Admin"])
 
@@ -69,23 +72,11 @@ async def get_organizer_approvals(
     requests = admin_service.get_organizer_approvals(current_user, status_filter=status)
 
     # Convert to response format
-    request_responses = []
-    for req in requests:
-        request_responses.append(OrganizerApprovalResponse(
-            id=req.id,
-            userId=req.user_id,
-            name=req.user.name if req.user else "Unknown",
-            email=req.user.email if req.user else "Unknown",
-            department=req.user.department if req.user else None,
-            reason=req.reason,
-            requestedAt=req.requested_at.isoformat() if req.requested_at else None,
-            status=req.status.value,
-            reviewedBy=req.reviewed_by,
-            reviewedAt=req.reviewed_at.isoformat() if req.reviewed_at else None,
-            notes=req.notes
-        ))
+    request_responses = [OrganizerApprovalResponse.from_orm_fast(req) for req in requests]
 
-    return OrganizerApprovalsResponse(requests=request_responses)
+    return RowsJSONResponse(dumps_model(
+        OrganizerApprovalsResponse.model_construct(success=True, requests=request_responses)
+    ))
 
 
 @router.post(
@@ -475,19 +466,7 @@ async def get_all_venues(
     admin_service = AdminService(db)
     venues = admin_service.get_all_venues(current_user, include_inactive=includeInactive)
 
-    # Convert to response format
-    venue_responses = [VenueResponse(
-        id=venue.id,
-        name=venue.name,
-        building=venue.building,
-        capacity=venue.capacity,
-        facilities=venue.facilities if venue.facilities else [],
-        isActive=venue.is_active,
-        createdAt=venue.created_at.isoformat() if venue.created_at else None,
-        updatedAt=venue.updated_at.isoformat() if venue.updated_at else None
-    ) for venue in venues]
-
-    return VenuesResponse(venues=venue_responses)
+    return RowsJSONResponse(dumps_rows(venues, Venue.JSON_SCHEMA, "venues", success=True))
 
 
 @router.post(
@@ -613,6 +592,7 @@ async def get_audit_logs(
     search: Optional[str] = Query(None, description="Search in details"),
     page: int = Query(1, ge=1, description="Page number"),
     limit: int = Query(50, ge=1, le=100, description="Items per page"),
+    cursor: Optional[str] = Query(None, description="Cursor from a previous page's nextCursor"),
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
 ):
@@ -629,6 +609,7 @@ async def get_audit_logs(
     - search: Search in details
     - page: Pagination page number
     - limit: Items per page (max 100)
+    - cursor: Keyset cursor for the next page (faster than deep page numbers)
 
     **Business Rules:**
     - Append-only (cannot edit or delete)
@@ -647,22 +628,23 @@ async def get_audit_logs(
         user_id=userId,
         search=search,
         page=page,
-        limit=limit
+        limit=limit,
+        cursor=cursor
     )
 
     # Convert to response format
     log_responses = []
     for log in logs:
-        log_responses.append(AuditLogResponse(
+        log_responses.append(AuditLogResponse.model_construct(
             id=log.id,
             timestamp=log.timestamp.isoformat() if log.timestamp else "",
             action=log.action.value,
-            actor=AuditLogActorInfo(
+            actor=AuditLogActorInfo.model_construct(
                 id=log.actor_id,
                 name=log.actor_name,
                 role=log.actor_role
             ),
-            target=AuditLogTargetInfo(
+            target=AuditLogTargetInfo.model_construct(
                 type=log.target_type.value,
                 id=log.target_id,
                 name=log.target_name
@@ -675,14 +657,17 @@ async def get_audit_logs(
 
     # Calculate pagination
     total_pages = (total_count + limit - 1) // limit
-    pagination = PaginationInfo(
+    pagination = PaginationInfo.model_construct(
         currentPage=page,
         totalPages=total_pages,
         totalItems=total_count,
         itemsPerPage=limit
     )
+    next_cursor = encode_cursor(logs[-1]) if len(logs) == limit else None
 
-    return AuditLogsResponse(logs=log_responses, pagination=pagination)
+    return RowsJSONResponse(dumps_model(AuditLogsResponse.model_construct(
+        success=True, logs=log_responses, pagination=pagination, nextCursor=next_cursor
+    )))
 
 
 @router.get(
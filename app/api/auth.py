@@ -5,6 +5,7 @@ Handles login, logout, token validation, and user info endpoints.
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 from app.core.database import get_db
+from app.core.security import create_access_token
 from app.services.auth_service import AuthService
 from app.middleware.auth import get_current_user, get_current_active_user
 from app.models.user import User
@@ -53,7 +54,7 @@ async def login(
     auth_service = AuthService(db)
     
     try:
-        user, token = auth_service.authenticate_user(credentials)
+        user, token = await auth_service.authenticate_user(credentials)
         
         return TokenResponse(
             success=True,
@@ -112,7 +113,6 @@ async def register(
         user = auth_service.register_user(user_data)
         
         # Automatically log in the user
-        from app.core.security import create_access_token
         token_data = {
             "sub": user.id,
             "email": user.email,
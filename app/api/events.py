@@ -10,16 +10,17 @@ from app.services.event_service import EventService
 from app.schemas.event import (
     EventsListResponse,
     EventDetailResponse,
-    EventListResponse,
-    PaginationInfo,
-    CategoryInfo,
-    OrganizerInfo
+    EventResponse
 )
 from app.schemas.category import CategoriesResponse, CategoryResponse
-from app.schemas.venue import VenuesResponse, VenueResponse
+from app.schemas.venue import VenuesResponse
 from app.schemas.auth import ErrorResponse
 from app.middleware.auth import get_current_active_user
 from app.models.user import User, UserRole
+from app.models.venue import Venue
+from app.models.event import Event
+from app.core.fastjson import RowsJSONResponse, dumps_rows
+from app.repositories.event_repository import encode_event_cursor
 from app.services.registration_service import RegistrationService
 
 
@@ -69,7 +70,7 @@ async def get_events(
     page: int = Query(
         1,
         ge=1,
-        description="Page number (default: 1)"
+        description="Page number (default: 1); ignored when cursor is given"
     ),
     limit: int = Query(
         20,
@@ -77,6 +78,10 @@ async def get_events(
         le=100,
         description="Items per page (default: 20, max: 100)"
     ),
+    cursor: Optional[str] = Query(
+        None,
+        description="Cursor from a previous page's nextCursor"
+    ),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
@@ -98,8 +103,11 @@ async def get_events(
     - **organizer**: Filter by organizer name
     - **availability**: Only show events with available spots
     - **sortBy**: Sort by 'date', 'title', or 'popularity'
-    - **page**: Page number (starts at 1)
+    - **page**: Page number (starts at 1); ignored when `cursor` is given
     - **limit**: Items per page (1-100)
+    - **cursor**: Keyset cursor for the next page (faster than deep page numbers);
+      when given, `pagination.currentPage` and `pagination.totalPages` are null.
+      A malformed cursor, or one issued under another sortBy, returns 400
     
     **Returns:**
     - List of events with pagination information
@@ -116,8 +124,12 @@ async def get_events(
             availability=availability,
             sort_by=sortBy,
             page=page,
-            limit=limit
+            limit=limit,
+            cursor=cursor
         )
+        # Taken before the per-user filter below so the next page starts
+        # after the last row the repository returned
+        next_cursor = encode_event_cursor(events[-1], sortBy) if len(events) == limit else None
         ## make a call to the registrations API to get the registrations for the user
        
 
@@ -132,57 +144,26 @@ async def get_events(
         #     events = [event for event in events if event.organizer_id == current_user.id]
                 
         
-        # Convert events to response format
-        event_responses = []
-        for event in events:
-            event_data = EventListResponse(
-                id=event.id,
-                title=event.title,
-                description=event.description,
-                category=CategoryInfo(
-                    id=event.category.id,
-                    name=event.category.name,
-                    slug=event.category.slug,
-                    color=event.category.color
-                ) if event.category else None,
-                organizer=OrganizerInfo(
-                    id=event.organizer.id,
-                    name=event.organizer.name,
-                    email=event.organizer.email,
-                    department=event.organizer.department
-                ) if event.organizer else None,
-                date=event.date.isoformat() if event.date else None,
-                startTime=event.start_time.strftime("%H:%M") if event.start_time else None,
-                endTime=event.end_time.strftime("%H:%M") if event.end_time else None,
-                venue=event.venue,
-                location=event.location,
-                capacity=event.capacity,
-                registeredCount=event.registered_count,
-                waitlistCount=event.waitlist_count,
-                status=event.status.value,
-                imageUrl=event.image_url,
-                tags=event.tags if event.tags else [],
-                isFeatured=event.is_featured,
-                createdAt=event.created_at.isoformat() if event.created_at else None,
-                publishedAt=event.published_at.isoformat() if event.published_at else None
-            )
-            event_responses.append(event_data)
+        # Calculate pagination info (page numbers mean nothing once a
+        # cursor is given, so they are reported as null)
+        if cursor:
+            current_page = total_pages = None
+        else:
+            current_page = page
+            total_pages = (total_count + limit - 1) // limit  # Ceiling division
         
-        # Calculate pagination info
-        total_pages = (total_count + limit - 1) // limit  # Ceiling division
+        pagination = {
+            "currentPage": current_page,
+            "totalPages": total_pages,
+            "totalItems": total_count,
+            "itemsPerPage": limit
+        }
         
-        pagination = PaginationInfo(
-            currentPage=page,
-            totalPages=total_pages,
-            totalItems=total_count,
-            itemsPerPage=limit
-        )
-        
-        return EventsListResponse(
-            success=True,
-            events=event_responses,
-            pagination=pagination
-        )
+        # Rows go straight from ORM attributes to JSON, no per-row model
+        return RowsJSONResponse(dumps_rows(
+            events, Event.LIST_JSON_SCHEMA, "events",
+            success=True, pagination=pagination, nextCursor=next_cursor
+        ))
         
     except HTTPException:
         raise
@@ -230,44 +211,9 @@ async def get_event_detail(
         event = event_service.get_event_by_id(event_id)
         
         # Build response with full event details
-        event_response = EventDetailResponse(
+        event_response = EventDetailResponse.model_construct(
             success=True,
-            event={
-                "id": event.id,
-                "title": event.title,
-                "description": event.description,
-                "categoryId": event.category_id,
-                "organizerId": event.organizer_id,
-                "date": event.date.isoformat() if event.date else None,
-                "startTime": event.start_time.strftime("%H:%M") if event.start_time else None,
-                "endTime": event.end_time.strftime("%H:%M") if event.end_time else None,
-                "venue": event.venue,
-                "location": event.location,
-                "capacity": event.capacity,
-                "registeredCount": event.registered_count,
-                "waitlistCount": event.waitlist_count,
-                "remainingCapacity": event.remaining_capacity,
-                "status": event.status.value,
-                "imageUrl": event.image_url,
-                "tags": event.tags if event.tags else [],
-                "isFeatured": event.is_featured,
-                "createdAt": event.created_at.isoformat() if event.created_at else None,
-                "updatedAt": event.updated_at.isoformat() if event.updated_at else None,
-                "publishedAt": event.published_at.isoformat() if event.published_at else None,
-                "cancelledAt": event.cancelled_at.isoformat() if event.cancelled_at else None,
-                "category": {
-                    "id": event.category.id,
-                    "name": event.category.name,
-                    "slug": event.category.slug,
-                    "color": event.category.color
-                } if event.category else None,
-                "organizer": {
-                    "id": event.organizer.id,
-                    "name": event.organizer.name,
-                    "email": event.organizer.email,
-                    "department": event.organizer.department
-                } if event.organizer else None
-            }
+            event=EventResponse.from_orm_fast(event)
         )
         
         return event_response
@@ -369,23 +315,8 @@ async def get_venues(
     try:
         venues = event_service.get_all_venues(active_only=True)
         
-        venue_responses = [
-            VenueResponse(
-                id=venue.id,
-                name=venue.name,
-                building=venue.building,
-                capacity=venue.capacity,
-                facilities=venue.facilities if venue.facilities else [],
-                isActive=venue.is_active,
-                createdAt=venue.created_at.isoformat() if venue.created_at else None,
-                updatedAt=venue.updated_at.isoformat() if venue.updated_at else None
-            )
-            for venue in venues
-        ]
-        
-        return VenuesResponse(
-            success=True,
-            venues=venue_responses
+        return RowsJSONResponse(
+            dumps_rows(venues, Venue.JSON_SCHEMA, "venues", success=True)
         )
         
     except HTTPException:
@@ -9,23 +9,24 @@ from typing import Optional, List
 import io
 
 from app.core.database import get_db
+from app.core.fastjson import RowsJSONResponse, dumps_model
 from app.services.organizer_service import OrganizerService
 from app.middleware.auth import require_organizer, get_current_user
 from app.models.user import User
 from app.models.event import EventStatus
+from app.repositories.event_repository import encode_event_cursor
 from app.schemas.event import (
     EventCreate,
     EventUpdate,
     EventResponse,
     OrganizerEventsResponse,
-    EventStatistics,
-    CategoryInfo,
-    OrganizerInfo
+    EventStatistics
 )
 from app.schemas.registration import (
     AttendeesResponse,
     AttendeeInfo,
-    AttendeeStatistics
+    AttendeeStatistics,
+    GuestOut
 )
 from app.schemas.waitlist import WaitlistResponse
 from app.schemas.auth import ErrorResponse, MessageResponse
@@ -117,42 +118,7 @@ def get_client_info(request: Request) -> tuple:
 
 def event_to_response(event) -> EventResponse:
     """Convert Event model to EventResponse."""
-    return EventResponse(
-        id=event.id,
-        title=event.title,
-        description=event.description,
-        categoryId=event.category_id,
-        organizerId=event.organizer_id,
-        date=event.date.isoformat() if event.date else None,
-        startTime=event.start_time.strftime("%H:%M") if event.start_time else None,
-        endTime=event.end_time.strftime("%H:%M") if event.end_time else None,
-        venue=event.venue,
-        location=event.location,
-        capacity=event.capacity,
-        registeredCount=event.registered_count,
-        waitlistCount=event.waitlist_count,
-        remainingCapacity=event.remaining_capacity,
-        status=event.status.value,
-        imageUrl=event.image_url,
-        tags=event.tags if event.tags else [],
-        isFeatured=event.is_featured,
-        createdAt=event.created_at.isoformat() if event.created_at else None,
-        updatedAt=event.updated_at.isoformat() if event.updated_at else None,
-        publishedAt=event.published_at.isoformat() if event.published_at else None,
-        cancelledAt=event.cancelled_at.isoformat() if event.cancelled_at else None,
-        category=CategoryInfo(
-            id=event.category.id,
-            name=event.category.name,
-            slug=event.category.slug,
-            color=event.category.color
-        ) if event.category else None,
-        organizer=OrganizerInfo(
-            id=event.organizer.id,
-            name=event.organizer.name,
-            email=event.organizer.email,
-            department=event.organizer.department
-        ) if event.organizer else None
-    )
+    return EventResponse.from_orm_fast(event)
 
 
 # ============================================
@@ -252,6 +218,16 @@ async def get_organizer_events(
         alias="status",
         description="Filter by status: draft, pending, published, cancelled"
     ),
+    limit: Optional[int] = Query(
+        None,
+        ge=1,
+        le=100,
+        description="Page size (default: all events)"
+    ),
+    cursor: Optional[str] = Query(
+        None,
+        description="Cursor from a previous page's nextCursor"
+    ),
     current_user: User = Depends(require_organizer),
     db: Session = Depends(get_db)
 ):
@@ -264,10 +240,13 @@ async def get_organizer_events(
     
     **Query Parameters:**
     - status: Filter by event status (draft, pending, published, cancelled)
+    - limit: Page size; omit to return all events
+    - cursor: Keyset cursor for the next page (400 if malformed)
     
     **Returns:**
-    - List of events with details
+    - List of events with details, newest first
     - Statistics (total, by status)
+    - nextCursor when more events may follow
     """
     organizer_service = OrganizerService(db)
     
@@ -285,26 +264,32 @@ async def get_organizer_events(
         
         events, stats = organizer_service.get_organizer_events(
             organizer=current_user,
-            status_filter=event_status
+            status_filter=event_status,
+            limit=limit,
+            cursor=cursor
         )
         
         # Convert events to response format
         event_responses = [event_to_response(event) for event in events]
+        next_cursor = encode_event_cursor(events[-1], "recent") if limit and len(events) == limit else None
         
-        # Build statistics
-        statistics = EventStatistics(
+        # Build statistics (counts come from one aggregate query, see
+        # EventRepository.get_organizer_statistics)
+        by_status = stats.get("by_status", {})
+        statistics = EventStatistics.model_construct(
             total=stats.get("total", 0),
-            draft=stats.get("by_status", {}).get("draft", 0),
-            pending=stats.get("by_status", {}).get("pending", 0),
-            published=stats.get("by_status", {}).get("published", 0),
-            cancelled=stats.get("by_status", {}).get("cancelled", 0)
+            draft=by_status.get("draft", 0),
+            pending=by_status.get("pending", 0),
+            published=by_status.get("published", 0),
+            cancelled=by_status.get("cancelled", 0)
         )
         
-        return OrganizerEventsResponse(
+        return RowsJSONResponse(dumps_model(OrganizerEventsResponse.model_construct(
             success=True,
             events=event_responses,
-            statistics=statistics
-        )
+            statistics=statistics,
+            nextCursor=next_cursor
+        )))
         
     except HTTPException:
         raise
@@ -615,7 +600,7 @@ async def get_event_attendees(
         
         # Convert to response format
         attendee_responses = [
-            AttendeeInfo(
+            AttendeeInfo.model_construct(
                 id=a["id"] or "",
                 registrationId=a["registrationId"],
                 name=a["name"],
@@ -623,12 +608,12 @@ async def get_event_attendees(
                 registeredAt=a["registeredAt"] or "",
                 checkInStatus=a["checkInStatus"],
                 checkedInAt=a["checkedInAt"],
-                guests=a["guests"]
+                guests=GuestOut.list_from_stored(a["guests"])
             )
             for a in attendees
         ]
         
-        stats_response = AttendeeStatistics(
+        stats_response = AttendeeStatistics.model_construct(
             totalRegistrations=statistics["totalRegistrations"],
             checkedIn=statistics["checkedIn"],
             notCheckedIn=statistics["notCheckedIn"],
@@ -636,11 +621,11 @@ async def get_event_attendees(
             capacityUsed=statistics["capacityUsed"]
         )
         
-        return AttendeesResponse(
+        return RowsJSONResponse(dumps_model(AttendeesResponse.model_construct(
             success=True,
             attendees=attendee_responses,
             statistics=stats_response
-        )
+        )))
         
     except HTTPException:
         raise
@@ -881,7 +866,7 @@ async def get_event_waitlist(
         
         # Convert to response format
         waitlist_responses = [
-            WaitlistEntryInfo(
+            WaitlistEntryInfo.model_construct(
                 id=entry["id"],
                 userId=entry["userId"],
                 position=entry["position"],
@@ -893,11 +878,11 @@ async def get_event_waitlist(
             for entry in waitlist
         ]
         
-        return EventWaitlistResponse(
+        return RowsJSONResponse(dumps_model(EventWaitlistResponse.model_construct(
             success=True,
             waitlist=waitlist_responses,
             totalCount=len(waitlist_responses)
-        )
+        )))
         
     except HTTPException:
         raise
@@ -5,6 +5,7 @@ Handles event registration, cancellation, and waitlist management.
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 from app.core.database import get_db
+from app.core.fastjson import RowsJSONResponse, dumps_model
 from app.services.registration_service import RegistrationService
 from app.middleware.auth import get_current_active_user
 from app.models.user import User
@@ -104,22 +105,7 @@ async def register_for_event(
         )
 
         # Convert to response format
-        registration_response = RegistrationResponse(
-            id=registration.id,
-            userId=registration.user_id,
-            eventId=registration.event_id,
-            status=registration.status.value,
-            ticketCode=registration.ticket_code,
-            qrCode=registration.qr_code,
-            registeredAt=registration.registered_at.isoformat(),
-            checkInStatus=registration.check_in_status.value,
-            checkedInAt=registration.checked_in_at.isoformat() if registration.checked_in_at else None,
-            guests=registration.guests if registration.guests else [],
-            sessions=registration.sessions if registration.sessions else [],
-            reminderSent=registration.reminder_sent,
-            cancelledAt=registration.cancelled_at.isoformat() if registration.cancelled_at else None,
-            event=None  # Not included in creation response
-        )
+        registration_response = RegistrationResponse.from_orm_fast(registration)
 
         # Return success response
         return RegistrationCreateResponse(
@@ -224,45 +210,18 @@ async def get_user_registrations(
         )
 
         # Convert to response format
-        registration_responses = []
-        for reg in registrations:
-            # Build event basic info
-            event_info = None
-            if reg.event:
-                event_info = EventBasicInfo(
-                    id=reg.event.id,
-                    title=reg.event.title,
-                    date=reg.event.date.isoformat() if reg.event.date else "",
-                    startTime=reg.event.start_time.strftime('%H:%M') if reg.event.start_time else "",
-                    endTime=reg.event.end_time.strftime('%H:%M') if reg.event.end_time else "",
-                    venue=reg.event.venue,
-                    organizer={
-                        "name": reg.event.organizer.name if reg.event.organizer else ""
-                    }
-                )
-
-            registration_response = RegistrationResponse(
-                id=reg.id,
-                userId=reg.user_id,
-                eventId=reg.event_id,
-                status=reg.status.value,
-                ticketCode=reg.ticket_code,
-                qrCode=reg.qr_code,
-                registeredAt=reg.registered_at.isoformat(),
-                checkInStatus=reg.check_in_status.value,
-                checkedInAt=reg.checked_in_at.isoformat() if reg.checked_in_at else None,
-                guests=reg.guests if reg.guests else [],
-                sessions=reg.sessions if reg.sessions else [],
-                reminderSent=reg.reminder_sent,
-                cancelledAt=reg.cancelled_at.isoformat() if reg.cancelled_at else None,
-                event=event_info
+        registration_responses = [
+            RegistrationResponse.from_orm_fast(
+                reg,
+                EventBasicInfo.from_orm_fast(reg.event) if reg.event else None
             )
-            registration_responses.append(registration_response)
+            for reg in registrations
+        ]
 
-        return RegistrationsListResponse(
+        return RowsJSONResponse(dumps_model(RegistrationsListResponse.model_construct(
             success=True,
             registrations=registration_responses
-        )
+        )))
 
     except Exception as e:
         raise HTTPException(
@@ -5,6 +5,7 @@ Handles waitlist join, view, and leave operations.
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 from app.core.database import get_db
+from app.core.fastjson import RowsJSONResponse, dumps_model
 from app.services.registration_service import RegistrationService
 from app.middleware.auth import get_current_active_user
 from app.models.user import User
@@ -82,19 +83,11 @@ async def join_waitlist(
         )
 
         # Convert to response format
-        waitlist_response = WaitlistResponse(
-            id=waitlist_entry.id,
-            userId=waitlist_entry.user_id,
-            eventId=waitlist_entry.event_id,
-            position=waitlist_entry.position,
-            joinedAt=waitlist_entry.joined_at.isoformat(),
-            notificationPreference=waitlist_entry.notification_preference.value,
-            event=None  # Not included in creation response
-        )
+        waitlist_response = WaitlistResponse.from_orm_fast(waitlist_entry)
 
         return WaitlistCreateResponse(
             success=True,
-            message=f"Added to waitlist at position {waitlist_entry.position}",
+            message=f"Added to waitlist at position {waitlist_entry.queue_position}",
             waitlistEntry=waitlist_response
         )
 
@@ -160,35 +153,34 @@ async def get_user_waitlist(
             user_id=current_user.id
         )
 
+        # Registered counts change often, so they are read live in one query;
+        # the rest of the event preview is stored on the waitlist entry
+        registered_counts = registration_service.get_registered_counts(
+            entry.event_id for entry in waitlist_entries
+        )
+
         # Convert to response format
         waitlist_responses = []
         for entry in waitlist_entries:
             # Build event info
             event_info = None
-            if entry.event:
-                event_info = EventWaitlistInfo(
-                    id=entry.event.id,
-                    title=entry.event.title,
-                    date=entry.event.date.isoformat() if entry.event.date else "",
-                    capacity=entry.event.capacity,
-                    registeredCount=entry.event.registered_count
+            preview = entry.event_preview(registered_counts.get(entry.event_id))
+            if preview:
+                event_info = EventWaitlistInfo.model_construct(
+                    id=preview["id"],
+                    title=preview["title"],
+                    date=preview["date"] or "",
+                    capacity=preview["capacity"],
+                    registeredCount=preview["registeredCount"]
                 )
 
-            waitlist_response = WaitlistResponse(
-                id=entry.id,
-                userId=entry.user_id,
-                eventId=entry.event_id,
-                position=entry.position,
-                joinedAt=entry.joined_at.isoformat(),
-                notificationPreference=entry.notification_preference.value,
-                event=event_info
-            )
+            waitlist_response = WaitlistResponse.from_orm_fast(entry, event_info)
             waitlist_responses.append(waitlist_response)
 
-        return WaitlistListResponse(
+        return RowsJSONResponse(dumps_model(WaitlistListResponse.model_construct(
             success=True,
             waitlist=waitlist_responses
-        )
+        )))
 
     except Exception as e:
         raise HTTPException(
@@ -24,6 +24,13 @@ class Settings(BaseSettings):
     DATABASE_URL: str
     DATABASE_POOL_SIZE: int = 20
     DATABASE_MAX_OVERFLOW: int = 10
+    DATABASE_POOL_TIMEOUT: int = 30  # Seconds to wait for a free connection
+    DATABASE_POOL_RECYCLE: int = 1800  # Replace connections older than this (seconds)
+    DATABASE_QUERY_CACHE_SIZE: int = 1200
+    DATABASE_INSERT_PAGE_SIZE: int = 10000  # Rows per multi-row INSERT in bulk creates
+    DATABASE_STRICT_LOADING: bool = False  # Raise on unplanned lazy loads (enable in tests)
+    ORGANIZER_STATS_REFRESH_SECONDS: int = 60  # organizer_stats materialized view (PostgreSQL)
+    AUDIT_LOG_PARTITION_CHECK_SECONDS: int = 86400  # Monthly audit_logs partition upkeep (PostgreSQL)
     
     # JWT
     JWT_SECRET_KEY: str
@@ -33,6 +40,7 @@ class Settings(BaseSettings):
     
     # Security
     BCRYPT_ROUNDS: int = 12
+    BCRYPT_ROUNDS_BULK: int = 4  # Seeding/import only (UserRepository.create_bulk)
     CORS_ORIGINS: str = "http://localhost:3000,http://localhost:5173"
     
     # Email Configuration - SendGrid API
@@ -40,6 +48,8 @@ class Settings(BaseSettings):
     SENDGRID_API_KEY: str = ""
     EMAIL_FROM: str = "terpspark.events@gmail.com"
     EMAIL_FROM_NAME: str = "TerpSpark"
+    EMAIL_SEND_WORKERS: int = 4  # Threads delivering background (queued) emails
+    EMAIL_SEND_ATTEMPTS: int = 3  # Tries per queued email, with exponential backoff
     
     # Rate Limiting
     RATE_LIMIT_LOGIN: str = "5/15minutes"
@@ -2,31 +2,75 @@
 Database configuration and session management.
 Provides SQLAlchemy engine, session factory, and base model.
 """
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event, DDL
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker, Session
-from typing import Generator
+from sqlalchemy.orm import sessionmaker, Session, raiseload
+from typing import Generator, Optional, Tuple
 from app.core.config import settings
 
+# psycopg2 can also batch executemany UPDATE/DELETE (INSERTs are already
+# batched by insertmanyvalues); other drivers do not accept the option
+_driver_options = (
+    {"executemany_mode": "values_plus_batch"}
+    if make_url(settings.DATABASE_URL).get_driver_name() == "psycopg2"
+    else {}
+)
+
 # Create SQLAlchemy engine
 engine = create_engine(
     settings.DATABASE_URL,
     pool_size=settings.DATABASE_POOL_SIZE,
     max_overflow=settings.DATABASE_MAX_OVERFLOW,
+    pool_timeout=settings.DATABASE_POOL_TIMEOUT,
+    pool_recycle=settings.DATABASE_POOL_RECYCLE,  # Outlive server/proxy idle timeouts
     pool_pre_ping=True,  # Verify connections before using
+    query_cache_size=settings.DATABASE_QUERY_CACHE_SIZE,  # Compiled SQL statement cache
+    insertmanyvalues_page_size=settings.DATABASE_INSERT_PAGE_SIZE,  # Batched INSERT ... VALUES size
     echo=settings.DEBUG,  # Log SQL queries in debug mode
+    **_driver_options,
 )
 
 # Create SessionLocal class
+# (expire_on_commit=False: repositories keep instances current themselves,
+# so reading an attribute after commit does not reload the row)
 SessionLocal = sessionmaker(
     autocommit=False,
     autoflush=False,
+    expire_on_commit=False,
     bind=engine
 )
 
 # Create Base class for models
 Base = declarative_base()
 
+# Trigram indexes (gin_trgm_ops) need the pg_trgm extension and users.email
+# the citext type before tables are created
+for _extension in ("pg_trgm", "citext"):
+    event.listen(
+        Base.metadata,
+        "before_create",
+        DDL(f"CREATE EXTENSION IF NOT EXISTS {_extension}").execute_if(dialect="postgresql")
+    )
+
+
+def strict_loading(strict: Optional[bool] = None) -> Tuple:
+    """
+    Loader options that make relationships not eagerly loaded raise on access.
+    
+    Pass after a query's explicit eager-load options so a lazy load that
+    would otherwise run one SELECT per row fails loudly instead.
+    
+    Args:
+        strict: Whether to guard; None falls back to DATABASE_STRICT_LOADING
+        
+    Returns:
+        Tuple: Options to splat into Query.options()
+    """
+    if strict is None:
+        strict = settings.DATABASE_STRICT_LOADING
+    return (raiseload("*"),) if strict else ()
+
 
 def get_db() -> Generator[Session, None, None]:
     """
@@ -0,0 +1,123 @@
+"""
+Fast JSON encoding of ORM row collections with orjson.
+Lets list endpoints skip per-row to_dict()/Pydantic model construction.
+"""
+from dataclasses import make_dataclass
+from functools import lru_cache
+from operator import attrgetter
+from typing import Any, Callable, Iterable, Optional, Sequence, Tuple
+
+import orjson
+from fastapi.responses import Response
+from pydantic import BaseModel
+
+# (json key, attribute name, coercer or None) - values orjson can encode
+# natively (str, int, bool, None, list, dict, datetime, date, str enums)
+# need no coercer
+RowSchema = Sequence[Tuple[str, str, Optional[Callable[[Any], Any]]]]
+
+
+def hhmm(value: Any) -> Optional[str]:
+    """Coerce a time to HH:MM (orjson would emit HH:MM:SS)."""
+    return value.strftime("%H:%M") if value else None
+
+
+def or_list(value: Any) -> list:
+    """Coerce a missing JSON array to []."""
+    return value or []
+
+
+def rows_to_dicts(rows: Iterable[Any], schema: RowSchema) -> list:
+    """
+    Project ORM rows to plain dicts using a prebuilt schema.
+
+    Args:
+        rows: Mapped instances
+        schema: Field schema, usually the model's JSON_SCHEMA
+
+    Returns:
+        list: One dict per row
+    """
+    fields = [(key, attrgetter(attr), coerce) for key, attr, coerce in schema]
+    result = []
+    for row in rows:
+        item = {}
+        for key, get, coerce in fields:
+            value = get(row)
+            item[key] = coerce(value) if coerce else value
+        result.append(item)
+    return result
+
+
+@lru_cache(maxsize=None)
+def row_struct(schema: RowSchema) -> type:
+    """
+    Build (once per schema) a slotted dataclass with one field per JSON key.
+
+    orjson encodes dataclasses natively in field order, so rows projected
+    into these need no per-row dict or key hashing.
+
+    Args:
+        schema: Field schema tuple, usually the model's JSON_SCHEMA
+
+    Returns:
+        type: Dataclass whose fields are the schema's JSON keys
+    """
+    return make_dataclass("RowStruct", [key for key, _, _ in schema], slots=True)
+
+
+def rows_to_structs(rows: Iterable[Any], schema: RowSchema) -> list:
+    """
+    Project ORM rows to slotted structs using a prebuilt schema.
+
+    Args:
+        rows: Mapped instances
+        schema: Field schema tuple, usually the model's JSON_SCHEMA
+
+    Returns:
+        list: One row_struct(schema) instance per row
+    """
+    struct = row_struct(schema)
+    fields = [(attrgetter(attr), coerce) for _, attr, coerce in schema]
+    return [
+        struct(*[coerce(get(row)) if coerce else get(row) for get, coerce in fields])
+        for row in rows
+    ]
+
+
+def dumps_rows(rows: Iterable[Any], schema: RowSchema, key: str, **envelope: Any) -> bytes:
+    """
+    Encode ORM rows as a JSON object in a single orjson pass.
+
+    Args:
+        rows: Mapped instances
+        schema: Field schema, usually the model's JSON_SCHEMA
+        key: Envelope key holding the row list (e.g. "venues")
+        **envelope: Other top-level fields (e.g. success=True)
+
+    Returns:
+        bytes: UTF-8 JSON document
+    """
+    envelope[key] = rows_to_structs(rows, schema)
+    return orjson.dumps(envelope)
+
+
+def dumps_model(model: BaseModel) -> bytes:
+    """
+    Encode a response model straight to JSON bytes.
+
+    Pydantic's serializer writes JSON directly, where returning the model
+    would make FastAPI dump it to a dict and then json-encode that dict.
+
+    Args:
+        model: Response model, typically built with model_construct
+
+    Returns:
+        bytes: UTF-8 JSON document
+    """
+    return model.__pydantic_serializer__.to_json(model)
+
+
+class RowsJSONResponse(Response):
+    """JSON response whose body was already encoded by dumps_rows()/dumps_model()."""
+    media_type = "application/json"
@@ -2,6 +2,9 @@
 Security utilities for authentication and authorization.
 Handles password hashing, JWT token generation/validation, and user verification.
 """
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Optional, Dict, Any
 from jose import JWTError, jwt
@@ -9,7 +12,26 @@ from passlib.context import CryptContext
 from app.core.config import settings
 
 # Password hashing context
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__rounds=settings.BCRYPT_ROUNDS
+)
+
+# Cheaper cost factor for bulk seeding and imports; hashes still verify
+# against pwd_context since bcrypt stores its cost in the hash
+_bulk_pwd_context = pwd_context.copy(bcrypt__rounds=settings.BCRYPT_ROUNDS_BULK)
+
+# Hashers bound once; passlib resolves the bcrypt handler on each context.hash
+_hash = pwd_context.hash
+_bulk_hash = _bulk_pwd_context.hash
+
+# Hash verification is deliberately CPU-bound; run it on a pool sized to the
+# cores so bursts of logins queue here instead of stalling the event loop
+_password_pool = ThreadPoolExecutor(
+    max_workers=os.cpu_count() or 1,
+    thread_name_prefix="password-hash"
+)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -26,17 +48,35 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 
-def get_password_hash(password: str) -> str:
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """
+    Verify a password on the hashing thread pool without blocking the event loop.
+    
+    Args:
+        plain_password: The plain text password
+        hashed_password: The hashed password from database
+        
+    Returns:
+        bool: True if password matches, False otherwise
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _password_pool, pwd_context.verify, plain_password, hashed_password
+    )
+
+
+def get_password_hash(password: str, bulk: bool = False) -> str:
     """
     Hash a plain text password.
     
     Args:
         password: The plain text password to hash
+        bulk: Use the BCRYPT_ROUNDS_BULK cost factor (seeding/imports only)
         
     Returns:
         str: The hashed password
     """
-    return pwd_context.hash(password)
+    return _bulk_hash(password) if bulk else _hash(password)
 
 
 def create_access_token(
@@ -0,0 +1,38 @@
+"""
+Custom SQLAlchemy column types.
+"""
+import uuid
+from typing import Optional
+
+from sqlalchemy.types import TypeDecorator, Uuid
+
+# Never generated by uuid4(), so binding it can only miss
+_NIL_UUID = str(uuid.UUID(int=0))
+
+
+def new_id() -> str:
+    """Generate a primary key: a random UUID in canonical string form."""
+    return str(uuid.uuid4())
+
+
+class GUID(TypeDecorator):
+    """
+    UUID identifier exposed to Python as a canonical string.
+
+    Stored as native 16-byte UUID on PostgreSQL and CHAR(32) hex elsewhere,
+    instead of 36-character VARCHAR, which roughly halves PK/FK index width.
+    """
+    impl = Uuid(as_uuid=False)
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect) -> Optional[str]:
+        if value is None:
+            return None
+        if isinstance(value, uuid.UUID):
+            return str(value)
+        try:
+            return str(uuid.UUID(str(value)))
+        except ValueError:
+            # Malformed ids (e.g. from a URL path) cannot match any row;
+            # bind the nil UUID so lookups return nothing instead of raising
+            return _NIL_UUID
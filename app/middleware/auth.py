@@ -104,11 +104,15 @@ def require_role(*allowed_roles: UserRole):
     Returns:
         Dependency function that checks user role
     """
+    # Role set and error message are fixed per call site, so build them once
+    roles = frozenset(allowed_roles)
+    detail = f"Insufficient permissions. Required roles: {[role.value for role in allowed_roles]}"
+
     async def role_checker(current_user: User = Depends(get_current_user)) -> User:
-        if current_user.role not in allowed_roles:
+        if current_user.role not in roles:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
-                detail=f"Insufficient permissions. Required roles: {[role.value for role in allowed_roles]}"
+                detail=detail
             )
         return current_user
     
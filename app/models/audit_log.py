@@ -2,11 +2,15 @@
 Audit Log database model.
 Tracks all important actions in the system for security and compliance.
 """
-from sqlalchemy import Column, String, DateTime, Enum as SQLEnum, ForeignKey, Text, JSON
+from sqlalchemy import Column, String, DateTime, Enum as SQLEnum, ForeignKey, Text, JSON, Index, DDL, event
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
+from operator import attrgetter
 import enum
+import sys
 from app.core.database import Base
+from app.core.types import GUID, new_id
+from app.utils.serialization import iso_getter, enum_getter
 
 
 class AuditAction(str, enum.Enum):
@@ -63,22 +67,81 @@ class TargetType(str, enum.Enum):
     WAITLIST = "waitlist"
 
 
+# Enum -> wire value lookups, built once at import for to_dict()
+_ACTION_VALUE = {m: sys.intern(m.value) for m in AuditAction}
+_TARGET_VALUE = {m: sys.intern(m.value) for m in TargetType}
+
+
+def _actor(log: "AuditLog"):
+    if not log.actor_id:
+        return None
+    return {"id": log.actor_id, "name": log.actor_name, "role": log.actor_role}
+
+
+def _target(log: "AuditLog"):
+    if not log.target_id:
+        return None
+    return {"type": _TARGET_VALUE.get(log.target_type), "id": log.target_id, "name": log.target_name}
+
+
+# (output key, getter) pairs for AuditLog.to_dict(), in response field order
+_AUDIT_FIELDS = (
+    ("id", attrgetter("id")),
+    ("timestamp", iso_getter("timestamp")),
+    ("action", enum_getter("action", _ACTION_VALUE)),
+    ("actor", _actor),
+    ("target", _target),
+    ("details", attrgetter("details")),
+    ("metadata", lambda log: log.extra_metadata or {}),
+    ("ipAddress", attrgetter("ip_address")),
+    ("userAgent", attrgetter("user_agent")),
+)
+
+
 class AuditLog(Base):
     """
     Audit Log model for tracking all important system actions.
     This is an append-only table for security and compliance.
+    
+    On PostgreSQL the table is range-partitioned by month on timestamp, so
+    the partition key is part of the primary key.
     """
     __tablename__ = "audit_logs"
+    __table_args__ = (
+        # Serves newest-first keyset pagination on (timestamp, id)
+        Index("ix_audit_logs_timestamp_id", "timestamp", "id"),
+        # Serves per-actor rate-limit checks (actor + action over a time window)
+        Index("ix_audit_logs_actor_action_timestamp", "actor_id", "action", "timestamp"),
+        # Covers the dashboard's recent-activity projection so PostgreSQL can
+        # answer get_recent() with an index-only scan
+        Index(
+            "ix_audit_logs_recent_covering",
+            "timestamp",
+            postgresql_include=[
+                "id", "action", "actor_id", "actor_name",
+                "target_type", "target_id", "target_name",
+            ]
+        ).ddl_if(dialect="postgresql"),
+        # Lets ILIKE '%term%' searches on details use an index (PostgreSQL only)
+        Index(
+            "ix_audit_logs_details_trgm",
+            "details",
+            postgresql_using="gin",
+            postgresql_ops={"details": "gin_trgm_ops"}
+        ).ddl_if(dialect="postgresql"),
+        {"postgresql_partition_by": "RANGE (timestamp)"},
+    )
     
     # Primary Key
-    id = Column(String(36), primary_key=True, index=True)
+    id = Column(GUID, primary_key=True, default=new_id)
     
-    # Timestamp
+    # Timestamp (partition key, so also part of the primary key; lookups
+    # by time use ix_audit_logs_timestamp_id)
     timestamp = Column(
         DateTime(timezone=True),
+        primary_key=True,
         nullable=False,
-        server_default=func.now(),
-        index=True
+        server_default=func.now()
     )
     
     # Action
@@ -88,12 +151,12 @@ class AuditLog(Base):
         index=True
     )
     
-    # Actor (who performed the action)
+    # Actor (who performed the action); indexed as the leading column of
+    # ix_audit_logs_actor_action_timestamp
     actor_id = Column(
-        String(36),
+        GUID,
         ForeignKey("users.id"),
         nullable=True,
-        index=True,
         comment="User who performed the action (null for system actions)"
     )
     actor_name = Column(String(255), nullable=True)
@@ -135,23 +198,14 @@ class AuditLog(Base):
         Returns:
             dict: Audit log data as dictionary
         """
-        return {
-            "id": self.id,
-            "timestamp": self.timestamp.isoformat() if self.timestamp else None,
-            "action": self.action.value,
-            "actor": {
-                "id": self.actor_id,
-                "name": self.actor_name,
-                "role": self.actor_role
-            } if self.actor_id else None,
-            "target": {
-                "type": self.target_type.value if self.target_type else None,
-                "id": self.target_id,
-                "name": self.target_name
-            } if self.target_id else None,
-            "details": self.details,
-            "metadata": self.extra_metadata if self.extra_metadata else {},
-            "ipAddress": self.ip_address,
-            "userAgent": self.user_agent,
-        }
+        return {key: getter(self) for key, getter in _AUDIT_FIELDS}
+
 
+# Catch-all partition so inserts never fail when a monthly partition is
+# missing; monthly ones are added by create_audit_log_partitions()
+event.listen(
+    AuditLog.__table__,
+    "after_create",
+    DDL("CREATE TABLE IF NOT EXISTS audit_logs_default PARTITION OF audit_logs DEFAULT")
+    .execute_if(dialect="postgresql")
+)
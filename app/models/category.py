@@ -6,6 +6,7 @@ from sqlalchemy import Column, String, Boolean, DateTime, Text
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from app.core.database import Base
+from app.core.types import GUID, new_id
 
 
 class Category(Base):
@@ -17,7 +18,7 @@ class Category(Base):
     __tablename__ = "categories"
     
     # Primary Key
-    id = Column(String(36), primary_key=True, index=True)
+    id = Column(GUID, primary_key=True, default=new_id)
     
     # Category Information
     name = Column(String(100), nullable=False, unique=True)
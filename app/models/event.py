@@ -2,11 +2,19 @@
 Event database model.
 Represents events created by organizers.
 """
-from sqlalchemy import Column, String, Boolean, DateTime, Integer, Text, Enum as SQLEnum, JSON, ForeignKey, Date, Time
+from sqlalchemy import Column, Computed, String, Boolean, DateTime, Integer, Text, Enum as SQLEnum, JSON, ForeignKey, Date, Time, Index
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
+from operator import attrgetter
+from typing import Optional
 import enum
+import sys
+import reprlib
 from app.core.database import Base
+from app.core.types import GUID, new_id
+from app.utils.serialization import iso_getter, hhmm_getter, enum_getter, list_getter
+from app.core.fastjson import hhmm, or_list
 
 
 class EventStatus(str, enum.Enum):
@@ -17,23 +25,87 @@ class EventStatus(str, enum.Enum):
     CANCELLED = "cancelled"
 
 
+# Enum -> wire value lookup, built once at import for to_dict()
+_STATUS_VALUE = {m: sys.intern(m.value) for m in EventStatus}
+
+# Keeps __repr__ output bounded when SQL/debug logging reprs many events
+_short = reprlib.Repr()
+_short.maxstring = 32
+
+# (output key, getter) pairs for Event.to_dict(), in response field order
+_EVENT_FIELDS = (
+    ("id", attrgetter("id")),
+    ("title", attrgetter("title")),
+    ("description", attrgetter("description")),
+    ("categoryId", attrgetter("category_id")),
+    ("organizerId", attrgetter("organizer_id")),
+    ("date", iso_getter("date")),
+    ("startTime", hhmm_getter("start_time")),
+    ("endTime", hhmm_getter("end_time")),
+    ("venue", attrgetter("venue")),
+    ("location", attrgetter("location")),
+    ("capacity", attrgetter("capacity")),
+    ("registeredCount", attrgetter("registered_count")),
+    ("waitlistCount", attrgetter("waitlist_count")),
+    ("remainingCapacity", attrgetter("remaining_capacity")),
+    ("status", enum_getter("status", _STATUS_VALUE)),
+    ("imageUrl", attrgetter("image_url")),
+    ("tags", list_getter("tags")),
+    ("isFeatured", attrgetter("is_featured")),
+    ("createdAt", iso_getter("created_at")),
+    ("updatedAt", iso_getter("updated_at")),
+    ("publishedAt", iso_getter("published_at")),
+    ("cancelledAt", iso_getter("cancelled_at")),
+)
+
+
+def _category_ref(category) -> Optional[dict]:
+    """Nested category object of an event list row."""
+    if category is None:
+        return None
+    return {"id": category.id, "name": category.name, "slug": category.slug, "color": category.color}
+
+
+def _organizer_ref(user) -> Optional[dict]:
+    """Nested organizer object of an event list row."""
+    if user is None:
+        return None
+    return {"id": user.id, "name": user.name, "email": user.email, "department": user.department}
+
+
 class Event(Base):
     """
     Event model representing events in the system.
     Events can be in different statuses: draft, pending, published, cancelled.
     """
     __tablename__ = "events"
+    __table_args__ = (
+        Index("ix_event_tags_gin", "tags", postgresql_using="gin"),
+        # Let the LIKE '%term%' search in get_all_published use one index
+        # scan (PostgreSQL only)
+        Index(
+            "ix_events_search_blob_trgm",
+            "search_blob",
+            postgresql_using="gin",
+            postgresql_ops={"search_blob": "gin_trgm_ops"}
+        ).ddl_if(dialect="postgresql"),
+    )
+    # Fetch server-generated created_at/updated_at with RETURNING on
+    # INSERT and UPDATE instead of a reload SELECT. search_blob is only
+    # filtered on (via Event.__table__.c), never loaded into instances.
+    __mapper_args__ = {"eager_defaults": True, "exclude_properties": ["search_blob"]}
     
     # Primary Key
-    id = Column(String(36), primary_key=True, index=True)
+    id = Column(GUID, primary_key=True, default=new_id)
     
     # Basic Information
     title = Column(String(200), nullable=False)
     description = Column(Text, nullable=False)
     
     # Foreign Keys
-    category_id = Column(String(36), ForeignKey("categories.id"), nullable=False, index=True)
-    organizer_id = Column(String(36), ForeignKey("users.id"), nullable=False, index=True)
+    category_id = Column(GUID, ForeignKey("categories.id"), nullable=False, index=True)
+    # Indexed as the leading column of ix_events_organizer_date
+    organizer_id = Column(GUID, ForeignKey("users.id"), nullable=False)
     
     # Date and Time
     date = Column(Date, nullable=False, index=True, comment="Event date in YYYY-MM-DD")
@@ -49,19 +121,27 @@ class Event(Base):
     registered_count = Column(Integer, nullable=False, default=0, comment="Current number of registered attendees")
     waitlist_count = Column(Integer, nullable=False, default=0, comment="Current number on waitlist")
     
-    # Status
+    # Status (a native PostgreSQL enum: 4-byte values, integer comparisons;
+    # the type name is pinned to the one existing databases were created with)
     status = Column(
-        SQLEnum(EventStatus),
+        SQLEnum(EventStatus, native_enum=True, name="eventstatus"),
         nullable=False,
         default=EventStatus.PENDING,
         index=True
     )
     
+    # Lower-cased title, description, venue and location, maintained by the
+    # database for free-text search
+    search_blob = Column(
+        Text,
+        Computed("lower(title || ' ' || description || ' ' || venue || ' ' || location)", persisted=True)
+    )
+    
     # Media
     image_url = Column(String(500), nullable=True, comment="URL to event image")
     
-    # Tags - stored as JSON array
-    tags = Column(JSON, nullable=True, comment="Array of tag strings")
+    # Tags - stored as JSON array (JSONB on PostgreSQL so containment filters can use the GIN index)
+    tags = Column(JSON().with_variant(JSONB(), "postgresql"), nullable=True, comment="Array of tag strings")
     
     # Featured Status
     is_featured = Column(Boolean, nullable=False, default=False, comment="Whether event is featured")
@@ -87,8 +167,31 @@ class Event(Base):
     registrations = relationship("Registration", back_populates="event", lazy="dynamic")
     waitlist = relationship("WaitlistEntry", back_populates="event", lazy="dynamic")
     
+    # Field schema for app.core.fastjson.dumps_rows (same shape as EventListResponse)
+    LIST_JSON_SCHEMA = (
+        ("id", "id", None),
+        ("title", "title", None),
+        ("description", "description", None),
+        ("category", "category", _category_ref),
+        ("organizer", "organizer", _organizer_ref),
+        ("date", "date", None),
+        ("startTime", "start_time", hhmm),
+        ("endTime", "end_time", hhmm),
+        ("venue", "venue", None),
+        ("location", "location", None),
+        ("capacity", "capacity", None),
+        ("registeredCount", "registered_count", None),
+        ("waitlistCount", "waitlist_count", None),
+        ("status", "status", None),
+        ("imageUrl", "image_url", None),
+        ("tags", "tags", or_list),
+        ("isFeatured", "is_featured", None),
+        ("createdAt", "created_at", None),
+        ("publishedAt", "published_at", None),
+    )
+    
     def __repr__(self) -> str:
-        return f"<Event(id={self.id}, title={self.title}, status={self.status})>"
+        return f"<Event(id={self.id}, title={_short.repr(self.title)}, status={self.status})>"
     
     @property
     def remaining_capacity(self) -> int:
@@ -111,30 +214,7 @@ class Event(Base):
         Returns:
             dict: Event data as dictionary
         """
-        event_dict = {
-            "id": self.id,
-            "title": self.title,
-            "description": self.description,
-            "categoryId": self.category_id,
-            "organizerId": self.organizer_id,
-            "date": self.date.isoformat() if self.date else None,
-            "startTime": self.start_time.strftime("%H:%M") if self.start_time else None,
-            "endTime": self.end_time.strftime("%H:%M") if self.end_time else None,
-            "venue": self.venue,
-            "location": self.location,
-            "capacity": self.capacity,
-            "registeredCount": self.registered_count,
-            "waitlistCount": self.waitlist_count,
-            "remainingCapacity": self.remaining_capacity,
-            "status": self.status.value,
-            "imageUrl": self.image_url,
-            "tags": self.tags if self.tags else [],
-            "isFeatured": self.is_featured,
-            "createdAt": self.created_at.isoformat() if self.created_at else None,
-            "updatedAt": self.updated_at.isoformat() if self.updated_at else None,
-            "publishedAt": self.published_at.isoformat() if self.published_at else None,
-            "cancelledAt": self.cancelled_at.isoformat() if self.cancelled_at else None,
-        }
+        event_dict = {key: getter(self) for key, getter in _EVENT_FIELDS}
         
         if include_category and self.category:
             event_dict["category"] = {
@@ -154,3 +234,19 @@ class Event(Base):
         
         return event_dict
 
+
+# Listing indexes matching get_all_published's filter + ORDER BY (including
+# the id tie-breaker used for keyset cursors), so the planner can walk them
+# in order and stop at LIMIT instead of sorting. Partial on published rows,
+# the only ones listings read.
+_published = Event.status == EventStatus.PUBLISHED
+for _name, *_columns in (
+    ("ix_events_published_date", Event.date, Event.start_time, Event.id),
+    ("ix_events_published_title", Event.title, Event.id),
+    ("ix_events_published_popularity", Event.registered_count.desc(), Event.id),
+    ("ix_events_published_category_date", Event.category_id, Event.date, Event.start_time, Event.id),
+):
+    Index(_name, *_columns, postgresql_where=_published, sqlite_where=_published)
+
+# Serves get_by_organizer (newest first) and per-organizer statistics
+Index("ix_events_organizer_date", Event.organizer_id, Event.date.desc())
@@ -2,11 +2,13 @@
 Organizer Approval Request database model.
 Represents requests from users to become organizers.
 """
-from sqlalchemy import Column, String, DateTime, Enum as SQLEnum, ForeignKey, Text
+from sqlalchemy import Column, DateTime, Enum as SQLEnum, ForeignKey, Index, Text
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 import enum
+import sys
 from app.core.database import Base
+from app.core.types import GUID, new_id
 
 
 class ApprovalStatus(str, enum.Enum):
@@ -16,6 +18,10 @@ class ApprovalStatus(str, enum.Enum):
     REJECTED = "rejected"
 
 
+# Enum -> wire value lookup, built once at import for to_dict()
+_STATUS_VALUE = {m: sys.intern(m.value) for m in ApprovalStatus}
+
+
 class OrganizerApprovalRequest(Base):
     """
     Organizer Approval Request model.
@@ -24,10 +30,10 @@ class OrganizerApprovalRequest(Base):
     __tablename__ = "organizer_approval_requests"
     
     # Primary Key
-    id = Column(String(36), primary_key=True, index=True)
+    id = Column(GUID, primary_key=True, default=new_id)
     
     # Foreign Key
-    user_id = Column(String(36), ForeignKey("users.id"), nullable=False, index=True)
+    user_id = Column(GUID, ForeignKey("users.id"), nullable=False, index=True)
     
     # Request Information
     reason = Column(
@@ -38,7 +44,7 @@ class OrganizerApprovalRequest(Base):
     
     # Status
     status = Column(
-        SQLEnum(ApprovalStatus),
+        SQLEnum(ApprovalStatus, native_enum=True, name="approvalstatus"),
         nullable=False,
         default=ApprovalStatus.PENDING,
         index=True
@@ -46,7 +52,7 @@ class OrganizerApprovalRequest(Base):
     
     # Review Information
     reviewed_by = Column(
-        String(36),
+        GUID,
         ForeignKey("users.id"),
         nullable=True,
         comment="Admin user ID who reviewed the request"
@@ -83,7 +89,7 @@ class OrganizerApprovalRequest(Base):
             "id": self.id,
             "userId": self.user_id,
             "reason": self.reason,
-            "status": self.status.value,
+            "status": _STATUS_VALUE[self.status],
             "reviewedBy": self.reviewed_by,
             "notes": self.notes,
             "requestedAt": self.requested_at.isoformat() if self.requested_at else None,
@@ -104,3 +110,12 @@ class OrganizerApprovalRequest(Base):
         
         return request_dict
 
+
+# Pending requests are a small, hot slice of the table: the admin queue
+# (ordered by requested_at) and its counts read only these rows
+Index(
+    "ix_organizer_approval_requests_pending",
+    OrganizerApprovalRequest.requested_at,
+    postgresql_where=OrganizerApprovalRequest.status == ApprovalStatus.PENDING,
+    sqlite_where=OrganizerApprovalRequest.status == ApprovalStatus.PENDING
+)
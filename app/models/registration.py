@@ -2,11 +2,16 @@
 Registration database model.
 Represents event registrations by students, including guest information.
 """
-from sqlalchemy import Column, String, Boolean, DateTime, Enum as SQLEnum, JSON, ForeignKey, Text
+from sqlalchemy import Column, String, Boolean, DateTime, Enum as SQLEnum, JSON, ForeignKey, Index, Text
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.sql import func
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, deferred
+from operator import attrgetter
 import enum
+import sys
 from app.core.database import Base
+from app.core.types import GUID, new_id
+from app.utils.serialization import iso_getter, enum_getter, list_getter
 
 
 class CheckInStatus(str, enum.Enum):
@@ -21,6 +26,28 @@ class RegistrationStatus(str, enum.Enum):
     CANCELLED = "cancelled"
 
 
+# Enum -> wire value lookups, built once at import for to_dict()
+_STATUS_VALUE = {m: sys.intern(m.value) for m in RegistrationStatus}
+_CHECK_IN_VALUE = {m: sys.intern(m.value) for m in CheckInStatus}
+
+# (output key, getter) pairs for Registration.to_dict(), in response field order
+_REGISTRATION_FIELDS = (
+    ("id", attrgetter("id")),
+    ("userId", attrgetter("user_id")),
+    ("eventId", attrgetter("event_id")),
+    ("status", enum_getter("status", _STATUS_VALUE)),
+    ("ticketCode", attrgetter("ticket_code")),
+    ("qrCode", attrgetter("qr_code")),
+    ("registeredAt", iso_getter("registered_at")),
+    ("checkInStatus", enum_getter("check_in_status", _CHECK_IN_VALUE)),
+    ("checkedInAt", iso_getter("checked_in_at")),
+    ("guests", list_getter("guests")),
+    ("sessions", list_getter("sessions")),
+    ("reminderSent", attrgetter("reminder_sent")),
+    ("cancelledAt", iso_getter("cancelled_at")),
+)
+
+
 class Registration(Base):
     """
     Registration model representing user registrations for events.
@@ -29,15 +56,15 @@ class Registration(Base):
     __tablename__ = "registrations"
     
     # Primary Key
-    id = Column(String(36), primary_key=True, index=True)
+    id = Column(GUID, primary_key=True, default=new_id)
     
     # Foreign Keys
-    user_id = Column(String(36), ForeignKey("users.id"), nullable=False, index=True)
-    event_id = Column(String(36), ForeignKey("events.id"), nullable=False, index=True)
+    user_id = Column(GUID, ForeignKey("users.id"), nullable=False, index=True)
+    event_id = Column(GUID, ForeignKey("events.id"), nullable=False, index=True)
     
     # Status
     status = Column(
-        SQLEnum(RegistrationStatus),
+        SQLEnum(RegistrationStatus, native_enum=True, name="registrationstatus"),
         nullable=False,
         default=RegistrationStatus.CONFIRMED,
         index=True
@@ -51,7 +78,9 @@ class Registration(Base):
         index=True,
         comment="Format: TKT-{timestamp}-{eventId}"
     )
-    qr_code = Column(Text, nullable=True, comment="Base64 encoded QR code or URL")
+    # Base64 PNG data URIs run to several KB per row; deferred so list and
+    # lookup queries skip it unless the caller undefers it (ticket views)
+    qr_code = deferred(Column(Text, nullable=True, comment="Base64 encoded QR code or URL"))
     
     # Check-in Management
     check_in_status = Column(
@@ -64,7 +93,7 @@ class Registration(Base):
     # Guest Information - stored as JSON array
     # Each guest: {"name": "string", "email": "string"}
     guests = Column(
-        JSON,
+        JSON().with_variant(JSONB(), "postgresql"),
         nullable=True,
         comment="Array of guest objects with name and email"
     )
@@ -113,21 +142,7 @@ class Registration(Base):
         Returns:
             dict: Registration data as dictionary
         """
-        reg_dict = {
-            "id": self.id,
-            "userId": self.user_id,
-            "eventId": self.event_id,
-            "status": self.status.value,
-            "ticketCode": self.ticket_code,
-            "qrCode": self.qr_code,
-            "registeredAt": self.registered_at.isoformat() if self.registered_at else None,
-            "checkInStatus": self.check_in_status.value,
-            "checkedInAt": self.checked_in_at.isoformat() if self.checked_in_at else None,
-            "guests": self.guests if self.guests else [],
-            "sessions": self.sessions if self.sessions else [],
-            "reminderSent": self.reminder_sent,
-            "cancelledAt": self.cancelled_at.isoformat() if self.cancelled_at else None,
-        }
+        reg_dict = {key: getter(self) for key, getter in _REGISTRATION_FIELDS}
         
         if include_event and self.event:
             reg_dict["event"] = {
@@ -150,3 +165,25 @@ class Registration(Base):
         
         return reg_dict
 
+
+# One confirmed registration per user and event; also the conflict target
+# for RegistrationRepository.create_if_absent
+_confirmed = Registration.status == RegistrationStatus.CONFIRMED
+Index(
+    "uq_registrations_user_event_confirmed",
+    Registration.user_id,
+    Registration.event_id,
+    unique=True,
+    postgresql_where=_confirmed,
+    sqlite_where=_confirmed
+)
+
+# Reminder job: confirmed registrations still owed a reminder, by event.
+# Partial, so it only holds the rows the job has yet to process.
+_needs_reminder = (Registration.status == RegistrationStatus.CONFIRMED) & (Registration.reminder_sent == False)
+Index(
+    "ix_registrations_pending_reminder",
+    Registration.event_id,
+    postgresql_where=_needs_reminder,
+    sqlite_where=_needs_reminder
+)
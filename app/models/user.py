@@ -3,10 +3,14 @@ User database model.
 Represents users with different roles: student, organizer, admin.
 """
 from sqlalchemy import Column, String, Boolean, DateTime, Enum as SQLEnum
+from sqlalchemy.dialects.postgresql import CITEXT
 from sqlalchemy.sql import func
 from datetime import datetime
 import enum
+import sys
 from app.core.database import Base
+from app.core.types import GUID, new_id
+from app.utils.serialization import iso, loaded_state
 
 
 class UserRole(str, enum.Enum):
@@ -16,6 +20,16 @@ class UserRole(str, enum.Enum):
     ADMIN = "admin"
 
 
+# Enum -> wire value lookup, built once at import for to_dict()
+_ROLE_VALUE = {m: sys.intern(m.value) for m in UserRole}
+
+# Columns read by User.to_dict()
+_TO_DICT_KEYS = frozenset((
+    "id", "email", "name", "role", "is_approved", "is_active", "phone", "department",
+    "profile_picture", "graduation_year", "bio", "created_at", "updated_at", "last_login",
+))
+
+
 class User(Base):
     """
     User model representing all users in the system.
@@ -24,10 +38,19 @@ class User(Base):
     __tablename__ = "users"
     
     # Primary Key
-    id = Column(String(36), primary_key=True, index=True)
+    id = Column(GUID, primary_key=True, default=new_id)
     
     # Authentication
-    email = Column(String(255), unique=True, nullable=False, index=True)
+    # Case-insensitive in the database (CITEXT / NOCASE), so lookups match
+    # any casing and still use the unique index
+    email = Column(
+        String(255)
+        .with_variant(CITEXT(), "postgresql")
+        .with_variant(String(255, collation="NOCASE"), "sqlite"),
+        unique=True,
+        nullable=False,
+        index=True
+    )
     password = Column(String(255), nullable=False)  # Hashed password
     
     # Profile Information
@@ -70,6 +93,24 @@ class User(Base):
     )
     last_login = Column(DateTime(timezone=True), nullable=True)
     
+    # Field schema for app.core.fastjson.dumps_rows (same shape as to_dict)
+    JSON_SCHEMA = (
+        ("id", "id", None),
+        ("email", "email", None),
+        ("name", "name", None),
+        ("role", "role", None),
+        ("isApproved", "is_approved", None),
+        ("isActive", "is_active", None),
+        ("phone", "phone", None),
+        ("department", "department", None),
+        ("profilePicture", "profile_picture", None),
+        ("graduationYear", "graduation_year", None),
+        ("bio", "bio", None),
+        ("createdAt", "created_at", None),
+        ("updatedAt", "updated_at", None),
+        ("lastLogin", "last_login", None),
+    )
+    
     def __repr__(self) -> str:
         return f"<User(id={self.id}, email={self.email}, role={self.role})>"
     
@@ -83,21 +124,22 @@ class User(Base):
         Returns:
             dict: User data as dictionary
         """
+        s = loaded_state(self, _TO_DICT_KEYS)
         user_dict = {
-            "id": self.id,
-            "email": self.email,
-            "name": self.name,
-            "role": self.role.value,
-            "isApproved": self.is_approved,
-            "isActive": self.is_active,
-            "phone": self.phone,
-            "department": self.department,
-            "profilePicture": self.profile_picture,
-            "graduationYear": self.graduation_year,
-            "bio": self.bio,
-            "createdAt": self.created_at.isoformat() if self.created_at else None,
-            "updatedAt": self.updated_at.isoformat() if self.updated_at else None,
-            "lastLogin": self.last_login.isoformat() if self.last_login else None,
+            "id": s.get("id"),
+            "email": s.get("email"),
+            "name": s.get("name"),
+            "role": _ROLE_VALUE[s.get("role")],
+            "isApproved": s.get("is_approved"),
+            "isActive": s.get("is_active"),
+            "phone": s.get("phone"),
+            "department": s.get("department"),
+            "profilePicture": s.get("profile_picture"),
+            "graduationYear": s.get("graduation_year"),
+            "bio": s.get("bio"),
+            "createdAt": iso(s.get("created_at")),
+            "updatedAt": iso(s.get("updated_at")),
+            "lastLogin": iso(s.get("last_login")),
         }
         
         if include_password:
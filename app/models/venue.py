@@ -5,6 +5,14 @@ Represents physical venues/locations where events are held.
 from sqlalchemy import Column, String, Boolean, DateTime, Integer, JSON
 from sqlalchemy.sql import func
 from app.core.database import Base
+from app.core.types import GUID, new_id
+from app.utils.serialization import iso, loaded_state
+from app.core.fastjson import or_list
+
+# Columns read by Venue.to_dict()
+_TO_DICT_KEYS = frozenset((
+    "id", "name", "building", "capacity", "facilities", "is_active", "created_at", "updated_at",
+))
 
 
 class Venue(Base):
@@ -15,7 +23,7 @@ class Venue(Base):
     __tablename__ = "venues"
     
     # Primary Key
-    id = Column(String(36), primary_key=True, index=True)
+    id = Column(GUID, primary_key=True, default=new_id)
     
     # Venue Information
     name = Column(String(200), nullable=False)
@@ -29,8 +37,9 @@ class Venue(Base):
         comment="Array of available facilities (e.g., ['Projector', 'WiFi', 'Microphone'])"
     )
     
-    # Status
-    is_active = Column(Boolean, nullable=False, default=True, index=True)
+    # Status (not indexed: nearly every venue is active, so the planner
+    # would never choose an index on it)
+    is_active = Column(Boolean, nullable=False, default=True)
     
     # Timestamps
     created_at = Column(
@@ -45,6 +54,18 @@ class Venue(Base):
         onupdate=func.now()
     )
     
+    # Field schema for app.core.fastjson.dumps_rows (same shape as to_dict)
+    JSON_SCHEMA = (
+        ("id", "id", None),
+        ("name", "name", None),
+        ("building", "building", None),
+        ("capacity", "capacity", None),
+        ("facilities", "facilities", or_list),
+        ("isActive", "is_active", None),
+        ("createdAt", "created_at", None),
+        ("updatedAt", "updated_at", None),
+    )
+    
     def __repr__(self) -> str:
         return f"<Venue(id={self.id}, name={self.name}, building={self.building})>"
     
@@ -55,14 +76,15 @@ class Venue(Base):
         Returns:
             dict: Venue data as dictionary
         """
+        s = loaded_state(self, _TO_DICT_KEYS)
         return {
-            "id": self.id,
-            "name": self.name,
-            "building": self.building,
-            "capacity": self.capacity,
-            "facilities": self.facilities if self.facilities else [],
-            "isActive": self.is_active,
-            "createdAt": self.created_at.isoformat() if self.created_at else None,
-            "updatedAt": self.updated_at.isoformat() if self.updated_at else None,
+            "id": s.get("id"),
+            "name": s.get("name"),
+            "building": s.get("building"),
+            "capacity": s.get("capacity"),
+            "facilities": s.get("facilities") or [],
+            "isActive": s.get("is_active"),
+            "createdAt": iso(s.get("created_at")),
+            "updatedAt": iso(s.get("updated_at")),
         }
 
@@ -2,11 +2,15 @@
 Waitlist database model.
 Represents waitlist entries for events that are at capacity.
 """
-from sqlalchemy import Column, String, DateTime, Integer, Enum as SQLEnum, ForeignKey
+from sqlalchemy import Column, Date, DateTime, Integer, String, Enum as SQLEnum, ForeignKey, Index, UniqueConstraint, select
 from sqlalchemy.sql import func
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, column_property
+from typing import Optional
 import enum
+import sys
 from app.core.database import Base
+from app.core.types import GUID, new_id
+from app.utils.serialization import iso, loaded_state
 
 
 class NotificationPreference(str, enum.Enum):
@@ -16,26 +20,44 @@ class NotificationPreference(str, enum.Enum):
     BOTH = "both"
 
 
+# Enum -> wire value lookup, built once at import for to_dict()
+_PREFERENCE_VALUE = {m: sys.intern(m.value) for m in NotificationPreference}
+
+# Columns read by WaitlistEntry.to_dict()
+_TO_DICT_KEYS = frozenset(("id", "user_id", "event_id", "joined_at", "notification_preference"))
+
+
 class WaitlistEntry(Base):
     """
     Waitlist Entry model for managing event waitlists.
     Uses FIFO (First In, First Out) ordering based on position.
+    
+    `position` is a join sequence number that is never renumbered, so
+    removals leave gaps; `queue_position` is the 1-based place in line.
     """
     __tablename__ = "waitlist"
+    __table_args__ = (
+        # FIFO order within an event: next-in-line, the front-of-line drain
+        # and the place-in-line count are all range scans on this prefix
+        Index("ix_waitlist_event_position", "event_id", "position"),
+        # One entry per user per event; also serves user lookups
+        # (get_user_waitlist_entries, get_by_user_and_event)
+        UniqueConstraint("user_id", "event_id", name="uq_waitlist_user_event"),
+    )
     
     # Primary Key
-    id = Column(String(36), primary_key=True, index=True)
+    id = Column(GUID, primary_key=True, default=new_id)
     
-    # Foreign Keys
-    user_id = Column(String(36), ForeignKey("users.id"), nullable=False, index=True)
-    event_id = Column(String(36), ForeignKey("events.id"), nullable=False, index=True)
+    # Foreign Keys (indexed as leading columns of uq_waitlist_user_event and
+    # ix_waitlist_event_position)
+    user_id = Column(GUID, ForeignKey("users.id"), nullable=False)
+    event_id = Column(GUID, ForeignKey("events.id"), nullable=False)
     
     # Position in Waitlist
     position = Column(
         Integer,
         nullable=False,
-        index=True,
-        comment="Position in waitlist (lower number = higher priority)"
+        comment="Join sequence in waitlist (lower number = higher priority, gaps allowed)"
     )
     
     # Notification Preference
@@ -45,6 +67,12 @@ class WaitlistEntry(Base):
         default=NotificationPreference.EMAIL
     )
     
+    # Event preview, copied at join time so waitlist listings need no join
+    # (kept in sync by WaitlistRepository.sync_event_preview)
+    event_title = Column(String(200), nullable=True)  # Same length as Event.title
+    event_date = Column(Date, nullable=True)
+    event_capacity = Column(Integer, nullable=True)
+    
     # Timestamps
     joined_at = Column(
         DateTime(timezone=True),
@@ -56,37 +84,49 @@ class WaitlistEntry(Base):
     user = relationship("User", backref="waitlist_entries")
     event = relationship("Event", back_populates="waitlist")
     
+    # Field schema for app.core.fastjson.dumps_rows (same shape as to_dict)
+    JSON_SCHEMA = (
+        ("id", "id", None),
+        ("userId", "user_id", None),
+        ("eventId", "event_id", None),
+        ("position", "queue_position", None),
+        ("joinedAt", "joined_at", None),
+        ("notificationPreference", "notification_preference", None),
+    )
+    
     def __repr__(self) -> str:
         return f"<WaitlistEntry(id={self.id}, user_id={self.user_id}, event_id={self.event_id}, position={self.position})>"
     
-    def to_dict(self, include_event: bool = False, include_user: bool = False) -> dict:
+    def to_dict(
+        self,
+        include_event: bool = False,
+        include_user: bool = False,
+        registered_count: Optional[int] = None
+    ) -> dict:
         """
         Convert waitlist entry to dictionary.
         
         Args:
             include_event: Whether to include event details
             include_user: Whether to include user details
+            registered_count: Event's live registered count, if already
+                fetched; otherwise it is read from the event relationship
             
         Returns:
             dict: Waitlist entry data as dictionary
         """
+        s = loaded_state(self, _TO_DICT_KEYS)
         waitlist_dict = {
-            "id": self.id,
-            "userId": self.user_id,
-            "eventId": self.event_id,
-            "position": self.position,
-            "joinedAt": self.joined_at.isoformat() if self.joined_at else None,
-            "notificationPreference": self.notification_preference.value,
+            "id": s.get("id"),
+            "userId": s.get("user_id"),
+            "eventId": s.get("event_id"),
+            "position": self.queue_position,  # deferred; loaded here if not undeferred
+            "joinedAt": iso(s.get("joined_at")),
+            "notificationPreference": _PREFERENCE_VALUE[s.get("notification_preference")],
         }
         
-        if include_event and self.event:
-            waitlist_dict["event"] = {
-                "id": self.event.id,
-                "title": self.event.title,
-                "date": self.event.date.isoformat() if self.event.date else None,
-                "capacity": self.event.capacity,
-                "registeredCount": self.event.registered_count
-            }
+        if include_event:
+            waitlist_dict["event"] = self.event_preview(registered_count)
         
         if include_user and self.user:
             waitlist_dict["user"] = {
@@ -96,4 +136,55 @@ class WaitlistEntry(Base):
             }
         
         return waitlist_dict
+    
+    def event_preview(self, registered_count: Optional[int] = None) -> Optional[dict]:
+        """
+        Build the event summary shown alongside a waitlist entry.
+        
+        Uses the copied preview columns; entries created before they existed
+        fall back to the event relationship.
+        
+        Args:
+            registered_count: Event's live registered count, if already fetched
+            
+        Returns:
+            Optional[dict]: Event id, title, date, capacity and registeredCount
+        """
+        if self.event_title is None:
+            event = self.event
+            if not event:
+                return None
+            return {
+                "id": event.id,
+                "title": event.title,
+                "date": event.date.isoformat() if event.date else None,
+                "capacity": event.capacity,
+                "registeredCount": event.registered_count
+            }
+        
+        if registered_count is None:
+            registered_count = self.event.registered_count
+        return {
+            "id": self.event_id,
+            "title": self.event_title,
+            "date": iso(self.event_date),
+            "capacity": self.event_capacity,
+            "registeredCount": registered_count
+        }
 
+
+# Place in line = entries for the same event with an equal or lower sequence.
+# Computed on read so removals never have to renumber the rows behind them;
+# the count walks ix_waitlist_event_position from the event's first entry.
+# Deferred: queries that show it undefer it, and whole-line listings number
+# rows from their order instead of running one count per row.
+_ahead = WaitlistEntry.__table__.alias("ahead")
+WaitlistEntry.queue_position = column_property(
+    select(func.count())
+    .where(
+        _ahead.c.event_id == WaitlistEntry.event_id,
+        _ahead.c.position <= WaitlistEntry.position
+    )
+    .scalar_subquery(),
+    deferred=True
+)
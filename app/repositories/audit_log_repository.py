@@ -4,10 +4,166 @@ Handles all database interactions for AuditLog model.
 This is an append-only repository - no updates or deletes allowed.
 """
 from typing import Optional, List, Tuple
+from sqlalchemy import and_, or_, select, bindparam, func, Row, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
-from datetime import datetime, date
+from datetime import datetime, date, timezone
 from app.models.audit_log import AuditLog, AuditAction, TargetType
-import uuid
+from app.utils.cache import TTLCache
+from app.core.types import new_id
+import base64
+import json
+
+# Filtered totals are expensive on a large table; reuse them briefly across pages
+_total_count_cache = TTLCache(ttl=30, maxsize=128)
+
+# Constant statements so hot lookups reuse SQLAlchemy's compiled-SQL cache entry
+_GET_BY_ID = select(AuditLog).where(AuditLog.id == bindparam("log_id"))
+_GET_BY_ACTOR = (
+    select(AuditLog)
+    .where(AuditLog.actor_id == bindparam("actor_id"))
+    .order_by(AuditLog.timestamp.desc())
+    .limit(bindparam("limit"))
+)
+_GET_BY_TARGET = (
+    select(AuditLog)
+    .where(AuditLog.target_type == bindparam("target_type"), AuditLog.target_id == bindparam("target_id"))
+    .order_by(AuditLog.timestamp.desc())
+    .limit(bindparam("limit"))
+)
+# Projects only the columns held by ix_audit_logs_recent_covering
+_GET_RECENT = (
+    select(
+        AuditLog.id,
+        AuditLog.timestamp,
+        AuditLog.action,
+        AuditLog.actor_id,
+        AuditLog.actor_name,
+        AuditLog.target_type,
+        AuditLog.target_id,
+        AuditLog.target_name,
+    )
+    .order_by(AuditLog.timestamp.desc())
+    .limit(bindparam("limit"))
+)
+
+
+class AuditLogNotPartitionedError(RuntimeError):
+    """audit_logs exists but was created before it was range-partitioned."""
+
+
+# Serializes partition maintenance across workers (pg_advisory_xact_lock key)
+_PARTITION_LOCK_KEY = 0x61756469
+
+
+def create_audit_log_partitions(bind: Engine, months_ahead: int = 2) -> List[str]:
+    """
+    Create monthly audit_logs partitions from the current month onwards.
+    
+    Safe to run repeatedly and from several workers at once; main.py runs it
+    at startup and then on AUDIT_LOG_PARTITION_CHECK_SECONDS. Each month is
+    created in its own transaction, so one failure does not undo the others.
+    Rows already written to audit_logs_default for a month (because its
+    partition was missing) are moved into the new partition before it is
+    attached. Old data is retired by dropping whole partitions, e.g.
+    DROP TABLE audit_logs_2024_01. No-op on databases other than PostgreSQL.
+    
+    Args:
+        bind: Engine to run the DDL on
+        months_ahead: Number of future months to create besides the current one
+        
+    Returns:
+        List[str]: Names of the partitions ensured
+        
+    Raises:
+        AuditLogNotPartitionedError: audit_logs is a plain table; see
+            MIGRATION_GUIDE.md for converting it
+        RuntimeError: Some months could not be created (the rest were)
+    """
+    if bind.dialect.name != "postgresql":
+        return []
+    
+    with bind.connect() as conn:
+        partitioned = conn.execute(text(
+            "SELECT 1 FROM pg_partitioned_table WHERE partrelid = to_regclass('audit_logs')"
+        )).first()
+    if partitioned is None:
+        raise AuditLogNotPartitionedError(
+            "audit_logs is not partitioned; convert it as described in MIGRATION_GUIDE.md"
+        )
+    
+    today = date.today()
+    year, month = today.year, today.month
+    names, failed = [], []
+    for _ in range(months_ahead + 1):
+        start = date(year, month, 1)
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+        end = date(year, month, 1)
+        name = f"audit_logs_{start:%Y_%m}"
+        try:
+            _create_audit_log_partition(bind, name, start, end)
+            names.append(name)
+        except SQLAlchemyError as e:
+            failed.append(f"{name}: {e}")
+    if failed:
+        raise RuntimeError("Failed to create audit log partitions: " + "; ".join(failed))
+    return names
+
+
+def _create_audit_log_partition(bind: Engine, name: str, start: date, end: date) -> None:
+    """Create and attach one monthly partition, moving its rows out of the default partition."""
+    bounds = {"start": start, "end": end}
+    with bind.begin() as conn:
+        conn.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": _PARTITION_LOCK_KEY})
+        if conn.execute(text("SELECT to_regclass(:name)"), {"name": name}).scalar() is not None:
+            return
+        # ATTACH fails while the default partition holds rows in the range,
+        # so build the partition standalone and move those rows into it first
+        conn.execute(text(
+            f"CREATE TABLE {name} (LIKE audit_logs INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"
+        ))
+        conn.execute(text(
+            f"WITH moved AS ("
+            f"DELETE FROM audit_logs_default "
+            f"WHERE \"timestamp\" >= :start AND \"timestamp\" < :end RETURNING *"
+            f") INSERT INTO {name} SELECT * FROM moved"
+        ), bounds)
+        conn.execute(text(
+            f"ALTER TABLE audit_logs ATTACH PARTITION {name} "
+            f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+        ))
+
+
+def encode_cursor(log: AuditLog) -> str:
+    """
+    Encode the position of a log entry as an opaque pagination cursor.
+
+    Args:
+        log: Last log entry of the current page
+
+    Returns:
+        str: URL-safe cursor string
+    """
+    payload = json.dumps({"ts": log.timestamp.isoformat(), "id": log.id})
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> Optional[Tuple[datetime, str]]:
+    """
+    Decode a cursor produced by encode_cursor.
+
+    Args:
+        cursor: Opaque cursor string
+
+    Returns:
+        Optional[Tuple[datetime, str]]: (timestamp, id) or None if malformed
+    """
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return datetime.fromisoformat(payload["ts"]), str(payload["id"])
+    except (ValueError, KeyError, TypeError):
+        return None
 
 
 class AuditLogRepository:
@@ -32,7 +188,7 @@ class AuditLogRepository:
         Returns:
             Optional[AuditLog]: Log entry if found, None otherwise
         """
-        return self.db.query(AuditLog).filter(AuditLog.id == log_id).first()
+        return self.db.execute(_GET_BY_ID, {"log_id": log_id}).scalar_one_or_none()
     
     def get_all(
         self,
@@ -44,10 +200,16 @@ class AuditLogRepository:
         target_id: Optional[str] = None,
         search: Optional[str] = None,
         page: int = 1,
-        limit: int = 50
-    ) -> Tuple[List[AuditLog], int]:
+        limit: int = 50,
+        cursor: Optional[str] = None,
+        include_total: bool = True
+    ) -> Tuple[List[AuditLog], Optional[int]]:
         """
         Get paginated list of audit logs with filters.
+
+        When a cursor is given, rows strictly older than the cursor position are
+        returned (keyset pagination) and page is ignored; otherwise page/limit
+        offset pagination is used.
         
         Args:
             action: Filter by action type
@@ -59,9 +221,12 @@ class AuditLogRepository:
             search: Search in details
             page: Page number (1-indexed)
             limit: Items per page
+            cursor: Cursor from encode_cursor() of the previous page's last row
+            include_total: Whether to compute the total count (cached ~30s)
             
         Returns:
-            Tuple[List[AuditLog], int]: List of logs and total count
+            Tuple[List[AuditLog], Optional[int]]: List of logs and total count
+            (None when include_total is False)
         """
         query = self.db.query(AuditLog)
         
@@ -85,15 +250,31 @@ class AuditLogRepository:
             query = query.filter(AuditLog.target_id == target_id)
         
         if search:
+            # Served by the pg_trgm GIN index on details under PostgreSQL
             search_pattern = f"%{search}%"
             query = query.filter(AuditLog.details.ilike(search_pattern))
         
         # Get total count before pagination
-        total_count = query.count()
+        total_count = None
+        if include_total:
+            cache_key = (action, start_date, end_date, actor_id, target_type, target_id, search)
+            total_count = _total_count_cache.get(cache_key)
+            if total_count is None:
+                total_count = query.count()
+                _total_count_cache.set(cache_key, total_count)
         
         # Apply sorting and pagination
-        offset = (page - 1) * limit
-        logs = query.order_by(AuditLog.timestamp.desc()).offset(offset).limit(limit).all()
+        query = query.order_by(AuditLog.timestamp.desc(), AuditLog.id.desc())
+        position = decode_cursor(cursor) if cursor else None
+        if position:
+            cursor_ts, cursor_id = position
+            query = query.filter(or_(
+                AuditLog.timestamp < cursor_ts,
+                and_(AuditLog.timestamp == cursor_ts, AuditLog.id < cursor_id)
+            ))
+        else:
+            query = query.offset((page - 1) * limit)
+        logs = query.limit(limit).all()
         
         return logs, total_count
     
@@ -112,7 +293,12 @@ class AuditLogRepository:
         user_agent: Optional[str] = None
     ) -> AuditLog:
         """
-        Create a new audit log entry.
+        Add a new audit log entry to the caller's unit of work.
+        
+        The row is not committed here: it is inserted by the caller's next
+        commit together with the change it records (several entries flush
+        as one batched INSERT), and is discarded if that transaction rolls
+        back.
         
         Args:
             action: Action that was performed
@@ -128,30 +314,46 @@ class AuditLogRepository:
             user_agent: User agent of request
             
         Returns:
-            AuditLog: Created log entry
-        """
-        log_id = str(uuid.uuid4())
-        
-        log = AuditLog(
-            id=log_id,
-            action=action,
-            actor_id=actor_id,
-            actor_name=actor_name,
-            actor_role=actor_role,
-            target_type=target_type,
-            target_id=target_id,
-            target_name=target_name,
-            details=details,
-            extra_metadata=metadata,
-            ip_address=ip_address,
-            user_agent=user_agent
-        )
-        
+            AuditLog: Pending log entry
+        """
+        log = AuditLog(**self._build_row(
+            action, actor_id, actor_name, actor_role, target_type, target_id,
+            target_name, details, metadata, ip_address, user_agent
+        ))
         self.db.add(log)
-        self.db.commit()
-        self.db.refresh(log)
         return log
     
+    @staticmethod
+    def _build_row(
+        action: AuditAction,
+        actor_id: Optional[str],
+        actor_name: Optional[str],
+        actor_role: Optional[str],
+        target_type: Optional[TargetType],
+        target_id: Optional[str],
+        target_name: Optional[str],
+        details: Optional[str],
+        metadata: Optional[dict],
+        ip_address: Optional[str],
+        user_agent: Optional[str]
+    ) -> dict:
+        """Build the audit_logs column values for a new entry."""
+        return {
+            "id": new_id(),
+            "timestamp": datetime.now(timezone.utc),
+            "action": action,
+            "actor_id": actor_id,
+            "actor_name": actor_name,
+            "actor_role": actor_role,
+            "target_type": target_type,
+            "target_id": target_id,
+            "target_name": target_name,
+            "details": details,
+            "extra_metadata": metadata,
+            "ip_address": ip_address,
+            "user_agent": user_agent,
+        }
+    
     def get_by_actor(
         self,
         actor_id: str,
@@ -167,9 +369,7 @@ class AuditLogRepository:
         Returns:
             List[AuditLog]: List of log entries
         """
-        return self.db.query(AuditLog).filter(
-            AuditLog.actor_id == actor_id
-        ).order_by(AuditLog.timestamp.desc()).limit(limit).all()
+        return list(self.db.execute(_GET_BY_ACTOR, {"actor_id": actor_id, "limit": limit}).scalars())
     
     def get_by_target(
         self,
@@ -188,24 +388,24 @@ class AuditLogRepository:
         Returns:
             List[AuditLog]: List of log entries
         """
-        return self.db.query(AuditLog).filter(
-            AuditLog.target_type == target_type,
-            AuditLog.target_id == target_id
-        ).order_by(AuditLog.timestamp.desc()).limit(limit).all()
+        return list(self.db.execute(
+            _GET_BY_TARGET, {"target_type": target_type, "target_id": target_id, "limit": limit}
+        ).scalars())
     
-    def get_recent(self, limit: int = 100) -> List[AuditLog]:
+    def get_recent(self, limit: int = 100) -> List[Row]:
         """
-        Get most recent audit logs.
+        Get a summary of the most recent audit logs.
+        
+        Returns lightweight rows (id, timestamp, action, actor_id, actor_name,
+        target_type, target_id, target_name) rather than ORM instances.
         
         Args:
             limit: Maximum number of logs to return
             
         Returns:
-            List[AuditLog]: List of recent log entries
+            List[Row]: Named-tuple rows of recent log entries
         """
-        return self.db.query(AuditLog).order_by(
-            AuditLog.timestamp.desc()
-        ).limit(limit).all()
+        return list(self.db.execute(_GET_RECENT, {"limit": limit}))
 
 
 
@@ -235,3 +435,38 @@ class AuditLogRepository:
             query = query.filter(AuditLog.timestamp >= since)
 
         return query.count()
+
+    def has_reached_threshold(
+        self,
+        action: AuditAction,
+        actor_id: str,
+        since: datetime,
+        threshold: int
+    ) -> bool:
+        """
+        Check whether an actor has performed an action at least N times since a time.
+
+        Counts at most `threshold` rows (LIMIT inside the subquery), so the
+        index range scan stops early instead of counting every match.
+
+        Args:
+            action: The audit action to count
+            actor_id: The actor ID
+            since: Datetime to count from
+            threshold: Number of actions that reaches the limit
+
+        Returns:
+            bool: True if the actor has at least `threshold` matching logs
+        """
+        bounded = (
+            select(AuditLog.id)
+            .where(
+                AuditLog.actor_id == actor_id,
+                AuditLog.action == action,
+                AuditLog.timestamp >= since
+            )
+            .limit(threshold)
+            .subquery()
+        )
+        count = self.db.execute(select(func.count()).select_from(bounded)).scalar_one()
+        return count >= threshold
@@ -3,10 +3,34 @@ Category repository for database operations.
 Handles all database interactions for Category model.
 """
 from typing import Optional, List
-from sqlalchemy.orm import Session
+from datetime import datetime, timezone
+from sqlalchemy import select, bindparam, update
+from sqlalchemy.orm import Session, make_transient_to_detached
+from sqlalchemy.orm.attributes import set_committed_value
 from sqlalchemy.exc import IntegrityError
 from app.models.category import Category
-import uuid
+from app.models.event import Event
+from app.utils.cache import TTLCache
+from app.core.types import new_id
+
+# Constant statements so hot lookups reuse SQLAlchemy's compiled-SQL cache entry
+_GET_BY_ID = select(Category).where(Category.id == bindparam("category_id"))
+_GET_BY_SLUG = select(Category).where(Category.slug == bindparam("slug"))
+_GET_ALL = select(Category).order_by(Category.name)
+_GET_ALL_ACTIVE = select(Category).where(Category.is_active == True).order_by(Category.name)
+
+# Categories are small, rarely-changing reference data read on most event
+# requests. Column snapshots are cached per process for a minute and
+# dropped on every write through this repository.
+_category_cache = TTLCache(ttl=60, maxsize=256)
+_COLUMNS = tuple(column.key for column in Category.__table__.columns)
+
+# Columns CategoryRepository.update() may write
+_UPDATABLE = frozenset(("name", "slug", "color", "description", "icon", "is_active"))
+
+
+def _snapshot(category: Category) -> dict:
+    return {key: getattr(category, key) for key in _COLUMNS}
 
 
 class CategoryRepository:
@@ -31,7 +55,7 @@ class CategoryRepository:
         Returns:
             Optional[Category]: Category if found, None otherwise
         """
-        return self.db.query(Category).filter(Category.id == category_id).first()
+        return self._cached_one(("id", category_id), _GET_BY_ID, {"category_id": category_id})
     
     def get_by_slug(self, slug: str) -> Optional[Category]:
         """
@@ -43,7 +67,7 @@ class CategoryRepository:
         Returns:
             Optional[Category]: Category if found, None otherwise
         """
-        return self.db.query(Category).filter(Category.slug == slug).first()
+        return self._cached_one(("slug", slug), _GET_BY_SLUG, {"slug": slug})
     
     def get_all(self, active_only: bool = True) -> List[Category]:
         """
@@ -55,10 +79,47 @@ class CategoryRepository:
         Returns:
             List[Category]: List of categories
         """
-        query = self.db.query(Category)
-        if active_only:
-            query = query.filter(Category.is_active == True)
-        return query.order_by(Category.name).all()
+        key = ("all", active_only)
+        rows = _category_cache.get(key)
+        if rows is None:
+            categories = list(self.db.execute(_GET_ALL_ACTIVE if active_only else _GET_ALL).scalars())
+            _category_cache.set(key, tuple(_snapshot(category) for category in categories))
+            return categories
+        return [self._attach(row) for row in rows]
+    
+    def _cached_one(self, key: tuple, statement, params: dict) -> Optional[Category]:
+        """
+        Look up a single category through the process cache.
+        
+        Args:
+            key: Cache key
+            statement: Statement to run on a miss
+            params: Bound parameters for statement
+            
+        Returns:
+            Optional[Category]: Session-attached category, or None
+        """
+        row = _category_cache.get(key)
+        if row is not None:
+            return self._attach(row)
+        category = self.db.execute(statement, params).scalar_one_or_none()
+        if category is not None:
+            _category_cache.set(key, _snapshot(category))
+        return category
+    
+    def _attach(self, row: dict) -> Category:
+        """
+        Rebuild a cached category and attach it to this session without a query.
+        
+        Args:
+            row: Column snapshot from the cache
+            
+        Returns:
+            Category: Instance tracked by the current session
+        """
+        category = Category(**row)
+        make_transient_to_detached(category)
+        return self.db.merge(category, load=False)
     
     def create(
         self,
@@ -84,7 +145,8 @@ class CategoryRepository:
         Raises:
             IntegrityError: If slug already exists
         """
-        category_id = str(uuid.uuid4())
+        category_id = new_id()
+        now = datetime.now(timezone.utc)
         
         category = Category(
             id=category_id,
@@ -93,13 +155,14 @@ class CategoryRepository:
             color=color,
             description=description,
             icon=icon,
-            is_active=True
+            is_active=True,
+            created_at=now,
+            updated_at=now
         )
         
         try:
             self.db.add(category)
-            self.db.commit()
-            self.db.refresh(category)
+            self._commit_keep_loaded(category)
             return category
         except IntegrityError:
             self.db.rollback()
@@ -109,19 +172,41 @@ class CategoryRepository:
         """
         Update category fields.
         
+        Issues a single UPDATE statement and applies the new values to the
+        instance as committed state, bypassing per-attribute change tracking.
+        
         Args:
             category: Category to update
-            **kwargs: Fields to update
+            **kwargs: Fields to update (unknown fields are ignored)
             
         Returns:
             Category: Updated category
+            
+        Raises:
+            IntegrityError: If the new name or slug already exists
         """
-        for key, value in kwargs.items():
-            if hasattr(category, key) and key != 'id':
-                setattr(category, key, value)
+        updates = {key: value for key, value in kwargs.items() if key in _UPDATABLE}
+        if not updates:
+            return category
+        updates["updated_at"] = datetime.now(timezone.utc)
+        values = {**_snapshot(category), **updates}
         
-        self.db.commit()
-        self.db.refresh(category)
+        try:
+            self.db.execute(
+                update(Category)
+                .where(Category.id == category.id)
+                .values(**updates)
+                .execution_options(synchronize_session=False)
+            )
+            self.db.commit()
+        except IntegrityError:
+            self.db.rollback()
+            raise
+        
+        _category_cache.clear()
+        # Restore every column so expire-on-commit does not trigger a reload
+        for key, value in values.items():
+            set_committed_value(category, key, value)
         return category
     
     def toggle_active(self, category: Category) -> Category:
@@ -135,10 +220,27 @@ class CategoryRepository:
             Category: Updated category
         """
         category.is_active = not category.is_active
-        self.db.commit()
-        self.db.refresh(category)
+        category.updated_at = datetime.now(timezone.utc)
+        self._commit_keep_loaded(category)
         return category
     
+    def _commit_keep_loaded(self, category: Category) -> None:
+        """
+        Commit and keep the category's column values loaded.
+        
+        Every column value is known client-side (timestamps are set by the
+        caller), so they are restored as committed state instead of letting
+        expire-on-commit force a reload SELECT on next access.
+        
+        Args:
+            category: Category being written
+        """
+        values = _snapshot(category)
+        self.db.commit()
+        _category_cache.clear()
+        for key, value in values.items():
+            set_committed_value(category, key, value)
+    
     def count_events_using_category(self, category_id: str) -> int:
         """
         Count number of events using this category.
@@ -149,6 +251,5 @@ class CategoryRepository:
         Returns:
             int: Number of events
         """
-        from app.models.event import Event
         return self.db.query(Event).filter(Event.category_id == category_id).count()
 
@@ -2,13 +2,233 @@
 Event repository for database operations.
 Handles all database interactions for Event model.
 """
-from typing import Optional, List, Tuple
-from sqlalchemy.orm import Session, joinedload
+from typing import Optional, List, Tuple, Dict, Iterable, Union
+from sqlalchemy.orm import Session, joinedload, load_only
+from sqlalchemy.orm.attributes import set_committed_value
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy import or_, and_, func
-from datetime import date, datetime
+from sqlalchemy import or_, and_, func, case, update, select, bindparam, text
+from sqlalchemy.engine import Engine
+from datetime import date, datetime, time
+from operator import attrgetter
+from app.core.database import strict_loading
 from app.models.event import Event, EventStatus
-import uuid
+from app.models.category import Category
+from app.models.user import User
+from app.utils.cache import TTLCache, clear_on_commit, invalidate_on_commit
+import base64
+import json
+
+# Listing totals stop counting past this many rows and report the cap
+_COUNT_CAP = 10000
+
+# Filtered totals are the slow half of a listing; reuse them briefly across pages
+_published_count_cache = TTLCache(ttl=30, maxsize=256)
+
+# Dashboard reads: pending-approval count and per-organizer statistics
+_pending_count_cache = TTLCache(ttl=30, maxsize=1)
+_statistics_cache = TTLCache(ttl=30, maxsize=1024)
+
+# Set once create_organizer_stats_view() has run in this process; until then
+# (and on databases other than PostgreSQL) statistics aggregate events directly
+_stats_view_ready = False
+_ORGANIZER_STATS = text(
+    "SELECT status, n, regs, upcoming FROM organizer_stats WHERE organizer_id = :organizer_id"
+)
+
+# Advisory lock held while refreshing, so only one worker refreshes per interval
+_STATS_REFRESH_LOCK_KEY = 0x6f726773
+
+
+# Invalidate cached listing reads when a transaction that wrote events commits
+clear_on_commit(Event, _published_count_cache)
+clear_on_commit(Event, _pending_count_cache)
+clear_on_commit(Event, _statistics_cache, key=attrgetter("organizer_id"))
+
+# Column projections for list queries: only what the list responses read,
+# so wide columns (organizer password hash/bio, unused event fields) are
+# neither transferred nor hydrated
+_PUBLISHED_LIST_COLUMNS = (
+    Event.id, Event.title, Event.description, Event.category_id, Event.organizer_id,
+    Event.date, Event.start_time, Event.end_time, Event.venue, Event.location,
+    Event.capacity, Event.registered_count, Event.waitlist_count, Event.status,
+    Event.image_url, Event.tags, Event.is_featured, Event.created_at, Event.published_at,
+)
+_PENDING_LIST_COLUMNS = (
+    Event.id, Event.title, Event.description, Event.category_id, Event.organizer_id,
+    Event.date, Event.start_time, Event.end_time, Event.venue, Event.capacity,
+    Event.status, Event.created_at,
+)
+_CATEGORY_SUMMARY = (Category.id, Category.name, Category.slug, Category.color)
+_ORGANIZER_SUMMARY = (User.id, User.name, User.email, User.department)
+
+# Generated search column; not mapped on Event, so reached through the table
+_SEARCH_BLOB = Event.__table__.c.search_blob
+
+# Constant statements so hot lookups reuse SQLAlchemy's compiled-SQL cache entry
+_GET_BY_ID = select(Event).where(Event.id == bindparam("event_id"))
+_GET_BY_ID_WITH_RELATIONS = _GET_BY_ID.options(
+    joinedload(Event.category),
+    joinedload(Event.organizer)
+)
+_GET_BY_ID_WITH_ORGANIZER = _GET_BY_ID.options(joinedload(Event.organizer))
+_VENUE_EVENTS = select(Event).where(
+    Event.venue == bindparam("venue"),
+    Event.date == bindparam("event_date"),
+    Event.status.in_([EventStatus.PENDING, EventStatus.PUBLISHED])  # Only check non-cancelled events
+)
+_VENUE_EVENTS_EXCLUDING = _VENUE_EVENTS.where(Event.id != bindparam("exclude_event_id"))
+
+
+def encode_event_cursor(event: Event, sort_by: str = "date") -> str:
+    """
+    Encode an event's position in an event listing as a cursor.
+
+    Args:
+        event: Last event of the current page
+        sort_by: Sort order the page was produced with ('date', 'title',
+            'popularity', or 'recent' for organizer listings)
+
+    Returns:
+        str: URL-safe cursor string
+    """
+    if sort_by == "title":
+        key = [event.title]
+    elif sort_by == "popularity":
+        key = [event.registered_count]
+    elif sort_by == "recent":
+        key = [event.date.isoformat()]
+    else:
+        key = [event.date.isoformat(), event.start_time.isoformat()]
+    payload = json.dumps({"s": sort_by, "k": key, "id": event.id})
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+def decode_event_cursor(cursor: str, sort_by: str = "date") -> Optional[Tuple[list, str]]:
+    """
+    Decode a cursor produced by encode_event_cursor.
+
+    Args:
+        cursor: Opaque cursor string
+        sort_by: Sort order of the requested page
+
+    Returns:
+        Optional[Tuple[list, str]]: (sort key values, id) or None if malformed
+        or produced under a different sort order
+    """
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        if payload["s"] != sort_by:
+            return None
+        key = payload["k"]
+        if sort_by == "title":
+            key = [str(key[0])]
+        elif sort_by == "popularity":
+            key = [int(key[0])]
+        elif sort_by == "recent":
+            key = [date.fromisoformat(key[0])]
+        else:
+            key = [date.fromisoformat(key[0]), time.fromisoformat(key[1])]
+        return key, str(payload["id"])
+    except (ValueError, KeyError, TypeError, IndexError):
+        return None
+
+
+def _coerce_time(value: Union[str, time]) -> time:
+    """Return a time as-is, or parse an HH:MM string with the C parser."""
+    return value if isinstance(value, time) else time.fromisoformat(value)
+
+
+def _floor_sub(column, count: int):
+    """SQL expression for column - count, clamped at zero."""
+    return case((column > count, column - count), else_=0)
+
+
+def _after_cursor(sort_by: str, key: list, event_id: str):
+    """Build the keyset predicate for rows strictly after a cursor position."""
+    if sort_by == "title":
+        (title,) = key
+        return or_(
+            Event.title > title,
+            and_(Event.title == title, Event.id > event_id)
+        )
+    if sort_by == "popularity":
+        (registered,) = key
+        return or_(
+            Event.registered_count < registered,
+            and_(Event.registered_count == registered, Event.id > event_id)
+        )
+    if sort_by == "recent":
+        (event_date,) = key
+        return or_(
+            Event.date < event_date,
+            and_(Event.date == event_date, Event.id > event_id)
+        )
+    event_date, start_time = key
+    return or_(
+        Event.date > event_date,
+        and_(Event.date == event_date, Event.start_time > start_time),
+        and_(Event.date == event_date, Event.start_time == start_time, Event.id > event_id)
+    )
+
+
+def create_organizer_stats_view(bind: Engine) -> bool:
+    """
+    Create the organizer_stats materialized view if it does not exist.
+    
+    Holds one pre-aggregated row per (organizer, status). Safe to run
+    repeatedly at startup; no-op on databases other than PostgreSQL.
+    
+    Args:
+        bind: Engine to run the DDL on
+        
+    Returns:
+        bool: True if the view is available
+    """
+    global _stats_view_ready
+    if bind.dialect.name != "postgresql":
+        return False
+    
+    with bind.begin() as conn:
+        conn.execute(text(
+            "CREATE MATERIALIZED VIEW IF NOT EXISTS organizer_stats AS "
+            "SELECT organizer_id, status, COUNT(*) AS n, "
+            "COALESCE(SUM(registered_count), 0) AS regs, "
+            "SUM(CASE WHEN status = 'PUBLISHED' AND date >= CURRENT_DATE THEN 1 ELSE 0 END) AS upcoming "
+            "FROM events GROUP BY organizer_id, status"
+        ))
+        # REFRESH ... CONCURRENTLY requires a unique index
+        conn.execute(text(
+            "CREATE UNIQUE INDEX IF NOT EXISTS ux_organizer_stats "
+            "ON organizer_stats (organizer_id, status)"
+        ))
+    _stats_view_ready = True
+    return True
+
+
+def refresh_organizer_stats_view(bind: Engine) -> bool:
+    """
+    Refresh the organizer_stats materialized view without blocking readers.
+    
+    Every worker runs the refresh loop; the one that takes the advisory lock
+    refreshes and the others skip this round instead of queueing behind it.
+    
+    Args:
+        bind: Engine to run the refresh on
+        
+    Returns:
+        bool: True if this call refreshed the view
+    """
+    if not _stats_view_ready:
+        return False
+    with bind.begin() as conn:
+        locked = conn.execute(
+            text("SELECT pg_try_advisory_xact_lock(:key)"),
+            {"key": _STATS_REFRESH_LOCK_KEY}
+        ).scalar()
+        if not locked:
+            return False
+        conn.execute(text("REFRESH MATERIALIZED VIEW CONCURRENTLY organizer_stats"))
+    return True
 
 
 class EventRepository:
@@ -23,24 +243,54 @@ class EventRepository:
         """
         self.db = db
     
-    def get_by_id(self, event_id: str, include_relations: bool = True) -> Optional[Event]:
+    def get_by_id(
+        self,
+        event_id: str,
+        include_relations: bool = True,
+        strict: Optional[bool] = None
+    ) -> Optional[Event]:
         """
         Get event by ID.
         
         Args:
             event_id: Event ID
             include_relations: Whether to eagerly load related objects
+            strict: Raise on access to relationships not loaded here
+                (default: DATABASE_STRICT_LOADING)
+            
+        Returns:
+            Optional[Event]: Event if found, None otherwise
+        """
+        stmt = _GET_BY_ID_WITH_RELATIONS if include_relations else _GET_BY_ID
+        options = strict_loading(strict)
+        if options:
+            stmt = stmt.options(*options)
+        return self.db.execute(stmt, {"event_id": event_id}).scalar_one_or_none()
+    
+    def get_by_id_with_organizer(
+        self,
+        event_id: str,
+        strict: Optional[bool] = None
+    ) -> Optional[Event]:
+        """
+        Get event by ID with only its organizer joined in.
+        
+        For review flows that notify the organizer but never read the
+        category.
+        
+        Args:
+            event_id: Event ID
+            strict: Raise on access to relationships not loaded here
+                (default: DATABASE_STRICT_LOADING)
             
         Returns:
             Optional[Event]: Event if found, None otherwise
         """
-        query = self.db.query(Event).filter(Event.id == event_id)
-        if include_relations:
-            query = query.options(
-                joinedload(Event.category),
-                joinedload(Event.organizer)
-            )
-        return query.first()
+        stmt = _GET_BY_ID_WITH_ORGANIZER
+        options = strict_loading(strict)
+        if options:
+            stmt = stmt.options(*options)
+        return self.db.execute(stmt, {"event_id": event_id}).scalar_one_or_none()
     
     def get_all_published(
         self,
@@ -52,11 +302,18 @@ class EventRepository:
         availability: Optional[bool] = None,
         sort_by: str = "date",
         page: int = 1,
-        limit: int = 20
-    ) -> Tuple[List[Event], int]:
+        limit: int = 20,
+        cursor: Optional[str] = None,
+        include_total: bool = True,
+        strict: Optional[bool] = None
+    ) -> Tuple[List[Event], Optional[int]]:
         """
         Get paginated list of published events with filters.
         
+        When a cursor is given, rows strictly after the cursor position in the
+        chosen sort order are returned (keyset pagination) and page is ignored;
+        otherwise page/limit offset pagination is used.
+        
         Args:
             search: Search term for title, description, tags, venue
             category_id: Filter by category ID
@@ -67,23 +324,24 @@ class EventRepository:
             sort_by: Sort field ('date', 'title', 'popularity')
             page: Page number (1-indexed)
             limit: Items per page
+            cursor: Cursor from encode_event_cursor() of the previous page's last row
+            include_total: Whether to compute the total count (capped at
+                10,000 and cached ~30s)
+            strict: Raise on access to relationships not loaded here
+                (default: DATABASE_STRICT_LOADING)
             
         Returns:
-            Tuple[List[Event], int]: List of events and total count
+            Tuple[List[Event], Optional[int]]: List of events and total count
+            (None when include_total is False)
         """
         query = self.db.query(Event).filter(Event.status == EventStatus.PUBLISHED)
         
         # Apply filters
         if search:
-            search_pattern = f"%{search}%"
-            query = query.filter(
-                or_(
-                    Event.title.ilike(search_pattern),
-                    Event.description.ilike(search_pattern),
-                    Event.venue.ilike(search_pattern),
-                    Event.location.ilike(search_pattern)
-                )
-            )
+            # One LIKE over the generated, lower-cased search_blob column
+            # (title, description, venue, location); a single pg_trgm GIN
+            # index scan under PostgreSQL
+            query = query.filter(_SEARCH_BLOB.like(f"%{search.lower()}%"))
         
         if category_id:
             query = query.filter(Event.category_id == category_id)
@@ -101,47 +359,95 @@ class EventRepository:
             query = query.filter(Event.registered_count < Event.capacity)
         
         # Get total count before pagination
-        total_count = query.count()
-        
-        # Apply sorting
+        total_count = None
+        if include_total:
+            cache_key = (search, category_id, start_date, end_date, organizer_id, availability)
+            total_count = _published_count_cache.get(cache_key)
+            if total_count is None:
+                total_count = self._bounded_count(query)
+                _published_count_cache.set(cache_key, total_count)
+        
+        # Apply sorting (id breaks ties so keyset positions are unique)
         if sort_by == "title":
-            query = query.order_by(Event.title)
+            query = query.order_by(Event.title, Event.id)
         elif sort_by == "popularity":
-            query = query.order_by(Event.registered_count.desc())
+            query = query.order_by(Event.registered_count.desc(), Event.id)
         else:  # Default: date
-            query = query.order_by(Event.date, Event.start_time)
+            query = query.order_by(Event.date, Event.start_time, Event.id)
         
         # Apply pagination
-        offset = (page - 1) * limit
+        position = decode_event_cursor(cursor, sort_by) if cursor else None
+        if position:
+            query = query.filter(_after_cursor(sort_by, *position))
+        else:
+            query = query.offset((page - 1) * limit)
         query = query.options(
-            joinedload(Event.category),
-            joinedload(Event.organizer)
-        ).offset(offset).limit(limit)
+            load_only(*_PUBLISHED_LIST_COLUMNS),
+            joinedload(Event.category).load_only(*_CATEGORY_SUMMARY),
+            joinedload(Event.organizer).load_only(*_ORGANIZER_SUMMARY),
+            *strict_loading(strict)
+        ).limit(limit)
         
         events = query.all()
         return events, total_count
     
+    def _bounded_count(self, query) -> int:
+        """
+        Count a query's rows, stopping once the count passes _COUNT_CAP.
+        
+        Args:
+            query: Filtered, unordered Event query
+            
+        Returns:
+            int: Row count, or _COUNT_CAP if there are more rows than that
+        """
+        capped = query.with_entities(Event.id).limit(_COUNT_CAP).subquery()
+        return self.db.query(func.count()).select_from(capped).scalar()
+    
     def get_by_organizer(
         self,
         organizer_id: str,
-        status: Optional[EventStatus] = None
+        status: Optional[EventStatus] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        strict: Optional[bool] = None
     ) -> List[Event]:
         """
-        Get all events created by an organizer.
+        Get events created by an organizer, newest first.
+        
+        With a limit, returns one page; pass encode_event_cursor(last, "recent")
+        of the previous page as cursor to continue. Without one, returns every
+        event.
         
         Args:
             organizer_id: Organizer user ID
             status: Filter by event status (optional)
+            limit: Maximum number of events to return (optional)
+            cursor: Cursor of the previous page's last event (optional)
+            strict: Raise on access to relationships not loaded here
+                (default: DATABASE_STRICT_LOADING)
             
         Returns:
             List[Event]: List of events
         """
+        # Ordered to match ix_events_organizer_date
         query = self.db.query(Event).filter(Event.organizer_id == organizer_id)
         
         if status:
             query = query.filter(Event.status == status)
         
-        return query.options(joinedload(Event.category)).order_by(Event.date.desc()).all()
+        query = query.options(
+            joinedload(Event.category).load_only(*_CATEGORY_SUMMARY),
+            *strict_loading(strict)
+        ).order_by(Event.date.desc(), Event.id)
+        
+        position = decode_event_cursor(cursor, "recent") if cursor else None
+        if position:
+            query = query.filter(_after_cursor("recent", *position))
+        if limit:
+            query = query.limit(limit)
+        
+        return query.all()
     
     def create(
         self,
@@ -150,8 +456,8 @@ class EventRepository:
         category_id: str,
         organizer_id: str,
         event_date: date,
-        start_time: str,
-        end_time: str,
+        start_time: Union[str, time],
+        end_time: Union[str, time],
         venue: str,
         location: str,
         capacity: int,
@@ -168,8 +474,8 @@ class EventRepository:
             category_id: Category ID
             organizer_id: Organizer user ID
             event_date: Event date
-            start_time: Start time (HH:MM)
-            end_time: End time (HH:MM)
+            start_time: Start time (time or HH:MM)
+            end_time: End time (time or HH:MM)
             venue: Venue name
             location: Detailed location
             capacity: Maximum capacity
@@ -180,23 +486,14 @@ class EventRepository:
         Returns:
             Event: Created event
         """
-        from datetime import time
-        
-        event_id = str(uuid.uuid4())
-        
-        # Parse time strings
-        start_hour, start_minute = map(int, start_time.split(':'))
-        end_hour, end_minute = map(int, end_time.split(':'))
-        
         event = Event(
-            id=event_id,
             title=title,
             description=description,
             category_id=category_id,
             organizer_id=organizer_id,
             date=event_date,
-            start_time=time(start_hour, start_minute),
-            end_time=time(end_hour, end_minute),
+            start_time=_coerce_time(start_time),
+            end_time=_coerce_time(end_time),
             venue=venue,
             location=location,
             capacity=capacity,
@@ -211,12 +508,30 @@ class EventRepository:
         try:
             self.db.add(event)
             self.db.commit()
-            self.db.refresh(event)
             return event
         except IntegrityError:
             self.db.rollback()
             raise
     
+    def get_registered_counts(self, event_ids: Iterable[str]) -> Dict[str, int]:
+        """
+        Get live registered counts for several events in one query.
+        
+        Args:
+            event_ids: Event IDs
+            
+        Returns:
+            Dict[str, int]: Registered count keyed by event ID
+        """
+        event_ids = set(event_ids)
+        if not event_ids:
+            return {}
+        return dict(
+            self.db.query(Event.id, Event.registered_count)
+            .filter(Event.id.in_(event_ids))
+            .all()
+        )
+    
     def update(self, event: Event, **kwargs) -> Event:
         """
         Update event fields.
@@ -228,18 +543,14 @@ class EventRepository:
         Returns:
             Event: Updated event
         """
-        from datetime import time
-        
         for key, value in kwargs.items():
             if hasattr(event, key) and key not in ['id', 'registered_count', 'waitlist_count']:
-                # Parse time strings if updating times
-                if key in ['start_time', 'end_time'] and isinstance(value, str):
-                    hour, minute = map(int, value.split(':'))
-                    value = time(hour, minute)
+                # Accept times as time objects or HH:MM strings
+                if key in ['start_time', 'end_time'] and value is not None:
+                    value = _coerce_time(value)
                 setattr(event, key, value)
         
         self.db.commit()
-        self.db.refresh(event)
         return event
     
     def publish(self, event: Event) -> Event:
@@ -255,7 +566,6 @@ class EventRepository:
         event.status = EventStatus.PUBLISHED
         event.published_at = datetime.utcnow()
         self.db.commit()
-        self.db.refresh(event)
         return event
     
     def cancel(self, event: Event) -> Event:
@@ -271,28 +581,36 @@ class EventRepository:
         event.status = EventStatus.CANCELLED
         event.cancelled_at = datetime.utcnow()
         self.db.commit()
-        self.db.refresh(event)
         return event
     
-    def increment_registered_count(self, event: Event, count: int = 1) -> Event:
+    def increment_registered_count(
+        self,
+        event: Event,
+        count: int = 1,
+        enforce_capacity: bool = False
+    ) -> Optional[Event]:
         """
-        Increment registered count.
+        Atomically increment registered count.
+        
+        Runs one UPDATE ... RETURNING in the current transaction (the caller
+        commits), so concurrent registrations cannot overwrite each other.
         
         Args:
             event: Event to update
             count: Number to increment by
+            enforce_capacity: Only apply if the result stays within capacity
             
         Returns:
-            Event: Updated event
+            Optional[Event]: Updated event, or None if capacity would be exceeded
         """
-        event.registered_count += count
-        self.db.commit()
-        self.db.refresh(event)
-        return event
+        conditions = (Event.registered_count + count <= Event.capacity,) if enforce_capacity else ()
+        return self._adjust_counter(
+            event, Event.registered_count, Event.registered_count + count, *conditions
+        )
     
     def decrement_registered_count(self, event: Event, count: int = 1) -> Event:
         """
-        Decrement registered count.
+        Atomically decrement registered count, never going below zero.
         
         Args:
             event: Event to update
@@ -301,14 +619,11 @@ class EventRepository:
         Returns:
             Event: Updated event
         """
-        event.registered_count = max(0, event.registered_count - count)
-        self.db.commit()
-        self.db.refresh(event)
-        return event
+        return self._adjust_counter(event, Event.registered_count, _floor_sub(Event.registered_count, count))
     
     def increment_waitlist_count(self, event: Event, count: int = 1) -> Event:
         """
-        Increment waitlist count.
+        Atomically increment waitlist count.
         
         Args:
             event: Event to update
@@ -317,14 +632,11 @@ class EventRepository:
         Returns:
             Event: Updated event
         """
-        event.waitlist_count += count
-        self.db.commit()
-        self.db.refresh(event)
-        return event
+        return self._adjust_counter(event, Event.waitlist_count, Event.waitlist_count + count)
     
     def decrement_waitlist_count(self, event: Event, count: int = 1) -> Event:
         """
-        Decrement waitlist count.
+        Atomically decrement waitlist count, never going below zero.
         
         Args:
             event: Event to update
@@ -333,70 +645,143 @@ class EventRepository:
         Returns:
             Event: Updated event
         """
-        event.waitlist_count = max(0, event.waitlist_count - count)
-        self.db.commit()
-        self.db.refresh(event)
+        return self._adjust_counter(event, Event.waitlist_count, _floor_sub(Event.waitlist_count, count))
+    
+    def _adjust_counter(self, event: Event, column, value, *conditions) -> Optional[Event]:
+        """
+        Set a counter column from a SQL expression and load the result.
+        
+        Args:
+            event: Event to update
+            column: Counter column
+            value: SQL expression for the new value
+            *conditions: Extra WHERE conditions the row must satisfy
+            
+        Returns:
+            Optional[Event]: Event with the new value as committed state, or
+            None if no row matched
+        """
+        stmt = (
+            update(Event)
+            .where(Event.id == event.id, *conditions)
+            .values({column: value})
+            .returning(column)
+            .execution_options(synchronize_session=False)
+        )
+        new_value = self.db.execute(stmt).scalar_one_or_none()
+        if new_value is None:
+            return None
+        # Core UPDATEs bypass the flush listeners
+        invalidate_on_commit(self.db, _statistics_cache, event.organizer_id)
+        set_committed_value(event, column.key, new_value)
         return event
     
-    def get_pending_events(self) -> List[Event]:
+    def get_pending_events(self, strict: Optional[bool] = None) -> List[Event]:
         """
         Get all events pending approval.
         
+        Args:
+            strict: Raise on access to relationships not loaded here
+                (default: DATABASE_STRICT_LOADING)
+        
         Returns:
             List[Event]: List of pending events
         """
         return self.db.query(Event).filter(
             Event.status == EventStatus.PENDING
         ).options(
-            joinedload(Event.category),
-            joinedload(Event.organizer)
+            load_only(*_PENDING_LIST_COLUMNS),
+            joinedload(Event.category).load_only(*_CATEGORY_SUMMARY),
+            joinedload(Event.organizer).load_only(*_ORGANIZER_SUMMARY),
+            *strict_loading(strict)
         ).order_by(Event.created_at).all()
     
+    def count_pending(self) -> int:
+        """
+        Count events awaiting approval (cached ~30s, dropped on event writes).
+        
+        Returns:
+            int: Number of pending events
+        """
+        count = _pending_count_cache.get("pending")
+        if count is None:
+            count = self.db.query(func.count(Event.id)).filter(
+                Event.status == EventStatus.PENDING
+            ).scalar()
+            _pending_count_cache.set("pending", count)
+        return count
+    
     def get_organizer_statistics(self, organizer_id: str) -> dict:
         """
         Get statistics for an organizer's events.
         
+        Read from the organizer_stats materialized view when it exists,
+        otherwise aggregated from events. Cached ~30s per organizer and
+        dropped when one of their events is written. With the view, a write
+        is only visible after the next refresh, so figures may lag by up to
+        ORGANIZER_STATS_REFRESH_SECONDS plus the cache TTL.
+        
         Args:
             organizer_id: Organizer user ID
             
         Returns:
             dict: Statistics dictionary
         """
-        from sqlalchemy import func
-        
-        total = self.db.query(func.count(Event.id)).filter(
-            Event.organizer_id == organizer_id
-        ).scalar()
-        
-        by_status = self.db.query(
-            Event.status, func.count(Event.id)
+        cached = _statistics_cache.get(organizer_id)
+        if cached is not None:
+            return dict(cached, by_status=dict(cached["by_status"]))
+        
+        if _stats_view_ready:
+            statistics = self._view_statistics(organizer_id)
+            _statistics_cache.set(organizer_id, statistics)
+            return dict(statistics, by_status=dict(statistics["by_status"]))
+        
+        # One pass over the organizer's events using conditional aggregation
+        row = self.db.query(
+            func.count(Event.id),
+            func.sum(case(
+                (and_(Event.status == EventStatus.PUBLISHED, Event.date >= date.today()), 1),
+                else_=0
+            )),
+            func.sum(Event.registered_count),
+            *(func.sum(case((Event.status == status, 1), else_=0)) for status in EventStatus)
         ).filter(
             Event.organizer_id == organizer_id
-        ).group_by(Event.status).all()
-        
-        upcoming = self.db.query(func.count(Event.id)).filter(
-            Event.organizer_id == organizer_id,
-            Event.status == EventStatus.PUBLISHED,
-            Event.date >= date.today()
-        ).scalar()
+        ).one()
+        total, upcoming, total_registrations, *status_counts = row
         
-        total_registrations = self.db.query(func.sum(Event.registered_count)).filter(
-            Event.organizer_id == organizer_id
-        ).scalar() or 0
-        
-        return {
+        statistics = {
             "total": total,
-            "upcoming": upcoming,
-            "total_registrations": total_registrations,
-            "by_status": {status.value: count for status, count in by_status}
+            "upcoming": upcoming or 0,
+            "total_registrations": total_registrations or 0,
+            "by_status": {
+                status.value: count
+                for status, count in zip(EventStatus, status_counts)
+                if count
+            }
         }
+        _statistics_cache.set(organizer_id, statistics)
+        return dict(statistics, by_status=dict(statistics["by_status"]))
+    
+    def _view_statistics(self, organizer_id: str) -> dict:
+        """Build organizer statistics from the organizer_stats view rows."""
+        statistics = {"total": 0, "upcoming": 0, "total_registrations": 0, "by_status": {}}
+        for status, n, regs, upcoming in self.db.execute(
+            _ORGANIZER_STATS, {"organizer_id": organizer_id}
+        ):
+            statistics["total"] += n
+            statistics["upcoming"] += upcoming
+            statistics["total_registrations"] += regs
+            # The native enum stores member names
+            statistics["by_status"][EventStatus[status].value] = n
+        return statistics
 
     def check_venue_conflict(
         self,
         venue: str,
         event_date: date,
-        start_time: str,
-        end_time: str,
+        start_time: Union[str, time],
+        end_time: Union[str, time],
         exclude_event_id: Optional[str] = None
     ) -> Optional[Event]:
         """
@@ -405,34 +790,25 @@ class EventRepository:
         Args:
             venue: Venue name
             event_date: Event date
-            start_time: Start time in HH:MM format
-            end_time: End time in HH:MM format
+            start_time: Start time (time or HH:MM)
+            end_time: End time (time or HH:MM)
             exclude_event_id: Optional event ID to exclude (for updates)
 
         Returns:
             Optional[Event]: Conflicting event if found, None otherwise
         """
-        from datetime import time
-
         # Parse times
-        start = time.fromisoformat(start_time)
-        end = time.fromisoformat(end_time)
-
-        # Build query for events at same venue on same date
-        query = self.db.query(Event).filter(
-            and_(
-                Event.venue == venue,
-                Event.date == event_date,
-                Event.status.in_([EventStatus.PENDING, EventStatus.PUBLISHED])  # Only check non-cancelled events
-            )
-        )
+        start = _coerce_time(start_time)
+        end = _coerce_time(end_time)
 
-        # Exclude current event if updating
+        # Get all events at this venue on this date (excluding the current
+        # event if updating)
+        params = {"venue": venue, "event_date": event_date}
+        stmt = _VENUE_EVENTS
         if exclude_event_id:
-            query = query.filter(Event.id != exclude_event_id)
-
-        # Get all events at this venue on this date
-        events = query.all()
+            stmt = _VENUE_EVENTS_EXCLUDING
+            params["exclude_event_id"] = exclude_event_id
+        events = self.db.execute(stmt, params).scalars().all()
 
         # Check for time overlap
         for existing_event in events:
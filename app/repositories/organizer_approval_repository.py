@@ -6,8 +6,14 @@ from typing import Optional, List
 from sqlalchemy.orm import Session, joinedload
 from sqlalchemy.exc import IntegrityError
 from datetime import datetime
+from app.core.database import strict_loading
 from app.models.organizer_approval import OrganizerApprovalRequest, ApprovalStatus
-import uuid
+from app.utils.cache import TTLCache, clear_on_commit
+
+# Pending count shown on every admin dashboard load; dropped whenever a write
+# to an approval request commits (services update status directly, not only here)
+_pending_count_cache = TTLCache(ttl=30, maxsize=1)
+clear_on_commit(OrganizerApprovalRequest, _pending_count_cache)
 
 
 class OrganizerApprovalRepository:
@@ -22,13 +28,20 @@ class OrganizerApprovalRepository:
         """
         self.db = db
     
-    def get_by_id(self, request_id: str, include_relations: bool = True) -> Optional[OrganizerApprovalRequest]:
+    def get_by_id(
+        self,
+        request_id: str,
+        include_relations: bool = True,
+        strict: Optional[bool] = None
+    ) -> Optional[OrganizerApprovalRequest]:
         """
         Get approval request by ID.
         
         Args:
             request_id: Request ID
             include_relations: Whether to eagerly load related objects
+            strict: Raise on access to relationships not loaded here
+                (default: DATABASE_STRICT_LOADING)
             
         Returns:
             Optional[OrganizerApprovalRequest]: Request if found, None otherwise
@@ -41,7 +54,7 @@ class OrganizerApprovalRepository:
                 joinedload(OrganizerApprovalRequest.user),
                 joinedload(OrganizerApprovalRequest.reviewer)
             )
-        return query.first()
+        return query.options(*strict_loading(strict)).first()
     
     def get_by_user(self, user_id: str) -> Optional[OrganizerApprovalRequest]:
         """
@@ -57,12 +70,18 @@ class OrganizerApprovalRepository:
             OrganizerApprovalRequest.user_id == user_id
         ).order_by(OrganizerApprovalRequest.requested_at.desc()).first()
     
-    def get_all(self, status: Optional[ApprovalStatus] = None) -> List[OrganizerApprovalRequest]:
+    def get_all(
+        self,
+        status: Optional[ApprovalStatus] = None,
+        strict: Optional[bool] = None
+    ) -> List[OrganizerApprovalRequest]:
         """
         Get all approval requests.
         
         Args:
             status: Filter by status (optional)
+            strict: Raise on access to relationships not loaded here
+                (default: DATABASE_STRICT_LOADING)
             
         Returns:
             List[OrganizerApprovalRequest]: List of requests
@@ -73,7 +92,8 @@ class OrganizerApprovalRepository:
             query = query.filter(OrganizerApprovalRequest.status == status)
         
         return query.options(
-            joinedload(OrganizerApprovalRequest.user)
+            joinedload(OrganizerApprovalRequest.user),
+            *strict_loading(strict)
         ).order_by(OrganizerApprovalRequest.requested_at).all()
     
     def get_pending(self) -> List[OrganizerApprovalRequest]:
@@ -96,10 +116,7 @@ class OrganizerApprovalRepository:
         Returns:
             OrganizerApprovalRequest: Created request
         """
-        request_id = str(uuid.uuid4())
-        
         request = OrganizerApprovalRequest(
-            id=request_id,
             user_id=user_id,
             reason=reason,
             status=ApprovalStatus.PENDING
@@ -108,7 +125,6 @@ class OrganizerApprovalRepository:
         try:
             self.db.add(request)
             self.db.commit()
-            self.db.refresh(request)
             return request
         except IntegrityError:
             self.db.rollback()
@@ -137,7 +153,6 @@ class OrganizerApprovalRepository:
         request.notes = notes
         
         self.db.commit()
-        self.db.refresh(request)
         return request
     
     def reject(
@@ -163,17 +178,19 @@ class OrganizerApprovalRepository:
         request.notes = notes
         
         self.db.commit()
-        self.db.refresh(request)
         return request
     
     def count_pending(self) -> int:
         """
-        Count pending approval requests.
+        Count pending approval requests (cached ~30s, dropped on writes).
         
         Returns:
             int: Count of pending requests
         """
-        return self.db.query(OrganizerApprovalRequest).filter(
-            OrganizerApprovalRequest.status == ApprovalStatus.PENDING
-        ).count()
-
+        count = _pending_count_cache.get("pending")
+        if count is None:
+            count = self.db.query(OrganizerApprovalRequest).filter(
+                OrganizerApprovalRequest.status == ApprovalStatus.PENDING
+            ).count()
+            _pending_count_cache.set("pending", count)
+        return count
@@ -2,12 +2,29 @@
 Registration repository for database operations.
 Handles all database interactions for Registration model.
 """
-from typing import Optional, List
-from sqlalchemy.orm import Session, joinedload
+from typing import Optional, List, Iterator
+from sqlalchemy import select, bindparam
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session, joinedload, contains_eager, undefer
+from sqlalchemy.orm.attributes import set_committed_value
 from sqlalchemy.exc import IntegrityError
-from datetime import datetime
+from datetime import datetime, date
+from app.core.database import strict_loading
+from app.models.event import Event
 from app.models.registration import Registration, RegistrationStatus, CheckInStatus
-import uuid
+
+# Constant statement so the duplicate check reuses its compiled-SQL cache entry
+_GET_CONFIRMED_BY_USER_AND_EVENT = select(Registration).where(
+    Registration.user_id == bindparam("user_id"),
+    Registration.event_id == bindparam("event_id"),
+    Registration.status == RegistrationStatus.CONFIRMED
+).limit(1)
+
+# Rows per fetch when streaming registrations owed a reminder
+_REMINDER_BATCH = 500
+
+# Dialect-specific INSERT constructs supporting ON CONFLICT DO NOTHING
+_UPSERT_INSERTS = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}
 
 
 class RegistrationRepository:
@@ -22,24 +39,33 @@ class RegistrationRepository:
         """
         self.db = db
     
-    def get_by_id(self, registration_id: str, include_relations: bool = True) -> Optional[Registration]:
+    def get_by_id(
+        self,
+        registration_id: str,
+        include_relations: bool = True,
+        strict: Optional[bool] = None
+    ) -> Optional[Registration]:
         """
         Get registration by ID.
         
         Args:
             registration_id: Registration ID
             include_relations: Whether to eagerly load related objects
+            strict: Raise on access to relationships not loaded here
+                (default: DATABASE_STRICT_LOADING)
             
         Returns:
             Optional[Registration]: Registration if found, None otherwise
         """
-        query = self.db.query(Registration).filter(Registration.id == registration_id)
+        query = self.db.query(Registration).filter(
+            Registration.id == registration_id
+        ).options(undefer(Registration.qr_code))
         if include_relations:
             query = query.options(
                 joinedload(Registration.user),
                 joinedload(Registration.event)
             )
-        return query.first()
+        return query.options(*strict_loading(strict)).first()
     
     def get_by_user_and_event(
         self,
@@ -56,32 +82,30 @@ class RegistrationRepository:
         Returns:
             Optional[Registration]: Registration if found, None otherwise
         """
-        return self.db.query(Registration).filter(
-            Registration.user_id == user_id,
-            Registration.event_id == event_id,
-            Registration.status == RegistrationStatus.CONFIRMED
-        ).first()
+        return self.db.execute(
+            _GET_CONFIRMED_BY_USER_AND_EVENT, {"user_id": user_id, "event_id": event_id}
+        ).scalar_one_or_none()
     
     def get_user_registrations(
         self,
         user_id: str,
         status: Optional[RegistrationStatus] = None,
-        include_past: bool = False
+        include_past: bool = False,
+        strict: Optional[bool] = None
     ) -> List[Registration]:
         """
-        Get all registrations for a user.
+        Get all registrations for a user, including their QR codes.
         
         Args:
             user_id: User ID
             status: Filter by status (optional)
             include_past: Whether to include past events
+            strict: Raise on access to relationships not loaded here
+                (default: DATABASE_STRICT_LOADING)
             
         Returns:
             List[Registration]: List of registrations
         """
-        from app.models.event import Event
-        from datetime import date
-        
         query = self.db.query(Registration).join(Event).filter(
             Registration.user_id == user_id
         )
@@ -92,23 +116,33 @@ class RegistrationRepository:
         if not include_past:
             query = query.filter(Event.date >= date.today())
         
+        # Populate event from the join used for filtering instead of joining
+        # events a second time; organizers (few, shared across rows) come
+        # from one IN query rather than widening every row
         return query.options(
-            joinedload(Registration.event).joinedload(Event.organizer)
+            contains_eager(Registration.event).selectinload(Event.organizer),
+            undefer(Registration.qr_code),
+            *strict_loading(strict)
         ).order_by(Event.date, Event.start_time).all()
     
     def get_event_registrations(
         self,
         event_id: str,
         status: Optional[RegistrationStatus] = None,
-        check_in_status: Optional[CheckInStatus] = None
+        check_in_status: Optional[CheckInStatus] = None,
+        strict: Optional[bool] = None
     ) -> List[Registration]:
         """
         Get all registrations for an event.
         
+        QR codes are not loaded; attendee lists and exports never render them.
+        
         Args:
             event_id: Event ID
             status: Filter by registration status (optional)
             check_in_status: Filter by check-in status (optional)
+            strict: Raise on access to relationships not loaded here
+                (default: DATABASE_STRICT_LOADING)
             
         Returns:
             List[Registration]: List of registrations
@@ -123,7 +157,10 @@ class RegistrationRepository:
         if check_in_status:
             query = query.filter(Registration.check_in_status == check_in_status)
         
-        return query.options(joinedload(Registration.user)).order_by(
+        return query.options(
+            joinedload(Registration.user),
+            *strict_loading(strict)
+        ).order_by(
             Registration.registered_at
         ).all()
     
@@ -150,10 +187,7 @@ class RegistrationRepository:
         Returns:
             Registration: Created registration
         """
-        registration_id = str(uuid.uuid4())
-        
         registration = Registration(
-            id=registration_id,
             user_id=user_id,
             event_id=event_id,
             status=RegistrationStatus.CONFIRMED,
@@ -168,12 +202,71 @@ class RegistrationRepository:
         try:
             self.db.add(registration)
             self.db.commit()
-            self.db.refresh(registration)
             return registration
         except IntegrityError:
             self.db.rollback()
             raise
     
+    def create_if_absent(
+        self,
+        user_id: str,
+        event_id: str,
+        ticket_code: str,
+        qr_code: Optional[str] = None,
+        guests: Optional[List[dict]] = None,
+        sessions: Optional[List[str]] = None
+    ) -> Optional[Registration]:
+        """
+        Create a registration unless the user already holds a confirmed one.
+        
+        A single INSERT ... ON CONFLICT DO NOTHING RETURNING against the
+        unique (user_id, event_id) index on confirmed rows, so concurrent
+        duplicate requests cannot both insert and no IntegrityError path is
+        taken. Falls back to create() on other databases.
+        
+        Args:
+            user_id: User ID
+            event_id: Event ID
+            ticket_code: Unique ticket code
+            qr_code: QR code data (optional)
+            guests: List of guest dictionaries (optional)
+            sessions: List of session IDs (optional)
+            
+        Returns:
+            Optional[Registration]: Created registration, or None if the user
+            is already registered (the transaction is rolled back)
+        """
+        dialect_insert = _UPSERT_INSERTS.get(self.db.get_bind().dialect.name)
+        if dialect_insert is None:
+            try:
+                return self.create(user_id, event_id, ticket_code, qr_code, guests, sessions)
+            except IntegrityError:
+                return None
+        
+        stmt = dialect_insert(Registration).values(
+            user_id=user_id,
+            event_id=event_id,
+            status=RegistrationStatus.CONFIRMED,
+            ticket_code=ticket_code,
+            qr_code=qr_code,
+            check_in_status=CheckInStatus.NOT_CHECKED_IN,
+            guests=guests if guests else [],
+            sessions=sessions if sessions else [],
+            reminder_sent=False
+        ).on_conflict_do_nothing(
+            index_elements=[Registration.user_id, Registration.event_id],
+            index_where=Registration.status == RegistrationStatus.CONFIRMED
+        ).returning(Registration)
+        
+        registration = self.db.scalars(stmt).one_or_none()
+        if registration is None:
+            self.db.rollback()
+            return None
+        # RETURNING skips the deferred column; the value is already known
+        set_committed_value(registration, "qr_code", qr_code)
+        self.db.commit()
+        return registration
+    
     def cancel(self, registration: Registration) -> Registration:
         """
         Cancel a registration.
@@ -187,7 +280,6 @@ class RegistrationRepository:
         registration.status = RegistrationStatus.CANCELLED
         registration.cancelled_at = datetime.utcnow()
         self.db.commit()
-        self.db.refresh(registration)
         return registration
     
     def check_in(self, registration: Registration) -> Registration:
@@ -203,7 +295,6 @@ class RegistrationRepository:
         registration.check_in_status = CheckInStatus.CHECKED_IN
         registration.checked_in_at = datetime.utcnow()
         self.db.commit()
-        self.db.refresh(registration)
         return registration
     
     def mark_reminder_sent(self, registration: Registration) -> Registration:
@@ -218,7 +309,6 @@ class RegistrationRepository:
         """
         registration.reminder_sent = True
         self.db.commit()
-        self.db.refresh(registration)
         return registration
     
     def count_event_registrations(
@@ -241,21 +331,21 @@ class RegistrationRepository:
             Registration.status == status
         ).count()
     
-    def get_registrations_needing_reminder(self, event_date) -> List[Registration]:
+    def get_registrations_needing_reminder(self, event_date) -> Iterator[Registration]:
         """
-        Get registrations that need reminders sent.
+        Stream registrations that need reminders sent.
+        
+        Rows are fetched in batches from a server-side cursor rather than
+        loaded into one list, so memory stays flat for large days.
         
         Args:
             event_date: Date to filter events
             
         Returns:
-            List[Registration]: List of registrations
+            Iterator[Registration]: Registrations, fetched in batches
         """
-        from app.models.event import Event
-        
         return self.db.query(Registration).join(Event).filter(
             Event.date == event_date,
             Registration.status == RegistrationStatus.CONFIRMED,
             Registration.reminder_sent == False
-        ).all()
-
+        ).yield_per(_REMINDER_BATCH)
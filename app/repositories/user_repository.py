@@ -2,12 +2,23 @@
 User repository for database operations.
 Handles all database interactions for User model.
 """
-from typing import Optional
+from typing import Optional, List
+from datetime import datetime
+from sqlalchemy import insert, update, select, bindparam
 from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import set_committed_value
 from sqlalchemy.exc import IntegrityError
+from app.core.database import strict_loading
 from app.models.user import User, UserRole
 from app.core.security import get_password_hash
-import uuid
+from app.core.types import new_id
+
+# Constant statements so hot lookups reuse SQLAlchemy's compiled-SQL cache entry
+_GET_BY_ID = select(User).where(User.id == bindparam("user_id"))
+_GET_BY_EMAIL = select(User).where(User.email == bindparam("email"))
+
+# Columns UserRepository.update() may write (updated_at is set by the database)
+_UPDATABLE = frozenset(User.__table__.columns.keys()) - {"id", "created_at", "updated_at"}
 
 
 class UserRepository:
@@ -22,29 +33,40 @@ class UserRepository:
         """
         self.db = db
     
-    def get_by_id(self, user_id: str) -> Optional[User]:
+    def get_by_id(self, user_id: str, strict: Optional[bool] = None) -> Optional[User]:
         """
         Get user by ID.
         
         Args:
             user_id: User ID
+            strict: Raise on access to relationships (organized_events,
+                approval_requests, ...) (default: DATABASE_STRICT_LOADING)
             
         Returns:
             Optional[User]: User if found, None otherwise
         """
-        return self.db.query(User).filter(User.id == user_id).first()
+        return self._one(_GET_BY_ID, {"user_id": user_id}, strict)
     
-    def get_by_email(self, email: str) -> Optional[User]:
+    def get_by_email(self, email: str, strict: Optional[bool] = None) -> Optional[User]:
         """
-        Get user by email address.
+        Get user by email address (case-insensitive, matched by the column type).
         
         Args:
             email: User email
+            strict: Raise on access to relationships (default:
+                DATABASE_STRICT_LOADING)
             
         Returns:
             Optional[User]: User if found, None otherwise
         """
-        return self.db.query(User).filter(User.email == email.lower()).first()
+        return self._one(_GET_BY_EMAIL, {"email": email}, strict)
+    
+    def _one(self, statement, params: dict, strict: Optional[bool]) -> Optional[User]:
+        """Run a single-user lookup statement, adding the strict-loading guard."""
+        options = strict_loading(strict)
+        if options:
+            statement = statement.options(*options)
+        return self.db.execute(statement, params).scalar_one_or_none()
     
     def create(
         self,
@@ -72,15 +94,11 @@ class UserRepository:
         Raises:
             IntegrityError: If email already exists
         """
-        # Generate UUID for user ID
-        user_id = str(uuid.uuid4())
-        
         # Hash password
         hashed_password = get_password_hash(password)
         
         # Create user
         user = User(
-            id=user_id,
             email=email.lower(),
             password=hashed_password,
             name=name,
@@ -99,24 +117,74 @@ class UserRepository:
             self.db.rollback()
             raise
     
+    def create_bulk(self, rows: List[dict]) -> List[str]:
+        """
+        Create many users in one batched INSERT and a single commit.
+        
+        Meant for seeding and imports: passwords are hashed up front with the
+        cheaper BCRYPT_ROUNDS_BULK cost factor, before the transaction starts.
+        
+        Args:
+            rows: Dicts with email, password (plain text) and name, and
+                optionally role, department, phone, graduation_year and
+                is_approved (defaults as in create())
+            
+        Returns:
+            List[str]: IDs of the created users, in input order
+            
+        Raises:
+            IntegrityError: If an email already exists
+        """
+        if not rows:
+            return []
+        values = []
+        for row in rows:
+            role = row.get("role", UserRole.STUDENT)
+            values.append({
+                "id": new_id(),
+                "email": row["email"].lower(),
+                "password": get_password_hash(row["password"], bulk=True),
+                "name": row["name"],
+                "role": role,
+                "department": row.get("department"),
+                "phone": row.get("phone"),
+                "graduation_year": row.get("graduation_year"),
+                "is_approved": row.get(
+                    "is_approved", role == UserRole.STUDENT or role == UserRole.ADMIN
+                ),
+                "is_active": True,
+            })
+        
+        try:
+            self.db.execute(insert(User), values)
+            self.db.commit()
+            return [value["id"] for value in values]
+        except IntegrityError:
+            self.db.rollback()
+            raise
+    
     def update(self, user: User, **kwargs) -> User:
         """
-        Update user fields.
+        Update user fields in a single UPDATE statement.
         
         Args:
             user: User to update
-            **kwargs: Fields to update
+            **kwargs: Fields to update (unknown fields are ignored)
             
         Returns:
             User: Updated user
+            
+        Raises:
+            IntegrityError: If the new email already exists
         """
-        for key, value in kwargs.items():
-            if hasattr(user, key):
-                setattr(user, key, value)
-        
-        self.db.commit()
-        self.db.refresh(user)
-        return user
+        updates = {key: value for key, value in kwargs.items() if key in _UPDATABLE}
+        if not updates:
+            return user
+        try:
+            return self._set_columns(user, **updates)
+        except IntegrityError:
+            self.db.rollback()
+            raise
     
     def update_last_login(self, user: User) -> User:
         """
@@ -128,11 +196,7 @@ class UserRepository:
         Returns:
             User: Updated user
         """
-        from datetime import datetime
-        user.last_login = datetime.utcnow()
-        self.db.commit()
-        self.db.refresh(user)
-        return user
+        return self._set_columns(user, last_login=datetime.utcnow())
     
     def approve_organizer(self, user: User) -> User:
         """
@@ -144,10 +208,7 @@ class UserRepository:
         Returns:
             User: Approved user
         """
-        user.is_approved = True
-        self.db.commit()
-        self.db.refresh(user)
-        return user
+        return self._set_columns(user, is_approved=True)
     
     def deactivate(self, user: User) -> User:
         """
@@ -159,10 +220,7 @@ class UserRepository:
         Returns:
             User: Deactivated user
         """
-        user.is_active = False
-        self.db.commit()
-        self.db.refresh(user)
-        return user
+        return self._set_columns(user, is_active=False)
     
     def activate(self, user: User) -> User:
         """
@@ -174,7 +232,31 @@ class UserRepository:
         Returns:
             User: Activated user
         """
-        user.is_active = True
+        return self._set_columns(user, is_active=True)
+    
+    def _set_columns(self, user: User, **values) -> User:
+        """
+        Write column values in one UPDATE ... RETURNING and commit.
+        
+        The in-memory user is brought up to date from the statement (the new
+        values plus the server-side updated_at) instead of a reload SELECT.
+        
+        Args:
+            user: User to update
+            **values: Column values to set
+            
+        Returns:
+            User: Updated user
+        """
+        updated_at = self.db.execute(
+            update(User)
+            .where(User.id == user.id)
+            .values(**values)
+            .returning(User.updated_at)
+            .execution_options(synchronize_session=False)
+        ).scalar_one()
         self.db.commit()
-        self.db.refresh(user)
+        for key, value in values.items():
+            set_committed_value(user, key, value)
+        set_committed_value(user, "updated_at", updated_at)
         return user
@@ -3,10 +3,23 @@ Venue repository for database operations.
 Handles all database interactions for Venue model.
 """
 from typing import Optional, List
-from sqlalchemy.orm import Session
+from sqlalchemy import insert, update, not_
+from sqlalchemy.orm import Session, make_transient_to_detached
+from sqlalchemy.orm.attributes import set_committed_value
 from sqlalchemy.exc import IntegrityError
 from app.models.venue import Venue
-import uuid
+from app.utils.cache import TTLCache, clear_on_commit
+from app.core.types import new_id
+
+# Venue lists back every event-creation form and change rarely. Column
+# snapshots are cached per process for five minutes and dropped whenever a
+# write to a venue row commits (and after bulk inserts, which bypass the ORM).
+_venue_cache = TTLCache(ttl=300, maxsize=2)
+_COLUMNS = tuple(column.key for column in Venue.__table__.columns)
+clear_on_commit(Venue, _venue_cache)
+
+# Columns VenueRepository.update() may write (updated_at is set by the database)
+_UPDATABLE = frozenset(_COLUMNS) - {"id", "created_at", "updated_at"}
 
 
 class VenueRepository:
@@ -35,7 +48,7 @@ class VenueRepository:
     
     def get_all(self, active_only: bool = True) -> List[Venue]:
         """
-        Get all venues.
+        Get all venues (cached ~5 minutes, dropped on writes).
         
         Args:
             active_only: If True, return only active venues
@@ -43,10 +56,33 @@ class VenueRepository:
         Returns:
             List[Venue]: List of venues
         """
+        rows = _venue_cache.get(active_only)
+        if rows is not None:
+            return [self._attach(row) for row in rows]
+        
         query = self.db.query(Venue)
         if active_only:
             query = query.filter(Venue.is_active == True)
-        return query.order_by(Venue.name).all()
+        venues = query.order_by(Venue.name).all()
+        _venue_cache.set(
+            active_only,
+            tuple({key: getattr(venue, key) for key in _COLUMNS} for venue in venues)
+        )
+        return venues
+    
+    def _attach(self, row: dict) -> Venue:
+        """
+        Rebuild a cached venue and attach it to this session without a query.
+        
+        Args:
+            row: Column snapshot from the cache
+            
+        Returns:
+            Venue: Instance tracked by the current session
+        """
+        venue = Venue(**row)
+        make_transient_to_detached(venue)
+        return self.db.merge(venue, load=False)
     
     def create(
         self,
@@ -67,10 +103,7 @@ class VenueRepository:
         Returns:
             Venue: Created venue
         """
-        venue_id = str(uuid.uuid4())
-        
         venue = Venue(
-            id=venue_id,
             name=name,
             building=building,
             capacity=capacity,
@@ -87,37 +120,104 @@ class VenueRepository:
             self.db.rollback()
             raise
     
+    def create_bulk(self, rows: List[dict]) -> List[str]:
+        """
+        Create many venues in one batched INSERT and a single commit.
+        
+        Args:
+            rows: Dicts with name and building, and optionally capacity and
+                facilities
+            
+        Returns:
+            List[str]: IDs of the created venues, in input order
+        """
+        if not rows:
+            return []
+        values = [
+            {
+                "id": new_id(),
+                "name": row["name"],
+                "building": row["building"],
+                "capacity": row.get("capacity"),
+                "facilities": row.get("facilities") or [],
+                "is_active": True,
+            }
+            for row in rows
+        ]
+        
+        try:
+            self.db.execute(insert(Venue), values)
+            self.db.commit()
+            _venue_cache.clear()
+            return [value["id"] for value in values]
+        except IntegrityError:
+            self.db.rollback()
+            raise
+    
     def update(self, venue: Venue, **kwargs) -> Venue:
         """
         Update venue fields.
         
+        Issues a single UPDATE ... RETURNING updated_at and applies the new
+        values to the instance as committed state, bypassing per-attribute
+        change tracking and the reload.
+        
         Args:
             venue: Venue to update
-            **kwargs: Fields to update
+            **kwargs: Fields to update (unknown fields are ignored)
             
         Returns:
             Venue: Updated venue
         """
-        for key, value in kwargs.items():
-            if hasattr(venue, key) and key != 'id':
-                setattr(venue, key, value)
+        updates = {key: value for key, value in kwargs.items() if key in _UPDATABLE}
+        if not updates:
+            return venue
         
-        self.db.commit()
-        self.db.refresh(venue)
+        try:
+            updated_at = self.db.execute(
+                update(Venue)
+                .where(Venue.id == venue.id)
+                .values(**updates)
+                .returning(Venue.updated_at)
+                .execution_options(synchronize_session=False)
+            ).scalar_one()
+            self.db.commit()
+        except IntegrityError:
+            self.db.rollback()
+            raise
+        
+        # Core UPDATEs bypass the flush listeners
+        _venue_cache.clear()
+        for key, value in updates.items():
+            set_committed_value(venue, key, value)
+        set_committed_value(venue, "updated_at", updated_at)
         return venue
     
     def toggle_active(self, venue: Venue) -> Venue:
         """
         Toggle venue active status.
         
+        The flip happens in the database (SET is_active = NOT is_active) in a
+        single UPDATE ... RETURNING, so it needs no reload and concurrent
+        toggles cannot both write the same stale value.
+        
         Args:
             venue: Venue to toggle
             
         Returns:
             Venue: Updated venue
         """
-        venue.is_active = not venue.is_active
+        is_active, updated_at = self.db.execute(
+            update(Venue)
+            .where(Venue.id == venue.id)
+            .values(is_active=not_(Venue.is_active))
+            .returning(Venue.is_active, Venue.updated_at)
+            .execution_options(synchronize_session=False)
+        ).one()
         self.db.commit()
-        self.db.refresh(venue)
+        # Core UPDATEs bypass the flush listeners
+        _venue_cache.clear()
+        set_committed_value(venue, "is_active", is_active)
+        set_committed_value(venue, "updated_at", updated_at)
         return venue
 
@@ -2,11 +2,32 @@
 Waitlist repository for database operations.
 Handles all database interactions for WaitlistEntry model.
 """
-from typing import Optional, List
-from sqlalchemy.orm import Session, joinedload
+from typing import Optional, List, Dict
+from sqlalchemy import select, update, insert, literal, func, bindparam
+from sqlalchemy.orm import Session, joinedload, selectinload, undefer
+from sqlalchemy.orm.attributes import set_committed_value
 from sqlalchemy.exc import IntegrityError
+from app.core.database import strict_loading
+from app.models.event import Event
+from app.models.user import User
 from app.models.waitlist import WaitlistEntry, NotificationPreference
-import uuid
+from app.core.types import new_id
+
+# Constant statements so hot lookups reuse SQLAlchemy's compiled-SQL cache entry
+_GET_BY_USER_AND_EVENT = select(WaitlistEntry).where(
+    WaitlistEntry.user_id == bindparam("user_id"),
+    WaitlistEntry.event_id == bindparam("event_id")
+)
+_GET_FIRST_IN_LINE = (
+    select(WaitlistEntry)
+    .where(WaitlistEntry.event_id == bindparam("event_id"))
+    .order_by(WaitlistEntry.position)
+    .limit(1)
+    .options(undefer(WaitlistEntry.queue_position))
+)
+
+# Event columns read by WaitlistEntry.event_preview()
+_EVENT_PREVIEW_COLUMNS = (Event.id, Event.title, Event.date, Event.capacity, Event.registered_count)
 
 
 class WaitlistRepository:
@@ -21,13 +42,20 @@ class WaitlistRepository:
         """
         self.db = db
     
-    def get_by_id(self, waitlist_id: str, include_relations: bool = True) -> Optional[WaitlistEntry]:
+    def get_by_id(
+        self,
+        waitlist_id: str,
+        include_relations: bool = True,
+        strict: Optional[bool] = None
+    ) -> Optional[WaitlistEntry]:
         """
         Get waitlist entry by ID.
         
         Args:
             waitlist_id: Waitlist entry ID
             include_relations: Whether to eagerly load related objects
+            strict: Raise on access to relationships not loaded here
+                (default: DATABASE_STRICT_LOADING)
             
         Returns:
             Optional[WaitlistEntry]: Waitlist entry if found, None otherwise
@@ -38,7 +66,7 @@ class WaitlistRepository:
                 joinedload(WaitlistEntry.user),
                 joinedload(WaitlistEntry.event)
             )
-        return query.first()
+        return query.options(*strict_loading(strict)).first()
     
     def get_by_user_and_event(
         self,
@@ -55,17 +83,27 @@ class WaitlistRepository:
         Returns:
             Optional[WaitlistEntry]: Waitlist entry if found, None otherwise
         """
-        return self.db.query(WaitlistEntry).filter(
-            WaitlistEntry.user_id == user_id,
-            WaitlistEntry.event_id == event_id
-        ).first()
+        return self.db.execute(
+            _GET_BY_USER_AND_EVENT, {"user_id": user_id, "event_id": event_id}
+        ).scalar_one_or_none()
     
-    def get_user_waitlist_entries(self, user_id: str) -> List[WaitlistEntry]:
+    def get_user_waitlist_entries(
+        self,
+        user_id: str,
+        strict: Optional[bool] = None
+    ) -> List[WaitlistEntry]:
         """
         Get all waitlist entries for a user.
         
+        Events are loaded with one IN query, limited to the columns
+        event_preview() falls back to for entries without a copied preview,
+        so such entries never trigger a lazy load each. Each entry's place
+        in line is loaded with it (entries are for different events).
+        
         Args:
             user_id: User ID
+            strict: Raise on access to relationships not loaded here
+                (default: DATABASE_STRICT_LOADING)
             
         Returns:
             List[WaitlistEntry]: List of waitlist entries
@@ -73,105 +111,186 @@ class WaitlistRepository:
         return self.db.query(WaitlistEntry).filter(
             WaitlistEntry.user_id == user_id
         ).options(
-            joinedload(WaitlistEntry.event)
+            selectinload(WaitlistEntry.event).load_only(*_EVENT_PREVIEW_COLUMNS),
+            undefer(WaitlistEntry.queue_position),
+            *strict_loading(strict)
         ).order_by(WaitlistEntry.joined_at).all()
     
-    def get_event_waitlist(self, event_id: str) -> List[WaitlistEntry]:
+    def get_event_waitlist(
+        self,
+        event_id: str,
+        strict: Optional[bool] = None
+    ) -> List[WaitlistEntry]:
         """
         Get waitlist for an event, ordered by position.
         
+        The whole line is fetched in order, so each entry's place in line is
+        its index rather than a per-row count.
+        
         Args:
             event_id: Event ID
+            strict: Raise on access to relationships not loaded here
+                (default: DATABASE_STRICT_LOADING)
             
         Returns:
             List[WaitlistEntry]: List of waitlist entries ordered by position
         """
-        return self.db.query(WaitlistEntry).filter(
+        entries = self.db.query(WaitlistEntry).filter(
             WaitlistEntry.event_id == event_id
         ).options(
-            joinedload(WaitlistEntry.user)
+            selectinload(WaitlistEntry.user),
+            *strict_loading(strict)
         ).order_by(WaitlistEntry.position).all()
+        for place, entry in enumerate(entries, start=1):
+            set_committed_value(entry, "queue_position", place)
+        return entries
     
-    def get_next_position(self, event_id: str) -> int:
+    def page_with_user_preview(
+        self,
+        event_id: str,
+        page: int = 1,
+        limit: Optional[int] = None
+    ) -> List[Dict]:
         """
-        Get the next available position for an event's waitlist.
+        Get an event's waitlist in FIFO order with each user's name and email.
+        
+        Runs two column-only queries (entries, then users by IN) and stitches
+        the results in Python, without loading ORM instances.
         
         Args:
             event_id: Event ID
+            page: Page number (1-indexed), used when limit is set
+            limit: Page size, or None for the whole waitlist
             
         Returns:
-            int: Next position number
+            List[Dict]: Entries with id, userId, position, name, email,
+                joinedAt and notificationPreference
         """
-        from sqlalchemy import func
-        
-        max_position = self.db.query(
-            func.max(WaitlistEntry.position)
-        ).filter(
+        offset = (page - 1) * limit if limit else 0
+        stmt = select(
+            WaitlistEntry.id,
+            WaitlistEntry.user_id,
+            WaitlistEntry.joined_at,
+            WaitlistEntry.notification_preference
+        ).where(
             WaitlistEntry.event_id == event_id
-        ).scalar()
+        ).order_by(WaitlistEntry.position)
+        if limit:
+            stmt = stmt.offset(offset).limit(limit)
+        rows = self.db.execute(stmt).all()
+        if not rows:
+            return []
         
-        return (max_position or 0) + 1
+        users = {
+            user_id: (name, email)
+            for user_id, name, email in self.db.execute(
+                select(User.id, User.name, User.email).where(
+                    User.id.in_({row.user_id for row in rows})
+                )
+            )
+        }
+        
+        unknown = ("Unknown", "Unknown")
+        result = []
+        # Rows are in FIFO order, so place in line follows from the offset
+        for place, row in enumerate(rows, start=offset + 1):
+            name, email = users.get(row.user_id, unknown)
+            result.append({
+                "id": row.id,
+                "userId": row.user_id,
+                "position": place,
+                "name": name,
+                "email": email,
+                "joinedAt": row.joined_at.isoformat() if row.joined_at else None,
+                "notificationPreference": row.notification_preference.value
+            })
+        return result
     
     def create(
         self,
         user_id: str,
-        event_id: str,
+        event: Event,
         notification_preference: NotificationPreference = NotificationPreference.EMAIL
     ) -> WaitlistEntry:
         """
-        Create a new waitlist entry.
+        Create a new waitlist entry at the back of the line.
+        
+        The position is computed inside the INSERT (INSERT ... SELECT
+        max(position) + 1 ... RETURNING id) while the event row is locked, so
+        concurrent joins cannot take the same position.
         
         Args:
             user_id: User ID
-            event_id: Event ID
+            event: Event being joined (its preview fields are copied)
             notification_preference: Notification preference
             
         Returns:
             WaitlistEntry: Created waitlist entry
         """
-        waitlist_id = str(uuid.uuid4())
-        position = self.get_next_position(event_id)
-        
-        entry = WaitlistEntry(
-            id=waitlist_id,
-            user_id=user_id,
-            event_id=event_id,
-            position=position,
-            notification_preference=notification_preference
-        )
+        values = {
+            WaitlistEntry.id: new_id(),
+            WaitlistEntry.user_id: user_id,
+            WaitlistEntry.event_id: event.id,
+            WaitlistEntry.notification_preference: notification_preference,
+            WaitlistEntry.event_title: event.title,
+            WaitlistEntry.event_date: event.date,
+            WaitlistEntry.event_capacity: event.capacity,
+        }
+        next_position = select(
+            *(literal(value, column.type) for column, value in values.items()),
+            func.coalesce(func.max(WaitlistEntry.position), 0) + 1
+        ).where(WaitlistEntry.event_id == event.id)
+        # RETURNING only the key; the entry is then loaded together with its
+        # place in line (queue_position is not a table column to return)
+        stmt = insert(WaitlistEntry).from_select(
+            [*values, WaitlistEntry.position], next_position
+        ).returning(WaitlistEntry.id)
         
         try:
-            self.db.add(entry)
+            # Serialize joins per event (no-op on SQLite, which locks the database)
+            self.db.execute(select(Event.id).where(Event.id == event.id).with_for_update())
+            entry_id = self.db.execute(stmt).scalar_one()
             self.db.commit()
-            self.db.refresh(entry)
-            return entry
+            return self.db.get(
+                WaitlistEntry, entry_id, options=[undefer(WaitlistEntry.queue_position)]
+            )
         except IntegrityError:
             self.db.rollback()
             raise
     
+    def sync_event_preview(self, event: Event) -> None:
+        """
+        Refresh the copied event preview on all of an event's waitlist entries.
+        
+        Args:
+            event: Event whose title, date or capacity changed
+        """
+        self.db.execute(
+            update(WaitlistEntry)
+            .where(WaitlistEntry.event_id == event.id)
+            .values(
+                event_title=event.title,
+                event_date=event.date,
+                event_capacity=event.capacity
+            )
+        )
+        self.db.commit()
+    
     def remove(self, entry: WaitlistEntry) -> None:
         """
-        Remove a waitlist entry and update positions.
+        Remove a waitlist entry.
+        
+        Entries behind it keep their sequence numbers; their place in line
+        (queue_position) is derived on read, so nothing is renumbered. The
+        DELETE is flushed but not committed: the caller commits, so the
+        removal and the event's waitlist_count decrement share one
+        transaction.
         
         Args:
             entry: Waitlist entry to remove
         """
-        event_id = entry.event_id
-        position = entry.position
-        
-        # Delete the entry
         self.db.delete(entry)
-        self.db.commit()
-        
-        # Update positions for remaining entries
-        self.db.query(WaitlistEntry).filter(
-            WaitlistEntry.event_id == event_id,
-            WaitlistEntry.position > position
-        ).update(
-            {WaitlistEntry.position: WaitlistEntry.position - 1},
-            synchronize_session=False
-        )
-        self.db.commit()
+        self.db.flush()
     
     def get_first_in_line(self, event_id: str) -> Optional[WaitlistEntry]:
         """
@@ -183,21 +302,23 @@ class WaitlistRepository:
         Returns:
             Optional[WaitlistEntry]: First waitlist entry or None
         """
-        return self.db.query(WaitlistEntry).filter(
-            WaitlistEntry.event_id == event_id
-        ).order_by(WaitlistEntry.position).first()
+        return self.db.execute(_GET_FIRST_IN_LINE, {"event_id": event_id}).scalar_one_or_none()
     
     def count_event_waitlist(self, event_id: str) -> int:
         """
         Count waitlist entries for an event.
         
+        Reads the event's denormalized waitlist_count (kept in step by the
+        services through EventRepository.increment/decrement_waitlist_count)
+        instead of counting waitlist rows.
+        
         Args:
             event_id: Event ID
             
         Returns:
             int: Count of waitlist entries
         """
-        return self.db.query(WaitlistEntry).filter(
-            WaitlistEntry.event_id == event_id
-        ).count()
+        return self.db.execute(
+            select(Event.waitlist_count).where(Event.id == event_id)
+        ).scalar() or 0
 
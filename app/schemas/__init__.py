@@ -36,6 +36,7 @@ from app.schemas.venue import (
 # Event schemas
 from app.schemas.event import (
     EventBase,
+    EventWritable,
     EventCreate,
     EventUpdate,
     EventResponse,
@@ -52,6 +53,7 @@ from app.schemas.event import (
 # Registration schemas
 from app.schemas.registration import (
     GuestInfo,
+    GuestOut,
     RegistrationCreate,
     RegistrationResponse,
     RegistrationCreateResponse,
@@ -110,6 +112,7 @@ __all__ = [
     "VenuesResponse",
     # Event
     "EventBase",
+    "EventWritable",
     "EventCreate",
     "EventUpdate",
     "EventResponse",
@@ -123,6 +126,7 @@ __all__ = [
     "CategoryInfo",
     # Registration
     "GuestInfo",
+    "GuestOut",
     "RegistrationCreate",
     "RegistrationResponse",
     "RegistrationCreateResponse",
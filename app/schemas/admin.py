@@ -2,9 +2,10 @@
 Pydantic schemas for admin requests and responses.
 Provides data validation and serialization for admin endpoints.
 """
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ConfigDict
 from typing import Optional, List, Dict, Any
 from datetime import datetime
+from app.utils.serialization import iso
 
 
 # ============================================================================
@@ -25,14 +26,39 @@ class OrganizerApprovalResponse(BaseModel):
     reviewedAt: Optional[str] = None
     notes: Optional[str] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
+    @classmethod
+    def from_orm_fast(cls, request) -> "OrganizerApprovalResponse":
+        """
+        Build from a trusted OrganizerApprovalRequest row, skipping validation.
+
+        Args:
+            request: Approval request with user loaded
+
+        Returns:
+            OrganizerApprovalResponse: Response model
+        """
+        user = request.user
+        return cls.model_construct(
+            id=request.id,
+            userId=request.user_id,
+            name=user.name if user else "Unknown",
+            email=user.email if user else "Unknown",
+            department=user.department if user else None,
+            reason=request.reason,
+            requestedAt=iso(request.requested_at),
+            status=request.status.value,
+            reviewedBy=request.reviewed_by,
+            reviewedAt=iso(request.reviewed_at),
+            notes=request.notes
+        )
 
 
 class OrganizerApprovalsResponse(BaseModel):
     """Schema for list of organizer approvals."""
     success: bool = True
-    requests: List[OrganizerApprovalResponse]
+    requests: list[OrganizerApprovalResponse]
 
 
 class ApprovalActionRequest(BaseModel):
@@ -76,8 +102,7 @@ class EventApprovalResponse(BaseModel):
     submittedAt: str
     status: str
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class EventApprovalsResponse(BaseModel):
@@ -116,8 +141,7 @@ class AuditLogResponse(BaseModel):
     userAgent: Optional[str] = None
     metadata: Optional[Dict[str, Any]] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class PaginationInfo(BaseModel):
@@ -133,6 +157,7 @@ class AuditLogsResponse(BaseModel):
     success: bool = True
     logs: List[AuditLogResponse]
     pagination: PaginationInfo
+    nextCursor: Optional[str] = None
 
 
 # ============================================================================
@@ -3,7 +3,7 @@ Pydantic schemas for audit log responses.
 Provides data validation and serialization for audit log endpoints.
 Note: Audit logs are read-only, no create/update schemas needed.
 """
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from typing import Optional
 
 
@@ -33,8 +33,7 @@ class AuditLogResponse(BaseModel):
     ipAddress: Optional[str] = None
     userAgent: Optional[str] = None
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class PaginationInfo(BaseModel):
@@ -2,22 +2,26 @@
 Pydantic schemas for authentication requests and responses.
 Provides data validation and serialization for auth endpoints.
 """
-from pydantic import BaseModel, EmailStr, Field, validator
+from pydantic import BaseModel, EmailStr, Field, field_validator, ConfigDict
 from typing import Optional
 from datetime import datetime
 from app.models.user import UserRole
 
+# Accepted UMD email domains (str.endswith takes the whole tuple at once)
+_UMD_SUFFIXES = ('@umd.edu', '@terpmail.umd.edu')
+
 
 class UserBase(BaseModel):
     """Base user schema with common fields."""
     email: EmailStr
     name: str = Field(..., min_length=2, max_length=255)
     
-    @validator('email')
+    @field_validator('email')
+    @classmethod
     def validate_umd_email(cls, v):
         """Ensure email is a UMD email address."""
         email_lower = v.lower()
-        if not (email_lower.endswith('@umd.edu') or email_lower.endswith('@terpmail.umd.edu')):
+        if not email_lower.endswith(_UMD_SUFFIXES):
             raise ValueError('Email must be a valid UMD email address (@umd.edu or @terpmail.umd.edu)')
         return email_lower
 
@@ -53,8 +57,7 @@ class UserResponse(BaseModel):
     updatedAt: Optional[str] = None
     lastLogin: Optional[str] = None
     
-    class Config:
-        from_attributes = True  # Allows conversion from ORM models
+    model_config = ConfigDict(from_attributes=True)
 
 
 class TokenResponse(BaseModel):
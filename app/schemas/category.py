@@ -2,7 +2,7 @@
 Pydantic schemas for category requests and responses.
 Provides data validation and serialization for category endpoints.
 """
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ConfigDict
 from typing import Optional
 
 
@@ -39,8 +39,7 @@ class CategoryResponse(BaseModel):
     createdAt: Optional[str] = None
     updatedAt: Optional[str] = None
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class CategoriesResponse(BaseModel):
@@ -2,9 +2,58 @@
 Pydantic schemas for event requests and responses.
 Provides data validation and serialization for event endpoints.
 """
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field, field_validator, ValidationInfo, ConfigDict
 from typing import Optional, List
-from datetime import date, time
+from datetime import date
+from functools import lru_cache
+from time import monotonic
+import re
+from app.core.fastjson import hhmm
+from app.utils.serialization import iso
+
+# Config for the event response models: immutable, built from ORM rows
+_ORM_CONFIG = ConfigDict(from_attributes=True, frozen=True)
+
+# Fixed wire formats, matched once instead of building date/time objects
+_DATE_RE = re.compile(r"^(\d{4})-(\d{2})-(\d{2})$")
+_TIME_RE = re.compile(r"^([01]\d|2[0-3]):([0-5]\d)(?::([0-5]\d))?$")
+
+# Upper bound on tags per event, checked by the core validator
+_MAX_TAGS = 20
+
+
+@lru_cache(maxsize=1)
+def _today_for(minute: int) -> tuple:
+    """Today's (year, month, day), computed once per monotonic minute."""
+    today = date.today()
+    return today.year, today.month, today.day
+
+
+def _today() -> tuple:
+    """
+    Today's date as a (year, month, day) tuple, refreshed every minute.
+    
+    Returns:
+        tuple: (year, month, day)
+    """
+    return _today_for(int(monotonic() // 60))
+
+
+def _time_tuple(value: str) -> Optional[tuple]:
+    """
+    Parse an HH:MM[:SS] string into a comparable (hour, minute, second) tuple.
+    
+    Args:
+        value: Time string
+        
+    Returns:
+        Optional[tuple]: Parsed tuple, or None if the format is invalid
+    """
+    m = _TIME_RE.match(value)
+    if m is None:
+        return None
+    hour, minute, second = m.groups()
+    return int(hour), int(minute), int(second or 0)
 
 
 class EventBase(BaseModel):
@@ -16,51 +65,59 @@ class EventBase(BaseModel):
     location: str = Field(..., min_length=5, max_length=500)
     capacity: int = Field(..., ge=1, le=5000, description="Maximum capacity (1-5000)")
     imageUrl: Optional[str] = Field(None, max_length=500)
-    tags: Optional[List[str]] = Field(default_factory=list)
+    tags: Optional[List[str]] = Field(default_factory=list, max_length=_MAX_TAGS)
 
 
-class EventCreate(EventBase):
-    """Schema for creating a new event."""
+class EventWritable(EventBase):
+    """
+    Schema for creating or updating an event.
+    
+    One model serves both endpoints so a single validator/serializer pair is
+    built; status is only applied by updates.
+    """
     date: str = Field(..., description="Event date in YYYY-MM-DD format")
     startTime: str = Field(..., description="Start time in HH:MM format (24-hour)")
     endTime: str = Field(..., description="End time in HH:MM format (24-hour)")
+    status: Optional[str] = Field(None, description="Event status (draft, pending, published, cancelled); updates only")
     
-    @validator('date')
+    @field_validator('date')
+    @classmethod
     def validate_date(cls, v):
         """Validate date format and ensure it's in the future."""
+        m = _DATE_RE.match(v)
+        if m is None:
+            raise ValueError('Date must be in YYYY-MM-DD format')
+        parts = tuple(map(int, m.groups()))
         try:
-            event_date = date.fromisoformat(v)
-            if event_date < date.today():
-                raise ValueError('Event date must be in the future')
-            return v
-        except ValueError as e:
-            if 'future' in str(e):
-                raise
+            date(*parts)
+        except ValueError:
             raise ValueError('Date must be in YYYY-MM-DD format')
+        if parts < _today():
+            raise ValueError('Event date must be in the future')
+        return v
     
-    @validator('startTime', 'endTime')
+    @field_validator('startTime')
+    @classmethod
     def validate_time(cls, v):
         """Validate time format."""
-        try:
-            time.fromisoformat(v)
-            return v
-        except ValueError:
+        if _TIME_RE.match(v) is None:
             raise ValueError('Time must be in HH:MM format (24-hour)')
+        return v
     
-    @validator('endTime')
-    def validate_end_time(cls, v, values):
-        """Ensure end time is after start time."""
-        if 'startTime' in values:
-            start = time.fromisoformat(values['startTime'])
-            end = time.fromisoformat(v)
-            if end <= start:
-                raise ValueError('End time must be after start time')
+    @field_validator('endTime')
+    @classmethod
+    def validate_end_time(cls, v, info: ValidationInfo):
+        """Validate time format and ensure end time is after start time."""
+        end = _time_tuple(v)
+        if end is None:
+            raise ValueError('Time must be in HH:MM format (24-hour)')
+        if 'startTime' in info.data and end <= _time_tuple(info.data['startTime']):
+            raise ValueError('End time must be after start time')
         return v
 
 
-class EventUpdate(EventCreate):
-    """Schema for updating an event - uses same validation as EventCreate plus status."""
-    status: Optional[str] = Field(None, description="Event status (draft, pending, published, cancelled)")
+EventCreate = EventWritable
+EventUpdate = EventWritable
 
 
 class OrganizerInfo(BaseModel):
@@ -69,6 +126,16 @@ class OrganizerInfo(BaseModel):
     name: str
     email: str
     department: Optional[str] = None
+    
+    @classmethod
+    def from_orm_fast(cls, user) -> "OrganizerInfo":
+        """Build from a trusted User row without validation."""
+        return cls.model_construct(
+            id=user.id,
+            name=user.name,
+            email=user.email,
+            department=user.department
+        )
 
 
 class CategoryInfo(BaseModel):
@@ -77,15 +144,23 @@ class CategoryInfo(BaseModel):
     name: str
     slug: str
     color: str
+    
+    @classmethod
+    def from_orm_fast(cls, category) -> "CategoryInfo":
+        """Build from a trusted Category row without validation."""
+        return cls.model_construct(
+            id=category.id,
+            name=category.name,
+            slug=category.slug,
+            color=category.color
+        )
 
 
-class EventResponse(BaseModel):
-    """Schema for event data in responses."""
+class _EventCommon(BaseModel):
+    """Fields shared by the event detail and list response schemas."""
     id: str
     title: str
     description: str
-    categoryId: str
-    organizerId: str
     date: str
     startTime: str
     endTime: str
@@ -94,52 +169,80 @@ class EventResponse(BaseModel):
     capacity: int
     registeredCount: int
     waitlistCount: int
-    remainingCapacity: int
     status: str
     imageUrl: Optional[str] = None
-    tags: List[str] = []
+    tags: list[str] = []
     isFeatured: bool
     createdAt: Optional[str] = None
-    updatedAt: Optional[str] = None
     publishedAt: Optional[str] = None
+    # category_id and organizer_id are non-null foreign keys, so both are
+    # always present
+    category: CategoryInfo
+    organizer: OrganizerInfo
+    
+    model_config = _ORM_CONFIG
+
+
+class EventResponse(_EventCommon):
+    """Schema for event data in responses."""
+    categoryId: str
+    organizerId: str
+    remainingCapacity: int
+    updatedAt: Optional[str] = None
     cancelledAt: Optional[str] = None
-    category: Optional[CategoryInfo] = None
-    organizer: Optional[OrganizerInfo] = None
     
-    class Config:
-        from_attributes = True
+    @classmethod
+    def from_orm_fast(cls, event) -> "EventResponse":
+        """
+        Build from a trusted Event row, skipping validation.
+        
+        Args:
+            event: Event with category and organizer loaded
+            
+        Returns:
+            EventResponse: Response model
+        """
+        return cls.model_construct(
+            id=event.id,
+            title=event.title,
+            description=event.description,
+            categoryId=event.category_id,
+            organizerId=event.organizer_id,
+            date=iso(event.date),
+            startTime=hhmm(event.start_time),
+            endTime=hhmm(event.end_time),
+            venue=event.venue,
+            location=event.location,
+            capacity=event.capacity,
+            registeredCount=event.registered_count,
+            waitlistCount=event.waitlist_count,
+            remainingCapacity=event.remaining_capacity,
+            status=event.status.value,
+            imageUrl=event.image_url,
+            tags=event.tags or [],
+            isFeatured=event.is_featured,
+            createdAt=iso(event.created_at),
+            updatedAt=iso(event.updated_at),
+            publishedAt=iso(event.published_at),
+            cancelledAt=iso(event.cancelled_at),
+            category=CategoryInfo.from_orm_fast(event.category),
+            organizer=OrganizerInfo.from_orm_fast(event.organizer)
+        )
 
 
-class EventListResponse(BaseModel):
+class EventListResponse(_EventCommon):
     """Schema for event with basic info in list."""
-    id: str
-    title: str
-    description: str
-    category: CategoryInfo
-    organizer: OrganizerInfo
-    date: str
-    startTime: str
-    endTime: str
-    venue: str
-    location: str
-    capacity: int
-    registeredCount: int
-    waitlistCount: int
-    status: str
-    imageUrl: Optional[str] = None
-    tags: List[str] = []
-    isFeatured: bool
-    createdAt: Optional[str] = None
-    publishedAt: Optional[str] = None
-    
-    class Config:
-        from_attributes = True
 
 
 class PaginationInfo(BaseModel):
-    """Pagination information."""
-    currentPage: int
-    totalPages: int
+    """
+    Pagination information.
+    
+    currentPage and totalPages are null for cursor-paginated responses,
+    which have no page numbers.
+    """
+    currentPage: Optional[int]
+    totalPages: Optional[int]
     totalItems: int
     itemsPerPage: int
 
@@ -147,8 +250,9 @@ class PaginationInfo(BaseModel):
 class EventsListResponse(BaseModel):
     """Schema for paginated list of events response."""
     success: bool = True
-    events: List[EventListResponse]
+    events: list[EventListResponse]
     pagination: PaginationInfo
+    nextCursor: Optional[str] = None
 
 
 class EventDetailResponse(BaseModel):
@@ -169,6 +273,7 @@ class EventStatistics(BaseModel):
 class OrganizerEventsResponse(BaseModel):
     """Schema for organizer's events response."""
     success: bool = True
-    events: List[EventResponse]
+    events: list[EventResponse]
     statistics: EventStatistics
+    nextCursor: Optional[str] = None
 
@@ -2,9 +2,12 @@
 Pydantic schemas for organizer approval requests and responses.
 Provides data validation and serialization for approval endpoints.
 """
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ConfigDict
 from typing import Optional
 
+# Config for approval responses
+_ORM_CONFIG = ConfigDict(from_attributes=True, frozen=True)
+
 
 class OrganizerApprovalCreate(BaseModel):
     """Schema for creating organizer approval request."""
@@ -43,8 +46,7 @@ class OrganizerApprovalResponse(BaseModel):
     requestedAt: str
     reviewedAt: Optional[str] = None
     
-    class Config:
-        from_attributes = True
+    model_config = _ORM_CONFIG
 
 
 class OrganizerApprovalsListResponse(BaseModel):
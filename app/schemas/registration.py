@@ -2,29 +2,64 @@
 Pydantic schemas for registration requests and responses.
 Provides data validation and serialization for registration endpoints.
 """
-from pydantic import BaseModel, EmailStr, Field, validator
-from typing import Optional, List
+from pydantic import BaseModel, Field, field_validator, ConfigDict
+from typing import Optional, List, Literal
+import re
+from app.core.fastjson import hhmm
+from app.utils.serialization import iso
+
+# Config for registration, guest and attendee responses
+_ORM_CONFIG = ConfigDict(from_attributes=True, frozen=True)
+
+# Guests must have a plain @umd.edu address; checked after lowercasing
+_UMD_EMAIL_RE = re.compile(r"[a-z0-9._%+\-]+@umd\.edu", re.ASCII)
 
 
 class GuestInfo(BaseModel):
     """Guest information."""
     name: str = Field(..., min_length=2, max_length=255)
-    email: EmailStr
+    email: str = Field(..., max_length=255)
     
-    @validator('email')
+    @field_validator('email')
+    @classmethod
     def validate_umd_email(cls, v):
-        """Ensure email is a UMD email address."""
-        if not v.lower().endswith('@umd.edu'):
+        """Ensure email is a well-formed UMD email address."""
+        email_lower = v.lower()
+        if _UMD_EMAIL_RE.fullmatch(email_lower) is None:
             raise ValueError('Guest email must be a valid UMD email address (@umd.edu)')
-        return v.lower()
+        return email_lower
+
+
+class GuestOut(BaseModel):
+    """Guest as stored on a registration, for responses."""
+    name: str
+    email: str
+    
+    model_config = _ORM_CONFIG
+    
+    @classmethod
+    def list_from_stored(cls, guests: Optional[list]) -> list["GuestOut"]:
+        """
+        Build guests from a registration's JSON column without validation.
+        
+        Args:
+            guests: Stored guest dicts (may be None)
+            
+        Returns:
+            list[GuestOut]: Guests in stored order
+        """
+        return [
+            cls.model_construct(name=g.get("name", ""), email=g.get("email", ""))
+            for g in guests or ()
+        ]
 
 
 class RegistrationCreate(BaseModel):
     """Schema for creating a new registration."""
     eventId: str
-    guests: Optional[List[GuestInfo]] = Field(default_factory=list, max_items=2, description="Maximum 2 guests")
+    guests: Optional[List[GuestInfo]] = Field(default_factory=list, max_length=2, description="Maximum 2 guests")
     sessions: Optional[List[str]] = Field(default_factory=list, description="Session IDs for multi-session events")
-    notificationPreference: Optional[str] = Field("email", pattern="^(email|sms|both|none)$")
+    notificationPreference: Optional[Literal["email", "sms", "both", "none"]] = "email"
 
 
 class EventBasicInfo(BaseModel):
@@ -36,6 +71,19 @@ class EventBasicInfo(BaseModel):
     endTime: str
     venue: str
     organizer: dict
+    
+    @classmethod
+    def from_orm_fast(cls, event) -> "EventBasicInfo":
+        """Build from a trusted Event row (organizer loaded) without validation."""
+        return cls.model_construct(
+            id=event.id,
+            title=event.title,
+            date=iso(event.date) or "",
+            startTime=hhmm(event.start_time) or "",
+            endTime=hhmm(event.end_time) or "",
+            venue=event.venue,
+            organizer={"name": event.organizer.name if event.organizer else ""}
+        )
 
 
 class RegistrationResponse(BaseModel):
@@ -49,14 +97,46 @@ class RegistrationResponse(BaseModel):
     registeredAt: str
     checkInStatus: str
     checkedInAt: Optional[str] = None
-    guests: List[dict] = []
-    sessions: List[str] = []
+    guests: list[GuestOut] = []
+    sessions: list[str] = []
     reminderSent: bool
     cancelledAt: Optional[str] = None
     event: Optional[EventBasicInfo] = None
     
-    class Config:
-        from_attributes = True
+    model_config = _ORM_CONFIG
+    
+    @classmethod
+    def from_orm_fast(
+        cls,
+        registration,
+        event: Optional[EventBasicInfo] = None
+    ) -> "RegistrationResponse":
+        """
+        Build from a trusted Registration row, skipping validation.
+        
+        Args:
+            registration: Registration with qr_code loaded
+            event: Event summary to embed (optional)
+            
+        Returns:
+            RegistrationResponse: Response model
+        """
+        return cls.model_construct(
+            id=registration.id,
+            userId=registration.user_id,
+            eventId=registration.event_id,
+            status=registration.status.value,
+            ticketCode=registration.ticket_code,
+            qrCode=registration.qr_code,
+            registeredAt=registration.registered_at.isoformat(),
+            checkInStatus=registration.check_in_status.value,
+            checkedInAt=iso(registration.checked_in_at),
+            guests=GuestOut.list_from_stored(registration.guests),
+            sessions=registration.sessions or [],
+            reminderSent=registration.reminder_sent,
+            cancelledAt=iso(registration.cancelled_at),
+            event=event
+        )
 
 
 class RegistrationCreateResponse(BaseModel):
@@ -69,7 +149,7 @@ class RegistrationCreateResponse(BaseModel):
 class RegistrationsListResponse(BaseModel):
     """Schema for list of registrations response."""
     success: bool = True
-    registrations: List[RegistrationResponse]
+    registrations: list[RegistrationResponse]
 
 
 class AttendeeInfo(BaseModel):
@@ -81,7 +161,9 @@ class AttendeeInfo(BaseModel):
     registeredAt: str
     checkInStatus: str
     checkedInAt: Optional[str] = None
-    guests: List[dict] = []
+    guests: list[GuestOut] = []
+    
+    model_config = _ORM_CONFIG
 
 
 class AttendeeStatistics(BaseModel):
@@ -96,6 +178,6 @@ class AttendeeStatistics(BaseModel):
 class AttendeesResponse(BaseModel):
     """Schema for event attendees response."""
     success: bool = True
-    attendees: List[AttendeeInfo]
+    attendees: list[AttendeeInfo]
     statistics: AttendeeStatistics
 
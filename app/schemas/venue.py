@@ -2,16 +2,22 @@
 Pydantic schemas for venue requests and responses.
 Provides data validation and serialization for venue endpoints.
 """
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ConfigDict
 from typing import Optional, List
 
+# Config for venue responses
+_ORM_CONFIG = ConfigDict(from_attributes=True, frozen=True)
+
+# Upper bound on facilities per venue, checked by the core validator
+_MAX_FACILITIES = 50
+
 
 class VenueBase(BaseModel):
     """Base venue schema with common fields."""
     name: str = Field(..., min_length=2, max_length=200)
     building: str = Field(..., min_length=2, max_length=200)
     capacity: Optional[int] = Field(None, ge=1, description="Maximum capacity")
-    facilities: Optional[List[str]] = Field(default_factory=list)
+    facilities: Optional[List[str]] = Field(default_factory=list, max_length=_MAX_FACILITIES)
 
 
 class VenueCreate(VenueBase):
@@ -24,7 +30,7 @@ class VenueUpdate(BaseModel):
     name: Optional[str] = Field(None, min_length=2, max_length=200)
     building: Optional[str] = Field(None, min_length=2, max_length=200)
     capacity: Optional[int] = Field(None, ge=1)
-    facilities: Optional[List[str]] = None
+    facilities: Optional[List[str]] = Field(None, max_length=_MAX_FACILITIES)
 
 
 class VenueResponse(BaseModel):
@@ -33,17 +39,16 @@ class VenueResponse(BaseModel):
     name: str
     building: str
     capacity: Optional[int] = None
-    facilities: List[str] = []
+    facilities: list[str] = []
     isActive: bool
     createdAt: Optional[str] = None
     updatedAt: Optional[str] = None
     
-    class Config:
-        from_attributes = True
+    model_config = _ORM_CONFIG
 
 
 class VenuesResponse(BaseModel):
     """Schema for list of venues response."""
     success: bool = True
-    venues: List[VenueResponse]
+    venues: list[VenueResponse]
 
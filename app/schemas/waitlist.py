@@ -2,14 +2,17 @@
 Pydantic schemas for waitlist requests and responses.
 Provides data validation and serialization for waitlist endpoints.
 """
-from pydantic import BaseModel, Field
-from typing import Optional
+from pydantic import BaseModel, ConfigDict
+from typing import Optional, Literal
+
+# Config for waitlist responses
+_ORM_CONFIG = ConfigDict(from_attributes=True, frozen=True)
 
 
 class WaitlistCreate(BaseModel):
     """Schema for joining waitlist."""
     eventId: str
-    notificationPreference: str = Field("email", pattern="^(email|sms|both)$")
+    notificationPreference: Literal["email", "sms", "both"] = "email"
 
 
 class EventWaitlistInfo(BaseModel):
@@ -31,8 +34,33 @@ class WaitlistResponse(BaseModel):
     notificationPreference: str
     event: Optional[EventWaitlistInfo] = None
     
-    class Config:
-        from_attributes = True
+    model_config = _ORM_CONFIG
+    
+    @classmethod
+    def from_orm_fast(
+        cls,
+        entry,
+        event: Optional[EventWaitlistInfo] = None
+    ) -> "WaitlistResponse":
+        """
+        Build from a trusted WaitlistEntry row, skipping validation.
+        
+        Args:
+            entry: Waitlist entry
+            event: Event summary to embed (optional)
+            
+        Returns:
+            WaitlistResponse: Response model
+        """
+        return cls.model_construct(
+            id=entry.id,
+            userId=entry.user_id,
+            eventId=entry.event_id,
+            position=entry.queue_position,
+            joinedAt=entry.joined_at.isoformat(),
+            notificationPreference=entry.notification_preference.value,
+            event=event
+        )
 
 
 class WaitlistCreateResponse(BaseModel):
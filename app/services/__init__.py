@@ -1,9 +1,25 @@
 """
 Services package initialization.
+
+Services are resolved lazily on first attribute access, so importing one
+service module does not import (and build the schemas of) all the others.
 """
-from app.services.auth_service import AuthService
-from app.services.event_service import EventService
-from app.services.registration_service import RegistrationService
-from app.services.organizer_service import OrganizerService
+import importlib
+
+# Exported name -> defining module
+_SERVICES = {
+    "AuthService": "app.services.auth_service",
+    "EventService": "app.services.event_service",
+    "RegistrationService": "app.services.registration_service",
+    "OrganizerService": "app.services.organizer_service",
+}
 
 __all__ = ["AuthService", "EventService", "RegistrationService", "OrganizerService"]
+
+
+def __getattr__(name: str):
+    """Import a service class on first access (PEP 562)."""
+    module = _SERVICES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module), name)
@@ -4,10 +4,10 @@ Handles admin operations: approvals, reference data management, analytics.
 Phase 5: Admin Console & Management
 """
 from typing import Optional, List, Dict, Any, Tuple
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, contains_eager
 from fastapi import HTTPException, status
-from datetime import date, datetime
-from sqlalchemy import func, and_
+from datetime import date, datetime, timedelta
+from sqlalchemy import func, and_, case
 
 from app.models.user import User, UserRole
 from app.models.event import Event, EventStatus
@@ -20,8 +20,9 @@ from app.repositories.user_repository import UserRepository
 from app.repositories.event_repository import EventRepository
 from app.repositories.category_repository import CategoryRepository
 from app.repositories.venue_repository import VenueRepository
-from app.repositories.audit_log_repository import AuditLogRepository
+from app.repositories.audit_log_repository import AuditLogRepository, decode_cursor
 from app.repositories.registration_repository import RegistrationRepository
+from app.repositories.organizer_approval_repository import OrganizerApprovalRepository
 from app.utils.email_service import EmailService
 
 
@@ -42,7 +43,9 @@ class AdminService:
         self.venue_repo = VenueRepository(db)
         self.audit_repo = AuditLogRepository(db)
         self.registration_repo = RegistrationRepository(db)
-        self.email_service = EmailService(db)
+        self.approval_repo = OrganizerApprovalRepository(db)
+        # Review notifications are queued so approvals never wait on SendGrid
+        self.email_service = EmailService(db, background=True)
 
     def _verify_admin(self, user: User) -> None:
         """
@@ -81,10 +84,11 @@ class AdminService:
         """
         self._verify_admin(admin)
 
-        # Explicitly join on requester FK to avoid ambiguity with reviewed_by FK
+        # Explicitly join on requester FK to avoid ambiguity with reviewed_by FK;
+        # the same join populates request.user for the response rows
         query = self.db.query(OrganizerApprovalRequest).join(
             User, OrganizerApprovalRequest.user_id == User.id
-        )
+        ).options(contains_eager(OrganizerApprovalRequest.user))
 
         if status_filter != "all":
             status_map = {
@@ -298,7 +302,7 @@ class AdminService:
         self._verify_admin(admin)
 
         # Get event
-        event = self.event_repo.get_by_id(event_id)
+        event = self.event_repo.get_by_id_with_organizer(event_id)
         if not event:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -366,7 +370,7 @@ class AdminService:
         self._verify_admin(admin)
 
         # Get event
-        event = self.event_repo.get_by_id(event_id)
+        event = self.event_repo.get_by_id_with_organizer(event_id)
         if not event:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -492,6 +496,8 @@ class AdminService:
             user_agent=user_agent
         )
 
+        self.db.commit()
+
         return category
 
     def update_category(
@@ -559,6 +565,8 @@ class AdminService:
                 user_agent=user_agent
             )
 
+            self.db.commit()
+
         return category
 
     def toggle_category(
@@ -617,6 +625,8 @@ class AdminService:
             user_agent=user_agent
         )
 
+        self.db.commit()
+
         return category
 
     # ========================================================================
@@ -685,6 +695,8 @@ class AdminService:
             user_agent=user_agent
         )
 
+        self.db.commit()
+
         return venue
 
     def update_venue(
@@ -752,6 +764,8 @@ class AdminService:
                 user_agent=user_agent
             )
 
+            self.db.commit()
+
         return venue
 
     def toggle_venue(
@@ -801,6 +815,8 @@ class AdminService:
             user_agent=user_agent
         )
 
+        self.db.commit()
+
         return venue
 
     # ========================================================================
@@ -816,7 +832,8 @@ class AdminService:
         user_id: Optional[str] = None,
         search: Optional[str] = None,
         page: int = 1,
-        limit: int = 50
+        limit: int = 50,
+        cursor: Optional[str] = None
     ) -> Tuple[List[AuditLog], int]:
         """
         Get paginated audit logs with filters.
@@ -830,12 +847,22 @@ class AdminService:
             search: Search in details
             page: Page number
             limit: Items per page
+            cursor: Keyset cursor from a previous page (overrides page)
 
         Returns:
             Tuple[List[AuditLog], int]: Logs and total count
+
+        Raises:
+            HTTPException: If cursor is malformed
         """
         self._verify_admin(admin)
 
+        if cursor and decode_cursor(cursor) is None:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid pagination cursor"
+            )
+
         # Parse dates
         start_date_obj = date.fromisoformat(start_date) if start_date else None
         end_date_obj = date.fromisoformat(end_date) if end_date else None
@@ -855,7 +882,8 @@ class AdminService:
             actor_id=user_id,
             search=search,
             page=page,
-            limit=limit
+            limit=limit,
+            cursor=cursor
         )
 
     # ========================================================================
@@ -886,63 +914,72 @@ class AdminService:
         # For now, return basic analytics
         # TODO: Implement comprehensive analytics queries
 
-        total_events = self.db.query(Event).count()
-        total_registrations = self.db.query(Registration).filter(
-            Registration.status == RegistrationStatus.CONFIRMED
-        ).count()
-        total_attendance = self.db.query(Registration).filter(
-            Registration.check_in_status == CheckInStatus.CHECKED_IN
-        ).count()
+        (total_events, total_registrations, total_attendance,
+         active_organizers, active_students) = self._summary_counts()
         no_shows = total_registrations - total_attendance
         attendance_rate = (total_attendance / total_registrations * 100) if total_registrations > 0 else 0
 
-        active_organizers = self.db.query(User).filter(
-            User.role == UserRole.ORGANIZER,
-            User.is_approved == True,
-            User.is_active == True
-        ).count()
-
-        active_students = self.db.query(User).filter(
-            User.role == UserRole.STUDENT,
-            User.is_active == True
-        ).count()
+        # Analytics by category: one grouped query over events and one over
+        # checked-in registrations, matched to the categories in Python
+        category_events = {
+            category_id: (event_count, registrations or 0)
+            for category_id, event_count, registrations in self.db.query(
+                Event.category_id,
+                func.count(Event.id),
+                func.sum(Event.registered_count)
+            ).group_by(Event.category_id)
+        }
+        category_attendance = dict(
+            self.db.query(Event.category_id, func.count(Registration.id))
+            .join(Registration, Registration.event_id == Event.id)
+            .filter(Registration.check_in_status == CheckInStatus.CHECKED_IN)
+            .group_by(Event.category_id)
+            .all()
+        )
 
-        # Analytics by category
-        from sqlalchemy import func
         category_analytics = []
         categories = self.category_repo.get_all(active_only=True)
         for cat in categories:
-            cat_events = self.db.query(Event).filter(Event.category_id == cat.id).all()
-            cat_registrations = sum([e.registered_count for e in cat_events])
-            cat_attendance = self.db.query(Registration).join(Event).filter(
-                Event.category_id == cat.id,
-                Registration.check_in_status == CheckInStatus.CHECKED_IN
-            ).count()
+            cat_event_count, cat_registrations = category_events.get(cat.id, (0, 0))
+            cat_attendance = category_attendance.get(cat.id, 0)
             cat_rate = (cat_attendance / cat_registrations * 100) if cat_registrations > 0 else 0
 
             category_analytics.append({
                 "category": cat.name,
-                "events": len(cat_events),
+                "events": cat_event_count,
                 "registrations": cat_registrations,
                 "attendance": cat_attendance,
                 "attendanceRate": round(cat_rate, 1)
             })
 
-        # Analytics by date (last 30 days)
-        from datetime import timedelta
-        date_analytics = []
+        # Analytics by date (last 30 days): events and registrations are each
+        # counted in one query grouped by date, then laid out day by day
         today = datetime.now().date()
+        window_start = today - timedelta(days=30)
+        events_by_date = dict(
+            self.db.query(Event.date, func.count(Event.id))
+            .filter(Event.date.between(window_start, today))
+            .group_by(Event.date)
+            .all()
+        )
+        registrations_by_date = {
+            event_date: (registrations or 0, attendance or 0)
+            for event_date, registrations, attendance in self.db.query(
+                Event.date,
+                func.sum(case((Registration.status == RegistrationStatus.CONFIRMED, 1), else_=0)),
+                func.sum(case((Registration.check_in_status == CheckInStatus.CHECKED_IN, 1), else_=0))
+            )
+            .select_from(Registration)
+            .join(Event, Registration.event_id == Event.id)
+            .filter(Event.date.between(window_start, today))
+            .group_by(Event.date)
+        }
+
+        date_analytics = []
         for i in range(30, -1, -1):
             target_date = today - timedelta(days=i)
-            day_events = self.db.query(Event).filter(Event.date == target_date).count()
-            day_registrations = self.db.query(Registration).join(Event).filter(
-                Event.date == target_date,
-                Registration.status == RegistrationStatus.CONFIRMED
-            ).count()
-            day_attendance = self.db.query(Registration).join(Event).filter(
-                Event.date == target_date,
-                Registration.check_in_status == CheckInStatus.CHECKED_IN
-            ).count()
+            day_events = events_by_date.get(target_date, 0)
+            day_registrations, day_attendance = registrations_by_date.get(target_date, (0, 0))
 
             if day_events > 0 or day_registrations > 0 or day_attendance > 0:
                 date_analytics.append({
@@ -1014,6 +1051,39 @@ class AdminService:
             "organizerStats": organizer_stats
         }
 
+    def _summary_counts(self) -> Tuple[int, int, int, int, int]:
+        """
+        Count the system-wide totals shown on the dashboard and analytics.
+
+        Two statements: registration totals come from conditional sums with
+        the event count as a scalar subquery, and both active-user counts
+        from one pass over users.
+
+        Returns:
+            Tuple[int, int, int, int, int]: Total events, confirmed
+            registrations, checked-in registrations, active organizers and
+            active students
+        """
+        total_events, total_registrations, total_attendance = self.db.query(
+            self.db.query(func.count(Event.id)).scalar_subquery(),
+            func.sum(case((Registration.status == RegistrationStatus.CONFIRMED, 1), else_=0)),
+            func.sum(case((Registration.check_in_status == CheckInStatus.CHECKED_IN, 1), else_=0))
+        ).select_from(Registration).one()
+
+        active_organizers, active_students = self.db.query(
+            func.sum(case((and_(User.role == UserRole.ORGANIZER, User.is_approved == True), 1), else_=0)),
+            func.sum(case((User.role == UserRole.STUDENT, 1), else_=0))
+        ).filter(User.is_active == True).one()
+
+        # SUM over no rows is NULL
+        return (
+            total_events,
+            total_registrations or 0,
+            total_attendance or 0,
+            active_organizers or 0,
+            active_students or 0
+        )
+
     def get_dashboard_stats(self, admin: User) -> Dict[str, Any]:
         """
         Get admin dashboard statistics.
@@ -1026,32 +1096,12 @@ class AdminService:
         """
         self._verify_admin(admin)
 
-        pending_organizers = self.db.query(OrganizerApprovalRequest).filter(
-            OrganizerApprovalRequest.status == ApprovalStatus.PENDING
-        ).count()
-
-        pending_events = self.db.query(Event).filter(
-            Event.status == EventStatus.PENDING
-        ).count()
+        # Cached briefly and invalidated on writes (see the repositories)
+        pending_organizers = self.approval_repo.count_pending()
+        pending_events = self.event_repo.count_pending()
 
-        total_events = self.db.query(Event).count()
-        total_registrations = self.db.query(Registration).filter(
-            Registration.status == RegistrationStatus.CONFIRMED
-        ).count()
-        total_attendance = self.db.query(Registration).filter(
-            Registration.check_in_status == CheckInStatus.CHECKED_IN
-        ).count()
-
-        active_organizers = self.db.query(User).filter(
-            User.role == UserRole.ORGANIZER,
-            User.is_approved == True,
-            User.is_active == True
-        ).count()
-
-        active_students = self.db.query(User).filter(
-            User.role == UserRole.STUDENT,
-            User.is_active == True
-        ).count()
+        (total_events, total_registrations, total_attendance,
+         active_organizers, active_students) = self._summary_counts()
 
         return {
             "pendingOrganizers": pending_organizers,
@@ -8,7 +8,7 @@ from fastapi import HTTPException, status
 from app.models.user import User, UserRole
 from app.repositories.user_repository import UserRepository
 from app.repositories.organizer_approval_repository import OrganizerApprovalRepository
-from app.core.security import verify_password, create_access_token
+from app.core.security import verify_password_async, create_access_token
 from app.schemas.auth import UserLogin, UserCreate
 
 
@@ -26,7 +26,7 @@ class AuthService:
         self.user_repo = UserRepository(db)
         self.approval_repo = OrganizerApprovalRepository(db)
     
-    def authenticate_user(self, credentials: UserLogin) -> Tuple[User, str]:
+    async def authenticate_user(self, credentials: UserLogin) -> Tuple[User, str]:
         """
         Authenticate user with email and password.
         
@@ -50,7 +50,7 @@ class AuthService:
             )
         
         # Verify password
-        if not verify_password(credentials.password, user.password):
+        if not await verify_password_async(credentials.password, user.password):
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Invalid credentials. Please check your email and password.",
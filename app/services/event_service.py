@@ -9,7 +9,7 @@ from datetime import date
 from app.models.event import Event, EventStatus
 from app.models.category import Category
 from app.models.venue import Venue
-from app.repositories.event_repository import EventRepository
+from app.repositories.event_repository import EventRepository, decode_event_cursor
 from app.repositories.category_repository import CategoryRepository
 from app.repositories.venue_repository import VenueRepository
 from app.repositories.registration_repository import RegistrationRepository
@@ -43,8 +43,10 @@ class EventService:
         page: int = 1,
         limit: int = 20,
         user_id: Optional[str] = None,
-        exclude_registered: bool = False
-    ) -> Tuple[List[Event], int]:
+        exclude_registered: bool = False,
+        cursor: Optional[str] = None,
+        include_total: bool = True
+    ) -> Tuple[List[Event], Optional[int]]:
         """
         Get paginated list of published events with filters.
 
@@ -60,9 +62,11 @@ class EventService:
             limit: Items per page
             user_id: Current user ID (optional)
             exclude_registered: If True and user_id provided, exclude events user is registered for
+            cursor: Keyset cursor from a previous page (page is ignored when set)
+            include_total: Whether to compute the (capped, cached) total count
 
         Returns:
-            Tuple[List[Event], int]: List of events and total count
+            Tuple[List[Event], Optional[int]]: List of events and total count
 
         Raises:
             HTTPException: If validation fails
@@ -121,6 +125,13 @@ class EventService:
                 detail=f"sort_by must be one of: {', '.join(valid_sort_options)}"
             )
         
+        # A cursor only makes sense under the sort order it was issued for
+        if cursor and decode_event_cursor(cursor, sort_by) is None:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid pagination cursor"
+            )
+        
         # Get events from repository
         try:
             events, total_count = self.event_repo.get_all_published(
@@ -132,7 +143,9 @@ class EventService:
                 availability=availability,
                 sort_by=sort_by,
                 page=page,
-                limit=limit
+                limit=limit,
+                cursor=cursor,
+                include_total=include_total
             )
 
             # If user is logged in and exclude_registered is True, filter out registered events
@@ -6,7 +6,7 @@ Phase 4: Organizer Management
 from typing import Optional, List, Dict, Any, Tuple
 from sqlalchemy.orm import Session
 from fastapi import HTTPException, status
-from datetime import date, datetime
+from datetime import date, datetime, time
 import uuid
 import csv
 import io
@@ -19,7 +19,7 @@ from app.models.user import User, UserRole
 from app.models.registration import Registration, RegistrationStatus, CheckInStatus
 from app.models.waitlist import WaitlistEntry
 from app.models.audit_log import AuditAction, TargetType
-from app.repositories.event_repository import EventRepository
+from app.repositories.event_repository import EventRepository, decode_event_cursor
 from app.repositories.registration_repository import RegistrationRepository
 from app.repositories.waitlist_repository import WaitlistRepository
 from app.repositories.category_repository import CategoryRepository
@@ -140,12 +140,16 @@ class OrganizerService:
                 detail="Invalid date format. Use YYYY-MM-DD"
             )
 
+        # Parse times once (already validated by the schema)
+        start_time = time.fromisoformat(event_data.startTime)
+        end_time = time.fromisoformat(event_data.endTime)
+
         # Check for venue conflicts
         conflicting_event = self.event_repo.check_venue_conflict(
             venue=event_data.venue,
             event_date=event_date,
-            start_time=event_data.startTime,
-            end_time=event_data.endTime
+            start_time=start_time,
+            end_time=end_time
         )
 
         if conflicting_event:
@@ -162,8 +166,8 @@ class OrganizerService:
                 category_id=event_data.categoryId,
                 organizer_id=organizer.id,
                 event_date=event_date,
-                start_time=event_data.startTime,
-                end_time=event_data.endTime,
+                start_time=start_time,
+                end_time=end_time,
                 venue=event_data.venue,
                 location=event_data.location,
                 capacity=event_data.capacity,
@@ -186,6 +190,8 @@ class OrganizerService:
                 user_agent=user_agent
             )
             
+            self.db.commit()
+            
             return event
             
         except Exception as e:
@@ -197,21 +203,39 @@ class OrganizerService:
     def get_organizer_events(
         self,
         organizer: User,
-        status_filter: Optional[EventStatus] = None
+        status_filter: Optional[EventStatus] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None
     ) -> Tuple[List[Event], Dict[str, int]]:
         """
-        Get all events for an organizer.
+        Get events for an organizer, newest first.
         
         Args:
             organizer: Organizer user
             status_filter: Filter by event status
+            limit: Page size (optional, all events if omitted)
+            cursor: Cursor of the previous page's last event (optional)
             
         Returns:
             Tuple[List[Event], Dict]: List of events and statistics
+            
+        Raises:
+            HTTPException: If cursor is malformed
         """
         self._verify_organizer(organizer)
         
-        events = self.event_repo.get_by_organizer(organizer.id, status=status_filter)
+        if cursor and decode_event_cursor(cursor, "recent") is None:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid pagination cursor"
+            )
+        
+        events = self.event_repo.get_by_organizer(
+            organizer.id,
+            status=status_filter,
+            limit=limit,
+            cursor=cursor
+        )
         statistics = self.event_repo.get_organizer_statistics(organizer.id)
         
         return events, statistics
@@ -276,12 +300,16 @@ class OrganizerService:
                 detail="Invalid date format. Use YYYY-MM-DD"
             )
 
+        # Parse times once (already validated by the schema)
+        start_time = time.fromisoformat(event_data.startTime)
+        end_time = time.fromisoformat(event_data.endTime)
+
         # Check for venue conflicts (exclude current event)
         conflicting_event = self.event_repo.check_venue_conflict(
             venue=event_data.venue,
             event_date=event_date,
-            start_time=event_data.startTime,
-            end_time=event_data.endTime,
+            start_time=start_time,
+            end_time=end_time,
             exclude_event_id=event_id
         )
 
@@ -304,8 +332,8 @@ class OrganizerService:
             'description': event_data.description,
             'category_id': event_data.categoryId,
             'date': event_date,
-            'start_time': event_data.startTime,
-            'end_time': event_data.endTime,
+            'start_time': start_time,
+            'end_time': end_time,
             'venue': event_data.venue,
             'location': event_data.location,
             'capacity': event_data.capacity,
@@ -343,8 +371,12 @@ class OrganizerService:
                     detail=f"Invalid status. Must be one of: draft, pending, published, cancelled"
                 )
 
-        # Update event
+        # Update event; waitlist entries copy title, date and capacity, so
+        # they are only rewritten when one of those changed
+        preview = (event.title, event.date, event.capacity)
         event = self.event_repo.update(event, **update_fields)
+        if (event.title, event.date, event.capacity) != preview:
+            self.waitlist_repo.sync_event_preview(event)
 
         # Log audit
         self.audit_repo.create(
@@ -361,6 +393,8 @@ class OrganizerService:
             user_agent=user_agent
         )
 
+        self.db.commit()
+
         return event
     
     def cancel_event(
@@ -425,6 +459,8 @@ class OrganizerService:
             user_agent=user_agent
         )
 
+        self.db.commit()
+
         # Send cancellation notifications to all registered attendees
         try:
             # Get all confirmed registrations for this event
@@ -497,8 +533,8 @@ class OrganizerService:
             category_id=original.category_id,
             organizer_id=organizer.id,
             event_date=original.date,
-            start_time=original.start_time.strftime("%H:%M") if original.start_time else "09:00",
-            end_time=original.end_time.strftime("%H:%M") if original.end_time else "17:00",
+            start_time=original.start_time or time(9, 0),
+            end_time=original.end_time or time(17, 0),
             venue=original.venue,
             location=original.location,
             capacity=original.capacity,
@@ -522,6 +558,8 @@ class OrganizerService:
             user_agent=user_agent
         )
         
+        self.db.commit()
+        
         return new_event
     
     def get_organizer_statistics(self, organizer: User) -> Dict[str, Any]:
@@ -783,6 +821,8 @@ class OrganizerService:
             user_agent=user_agent
         )
         
+        self.db.commit()
+        
         return registration
     
     def send_announcement(
@@ -832,13 +872,14 @@ class OrganizerService:
         # Check rate limiting: Max 10 announcements per day per organizer
         today_start = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
         # Reuse EVENT_UPDATED as a proxy action for announcements (ANNOUNCEMENT_SENT not in DB enum)
-        today_announcements = self.audit_repo.count_by_action_and_actor(
+        limit_reached = self.audit_repo.has_reached_threshold(
             action=AuditAction.EVENT_UPDATED,
             actor_id=organizer.id,
-            since=today_start
+            since=today_start,
+            threshold=10
         )
 
-        if today_announcements >= 10:
+        if limit_reached:
             raise HTTPException(
                 status_code=status.HTTP_429_TOO_MANY_REQUESTS,
                 detail="Daily announcement limit reached (10 per day). Please try again tomorrow."
@@ -891,6 +932,8 @@ class OrganizerService:
             user_agent=user_agent
         )
 
+        self.db.commit()
+
         return {
             "success": True,
             "message": f"Announcement sent to {sent_count} of {recipient_count} recipients",
@@ -928,22 +971,6 @@ class OrganizerService:
         
         self._verify_event_ownership(event, organizer)
         
-        # Get waitlist
-        waitlist = self.waitlist_repo.get_event_waitlist(event_id)
-        
-        # Build response
-        waitlist_entries = []
-        for entry in waitlist:
-            waitlist_entries.append({
-                "id": entry.id,
-                "userId": entry.user_id,
-                "position": entry.position,
-                "name": entry.user.name if entry.user else "Unknown",
-                "email": entry.user.email if entry.user else "Unknown",
-                "joinedAt": entry.joined_at.isoformat() if entry.joined_at else None,
-                "notificationPreference": entry.notification_preference.value
-            })
-        
-        return waitlist_entries
+        return self.waitlist_repo.page_with_user_preview(event_id)
 
 
@@ -55,13 +55,13 @@ class RegistrationService:
         2. Check event date is in future
         3. Check for duplicate registration
         4. Validate guests (max 2, must be @umd.edu)
-        5. Check capacity (user + guests must fit)
+        5. Check capacity (user + guests must fit) and reserve the seats
+           with an atomic registered_count update
         6. Generate unique ticket code
         7. Generate QR code
         8. Create registration record
-        9. Update event registered_count
-        10. Send confirmation email
-        11. Log to audit trail
+        9. Send confirmation email
+        10. Log to audit trail
 
         Args:
             user_id: ID of user registering
@@ -193,6 +193,18 @@ class RegistrationService:
                     detail=f"Insufficient capacity. Only {remaining_capacity} spot(s) remaining, but you need {total_attendees_needed} (including guests). Please reduce guests or join waitlist."
                 )
 
+        # Reserve the seats atomically; a concurrent registration may have
+        # taken them since the event was read. Committed with the registration.
+        if not self.event_repo.increment_registered_count(
+            event, total_attendees_needed, enforce_capacity=True
+        ):
+            self.db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="Event is full. Please join the waitlist instead.",
+                headers={"X-Suggestion": "join-waitlist"}
+            )
+
         # ====================================================================
         # STEP 5: GENERATE TICKET CODE AND QR CODE
         # ====================================================================
@@ -216,7 +228,9 @@ class RegistrationService:
         # Convert guests to dict format for JSON storage
         guests_data = [{"name": g.name, "email": g.email} for g in guests] if guests else []
 
-        registration = self.registration_repo.create(
+        # Atomic against a concurrent duplicate request that passed the
+        # step 2 check; a conflict also rolls back the seat reservation
+        registration = self.registration_repo.create_if_absent(
             user_id=user_id,
             event_id=registration_data.eventId,
             ticket_code=ticket_code,
@@ -224,20 +238,19 @@ class RegistrationService:
             guests=guests_data,
             sessions=registration_data.sessions or []
         )
+        if registration is None:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="You are already registered for this event"
+            )
 
         # ====================================================================
-        # STEP 7: UPDATE EVENT REGISTERED COUNT
-        # ====================================================================
-        event.registered_count += total_attendees_needed
-        self.event_repo.update(event)
-
-        # ====================================================================
-        # STEP 8: GET USER FOR EMAIL
+        # STEP 7: GET USER FOR EMAIL
         # ====================================================================
         user = self.user_repo.get_by_id(user_id)
 
         # ====================================================================
-        # STEP 9: SEND CONFIRMATION EMAIL
+        # STEP 8: SEND CONFIRMATION EMAIL
         # ====================================================================
         try:
             self.email_service.send_registration_confirmation(
@@ -250,7 +263,7 @@ class RegistrationService:
             print(f"Warning: Failed to send confirmation email: {str(e)}")
 
         # ====================================================================
-        # STEP 10: CREATE AUDIT LOG
+        # STEP 9: CREATE AUDIT LOG
         # ====================================================================
         guests_info = f" with {len(guests)} guest(s)" if guests else ""
         self.audit_repo.create(
@@ -390,11 +403,8 @@ class RegistrationService:
         # ====================================================================
         event = self.event_repo.get_by_id(registration.event_id)
         if event:
-            event.registered_count -= total_attendees
-            # Ensure it doesn't go negative
-            if event.registered_count < 0:
-                event.registered_count = 0
-            self.event_repo.update(event)
+            # Atomic and clamped at zero in SQL
+            self.event_repo.decrement_registered_count(event, total_attendees)
 
         # ====================================================================
         # STEP 7: SEND CANCELLATION EMAIL
@@ -543,15 +553,14 @@ class RegistrationService:
         # ====================================================================
         waitlist_entry = self.waitlist_repo.create(
             user_id=user_id,
-            event_id=waitlist_data.eventId,
+            event=event,
             notification_preference=notification_pref
         )
 
         # ====================================================================
         # STEP 7: UPDATE EVENT WAITLIST COUNT
         # ====================================================================
-        event.waitlist_count += 1
-        self.event_repo.update(event)
+        self.event_repo.increment_waitlist_count(event)
 
         # ====================================================================
         # STEP 8: SEND WAITLIST CONFIRMATION EMAIL
@@ -561,7 +570,7 @@ class RegistrationService:
             self.email_service.send_waitlist_confirmation(
                 user=user,
                 event=event,
-                position=waitlist_entry.position
+                position=waitlist_entry.queue_position
             )
         except Exception as e:
             print(f"Warning: Failed to send waitlist confirmation email: {str(e)}")
@@ -577,7 +586,7 @@ class RegistrationService:
             target_type=TargetType.EVENT,
             target_id=event.id,
             target_name=event.title,
-            details=f"User {user.name} joined waitlist for {event.title} at position {waitlist_entry.position}",
+            details=f"User {user.name} joined waitlist for {event.title} at position {waitlist_entry.queue_position}",
             ip_address=None,
             user_agent=None
         )
@@ -600,6 +609,18 @@ class RegistrationService:
         """
         return self.waitlist_repo.get_user_waitlist_entries(user_id)
 
+    def get_registered_counts(self, event_ids) -> dict[str, int]:
+        """
+        Get live registered counts for the events behind waitlist entries.
+
+        Args:
+            event_ids: Event IDs
+
+        Returns:
+            dict[str, int]: Registered count keyed by event ID
+        """
+        return self.event_repo.get_registered_counts(event_ids)
+
     def leave_waitlist(
         self,
         waitlist_id: str,
@@ -612,9 +633,8 @@ class RegistrationService:
         1. Validate waitlist entry exists
         2. Check user owns the entry
         3. Remove from waitlist
-        4. Update positions for remaining members
-        5. Decrease event waitlistCount
-        6. Create audit log
+        4. Decrease event waitlistCount
+        5. Create audit log
 
         Args:
             waitlist_id: ID of waitlist entry to remove
@@ -653,7 +673,7 @@ class RegistrationService:
         event = self.event_repo.get_by_id(waitlist_entry.event_id)
 
         # ====================================================================
-        # STEP 4: REMOVE FROM WAITLIST (also updates positions)
+        # STEP 4: REMOVE FROM WAITLIST
         # ====================================================================
         self.waitlist_repo.remove(waitlist_entry)
 
@@ -661,10 +681,7 @@ class RegistrationService:
         # STEP 5: DECREASE EVENT WAITLIST COUNT
         # ====================================================================
         if event:
-            event.waitlist_count -= 1
-            if event.waitlist_count < 0:
-                event.waitlist_count = 0
-            self.event_repo.update(event)
+            self.event_repo.decrement_waitlist_count(event)
 
         # ====================================================================
         # STEP 6: CREATE AUDIT LOG
@@ -697,9 +714,8 @@ class RegistrationService:
         2. Create registration for them
         3. Generate ticket & QR code
         4. Remove from waitlist
-        5. Update positions for remaining waitlist
-        6. Send promotion email
-        7. Decrease waitlistCount
+        5. Send promotion email
+        6. Decrease waitlistCount
 
         Args:
             event_id: ID of the event
@@ -736,10 +752,7 @@ class RegistrationService:
         if existing_registration and existing_registration.status == RegistrationStatus.CONFIRMED:
             # User already registered, remove from waitlist and skip promotion
             self.waitlist_repo.remove(waitlist_entry)
-            event.waitlist_count -= 1
-            if event.waitlist_count < 0:
-                event.waitlist_count = 0
-            self.event_repo.update(event)
+            self.event_repo.decrement_waitlist_count(event)
             self.db.commit()
             return False  # Skip this person, they're already registered
 
@@ -773,13 +786,12 @@ class RegistrationService:
         # ====================================================================
         # STEP 5: UPDATE EVENT REGISTERED COUNT
         # ====================================================================
-        event.registered_count += 1
-        self.event_repo.update(event)
+        self.event_repo.increment_registered_count(event)
 
         # ====================================================================
         # STEP 6: SEND PROMOTION EMAIL
         # ====================================================================
-        old_position = waitlist_entry.position
+        old_position = waitlist_entry.queue_position
         try:
             self.email_service.send_waitlist_promotion(
                 user=user,
@@ -791,17 +803,14 @@ class RegistrationService:
             print(f"Warning: Failed to send waitlist promotion email: {str(e)}")
 
         # ====================================================================
-        # STEP 7: REMOVE FROM WAITLIST (updates positions automatically)
+        # STEP 7: REMOVE FROM WAITLIST
         # ====================================================================
         self.waitlist_repo.remove(waitlist_entry)
 
         # ====================================================================
         # STEP 8: DECREASE EVENT WAITLIST COUNT
         # ====================================================================
-        event.waitlist_count -= 1
-        if event.waitlist_count < 0:
-            event.waitlist_count = 0
-        self.event_repo.update(event)
+        self.event_repo.decrement_waitlist_count(event)
 
         # ====================================================================
         # STEP 9: CREATE AUDIT LOG
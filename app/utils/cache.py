@@ -0,0 +1,141 @@
+"""
+Small in-process TTL cache.
+Used for short-lived memoization of expensive, read-mostly query results.
+"""
+import threading
+import time
+from typing import Any, Callable, Hashable, Optional
+from sqlalchemy import event
+from sqlalchemy.orm import Session, object_session
+
+# Session.info key holding the (cache, key) pairs to drop when it commits
+_PENDING = "pending_cache_invalidations"
+
+# Stands for "every entry" in a pending invalidation
+_ALL = object()
+
+
+class TTLCache:
+    """Thread-safe mapping whose entries expire after a fixed number of seconds."""
+
+    def __init__(self, ttl: float, maxsize: int = 256):
+        """
+        Initialize cache.
+
+        Args:
+            ttl: Seconds an entry stays valid
+            maxsize: Maximum number of entries kept (oldest evicted first)
+        """
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._data: dict = {}
+        self._lock = threading.RLock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Get a cached value.
+
+        Args:
+            key: Cache key
+            default: Value returned on miss or expiry
+
+        Returns:
+            Any: Cached value or default
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._data[key]
+                return default
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        Store a value.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+        """
+        with self._lock:
+            if key not in self._data and len(self._data) >= self.maxsize:
+                self._data.pop(next(iter(self._data)))
+            self._data[key] = (time.monotonic() + self.ttl, value)
+
+    def pop(self, key: Hashable) -> Optional[Any]:
+        """
+        Remove a single entry.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Optional[Any]: Removed value if present (expired or not)
+        """
+        with self._lock:
+            entry = self._data.pop(key, None)
+            return entry[1] if entry else None
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        with self._lock:
+            self._data.clear()
+
+
+def invalidate_on_commit(session: Session, cache: TTLCache, key: Hashable = _ALL) -> None:
+    """
+    Drop a cache entry once the session's current transaction commits.
+
+    Dropping it earlier (at flush or execute time) would let a concurrent
+    request re-cache the still-committed old value before this transaction
+    commits, leaving it stale for a full TTL.
+
+    Args:
+        session: Session doing the write
+        cache: Cache holding the entry
+        key: Key to drop (default: the whole cache)
+    """
+    session.info.setdefault(_PENDING, set()).add((cache, key))
+
+
+def clear_on_commit(
+    model: type,
+    cache: TTLCache,
+    key: Optional[Callable[[Any], Hashable]] = None
+) -> None:
+    """
+    Invalidate a cache after every commit that wrote rows of a mapped class.
+
+    Keys are collected when rows are flushed (ORM writes from any service go
+    through flush) and dropped in the session's after_commit hook.
+
+    Args:
+        model: Mapped class to watch
+        cache: Cache to invalidate
+        key: Maps a written instance to the one key to drop (default: drop
+            the whole cache)
+    """
+    def _collect(mapper, connection, target) -> None:
+        invalidate_on_commit(object_session(target), cache, key(target) if key else _ALL)
+
+    for name in ("after_insert", "after_update", "after_delete"):
+        event.listen(model, name, _collect)
+
+
+@event.listens_for(Session, "after_commit")
+def _drop_pending(session: Session) -> None:
+    """Apply the invalidations collected during the committed transaction."""
+    for cache, key in session.info.pop(_PENDING, ()):
+        if key is _ALL:
+            cache.clear()
+        else:
+            cache.pop(key)
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_pending(session: Session) -> None:
+    """Discard invalidations for writes that were rolled back."""
+    session.info.pop(_PENDING, None)
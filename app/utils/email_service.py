@@ -9,6 +9,9 @@ from app.models.registration import Registration
 from app.models.user import User
 from app.core.config import settings
 import logging
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
 from sendgrid import SendGridAPIClient
 from sendgrid.helpers.mail import Mail
 from pathlib import Path
@@ -16,6 +19,16 @@ from typing import Optional
 
 logger = logging.getLogger(__name__)
 
+# Optional notes block in the approval/rejection templates
+_NOTES_BLOCK = re.compile(r'{{#if notes}}.*?{{/if}}', re.DOTALL)
+
+# SendGrid calls queued by background EmailService instances; the request
+# thread renders the message and returns without waiting on the mail API
+_send_pool = ThreadPoolExecutor(
+    max_workers=settings.EMAIL_SEND_WORKERS,
+    thread_name_prefix="email-send"
+)
+
 
 class EmailService:
     """
@@ -23,14 +36,17 @@ class EmailService:
     Mode is controlled by EMAIL_MODE environment variable: "mock" or "sendgrid"
     """
 
-    def __init__(self, db: Session):
+    def __init__(self, db: Session, background: bool = False):
         """
         Initialize email service.
 
         Args:
             db: Database session (for future use with email templates from DB)
+            background: Queue SendGrid deliveries on a worker pool (with
+                retries) instead of sending inside the caller's request
         """
         self.db = db
+        self.background = background
         self.mode = settings.EMAIL_MODE.lower()
         self.templates_dir = Path(__file__).parent.parent / "templates" / "emails"
         self.sendgrid_client = None
@@ -65,7 +81,8 @@ class EmailService:
             html_content: HTML email content
 
         Returns:
-            bool: True if sent successfully, False otherwise
+            bool: True if sent successfully (queued, in background mode),
+            False otherwise
         """
         try:
             message = Mail(
@@ -74,14 +91,37 @@ class EmailService:
                 subject=subject,
                 html_content=html_content
             )
+        except Exception as e:
+            logger.error(f"Failed to build SendGrid email to {to_email}: {str(e)}")
+            return False
 
-            response = self.sendgrid_client.send(message)
-            logger.info(f"SendGrid email sent successfully to {to_email}, Status Code: {response.status_code}")
+        if self.background:
+            _send_pool.submit(self._deliver, message, to_email, settings.EMAIL_SEND_ATTEMPTS)
             return True
+        return self._deliver(message, to_email, 1)
 
-        except Exception as e:
-            logger.error(f"Failed to send SendGrid email to {to_email}: {str(e)}")
-            return False
+    def _deliver(self, message: Mail, to_email: str, attempts: int) -> bool:
+        """
+        Post a message to SendGrid, retrying with exponential backoff.
+
+        Args:
+            message: Prepared SendGrid message
+            to_email: Recipient email address (for logging)
+            attempts: Maximum number of tries
+
+        Returns:
+            bool: True if sent successfully, False otherwise
+        """
+        for attempt in range(1, attempts + 1):
+            try:
+                response = self.sendgrid_client.send(message)
+                logger.info(f"SendGrid email sent successfully to {to_email}, Status Code: {response.status_code}")
+                return True
+            except Exception as e:
+                logger.error(f"Failed to send SendGrid email to {to_email} (attempt {attempt}/{attempts}): {str(e)}")
+                if attempt < attempts:
+                    time.sleep(2 ** (attempt - 1))
+        return False
 
     def _print_mock_email(
         self,
@@ -468,8 +508,7 @@ We apologize for any inconvenience.
                     html_content = html_content.replace('{{notes}}', notes)
                 else:
                     # Remove the notes section
-                    import re
-                    html_content = re.sub(r'{{#if notes}}.*?{{/if}}', '', html_content, flags=re.DOTALL)
+                    html_content = _NOTES_BLOCK.sub('', html_content)
                 return self._send_sendgrid_email(user.email, subject, html_content)
 
         # Fallback/Mock mode
@@ -572,8 +611,7 @@ You may reapply in the future after addressing these concerns.
                     html_content = html_content.replace('{{/if}}', '')
                     html_content = html_content.replace('{{notes}}', notes)
                 else:
-                    import re
-                    html_content = re.sub(r'{{#if notes}}.*?{{/if}}', '', html_content, flags=re.DOTALL)
+                    html_content = _NOTES_BLOCK.sub('', html_content)
                 return self._send_sendgrid_email(organizer.email, subject, html_content)
 
         # Fallback/Mock mode
@@ -15,7 +15,8 @@ from app.models.registration import Registration, RegistrationStatus, CheckInSta
 from app.models.waitlist import WaitlistEntry, NotificationPreference
 from app.models.organizer_approval import OrganizerApprovalRequest, ApprovalStatus
 from app.models.audit_log import AuditLog, AuditAction, TargetType
-from app.core.security import get_password_hash
+from app.repositories.user_repository import UserRepository
+from app.repositories.venue_repository import VenueRepository
 from datetime import datetime, date, time, timedelta
 import uuid
 
@@ -24,21 +25,14 @@ def create_sample_users(db):
     """Create sample users for each role."""
     print("\n👥 Creating sample users...")
     
-    users = []
-    
     # Admin user
-    admin = User(
-        id=str(uuid.uuid4()),
-        email="admin@umd.edu",
-        password=get_password_hash("admin123"),
-        name="Admin User",
-        role=UserRole.ADMIN,
-        is_approved=True,
-        department="Computer Science"
-    )
-    db.add(admin)
-    users.append(admin)
-    print(f"✅ Created admin: admin@umd.edu / admin123")
+    rows = [{
+        "email": "admin@umd.edu",
+        "password": "admin123",
+        "name": "Admin User",
+        "role": UserRole.ADMIN,
+        "department": "Computer Science"
+    }]
     
     # Approved organizers
     organizers = [
@@ -65,32 +59,19 @@ def create_sample_users(db):
     ]
     
     for org_data in organizers:
-        organizer = User(
-            id=str(uuid.uuid4()),
-            email=org_data["email"],
-            password=get_password_hash("organizer123"),
-            name=org_data["name"],
-            role=UserRole.ORGANIZER,
-            is_approved=True,
-            department=org_data["department"]
-        )
-        db.add(organizer)
-        users.append(organizer)
-        print(f"✅ Created organizer: {org_data['email']} / organizer123")
+        rows.append(dict(
+            org_data, password="organizer123", role=UserRole.ORGANIZER, is_approved=True
+        ))
     
     # Pending organizer (not approved)
-    pending_organizer = User(
-        id=str(uuid.uuid4()),
-        email="pending@umd.edu",
-        password=get_password_hash("pending123"),
-        name="Pending Organizer",
-        role=UserRole.ORGANIZER,
-        is_approved=False,
-        department="Student Activities"
-    )
-    db.add(pending_organizer)
-    users.append(pending_organizer)
-    print(f"✅ Created pending organizer: pending@umd.edu / pending123")
+    pending_index = len(rows)
+    rows.append({
+        "email": "pending@umd.edu",
+        "password": "pending123",
+        "name": "Pending Organizer",
+        "role": UserRole.ORGANIZER,
+        "department": "Student Activities"
+    })
     
     # Student users
     students = [
@@ -127,21 +108,26 @@ def create_sample_users(db):
     ]
     
     for student_data in students:
-        student = User(
-            id=str(uuid.uuid4()),
-            email=student_data["email"],
-            password=get_password_hash("student123"),
-            name=student_data["name"],
-            role=UserRole.STUDENT,
-            is_approved=True,
-            department=student_data["department"],
-            graduation_year=student_data["grad_year"]
-        )
-        db.add(student)
-        users.append(student)
-        print(f"✅ Created student: {student_data['email']} / student123")
+        rows.append({
+            "email": student_data["email"],
+            "password": "student123",
+            "name": student_data["name"],
+            "role": UserRole.STUDENT,
+            "department": student_data["department"],
+            "graduation_year": student_data["grad_year"]
+        })
+    
+    # One batched INSERT; passwords use the cheaper seeding cost factor
+    ids = UserRepository(db).create_bulk(rows)
+    users_by_id = {user.id: user for user in db.query(User).filter(User.id.in_(ids))}
+    users = [users_by_id[user_id] for user_id in ids]
+    
+    for index, row in enumerate(rows):
+        if index == pending_index:
+            print(f"✅ Created pending organizer: {row['email']} / {row['password']}")
+        else:
+            print(f"✅ Created {row['role'].value}: {row['email']} / {row['password']}")
     
-    db.commit()
     return users
 
 
@@ -282,21 +268,13 @@ def create_sample_venues(db):
         }
     ]
     
-    venues = []
+    # One batched INSERT and a single commit
+    ids = VenueRepository(db).create_bulk(venues_data)
+    venues_by_id = {venue.id: venue for venue in db.query(Venue).filter(Venue.id.in_(ids))}
+    venues = [venues_by_id[venue_id] for venue_id in ids]
     for venue_data in venues_data:
-        venue = Venue(
-            id=str(uuid.uuid4()),
-            name=venue_data["name"],
-            building=venue_data["building"],
-            capacity=venue_data["capacity"],
-            facilities=venue_data["facilities"],
-            is_active=True
-        )
-        db.add(venue)
-        venues.append(venue)
         print(f"✅ Created venue: {venue_data['name']}")
     
-    db.commit()
     return venues
 
 
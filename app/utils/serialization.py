@@ -0,0 +1,101 @@
+"""
+Serialization helpers shared by model to_dict() methods.
+Builds per-field getter callables once at import so to_dict() is a single pass.
+"""
+from operator import attrgetter
+from typing import Any, Callable, Mapping
+
+Getter = Callable[[Any], Any]
+
+
+def iso_getter(attr: str) -> Getter:
+    """
+    Build a getter returning an attribute's ISO-8601 string, or None.
+
+    Args:
+        attr: Name of a date/datetime attribute
+
+    Returns:
+        Getter: Callable taking a model instance
+    """
+    get = attrgetter(attr)
+
+    def getter(obj: Any) -> Any:
+        value = get(obj)
+        return value.isoformat() if value else None
+
+    return getter
+
+
+def hhmm_getter(attr: str) -> Getter:
+    """
+    Build a getter returning a time attribute formatted as HH:MM, or None.
+
+    Args:
+        attr: Name of a time attribute
+
+    Returns:
+        Getter: Callable taking a model instance
+    """
+    get = attrgetter(attr)
+
+    def getter(obj: Any) -> Any:
+        value = get(obj)
+        return value.strftime("%H:%M") if value else None
+
+    return getter
+
+
+def enum_getter(attr: str, values: Mapping) -> Getter:
+    """
+    Build a getter mapping an enum attribute to its wire value.
+
+    Args:
+        attr: Name of an enum attribute
+        values: Precomputed {member: member.value} lookup
+
+    Returns:
+        Getter: Callable taking a model instance
+    """
+    get = attrgetter(attr)
+    return lambda obj: values[get(obj)]
+
+
+def list_getter(attr: str) -> Getter:
+    """
+    Build a getter returning a JSON list attribute, or [] when unset.
+
+    Args:
+        attr: Name of a JSON array attribute
+
+    Returns:
+        Getter: Callable taking a model instance
+    """
+    get = attrgetter(attr)
+    return lambda obj: get(obj) or []
+
+
+def iso(value: Any) -> Any:
+    """Return value.isoformat() for a date/datetime, or None."""
+    return value.isoformat() if value else None
+
+
+def loaded_state(obj: Any, keys: frozenset) -> dict:
+    """
+    Return an ORM instance's attribute dict with the given columns loaded.
+
+    Reading plain dict entries skips the instrumented-attribute descriptor
+    on every field; expired or deferred columns are loaded first.
+
+    Args:
+        obj: Mapped instance
+        keys: Column attribute names the caller will read
+
+    Returns:
+        dict: The instance __dict__ (read with .get() for transient objects)
+    """
+    state = obj.__dict__
+    missing = keys - state.keys()
+    for key in missing:
+        getattr(obj, key)
+    return state
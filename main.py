@@ -4,12 +4,15 @@ Initializes the application, configures middleware, and includes routers.
 """
 from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from fastapi.exceptions import RequestValidationError
 from sqlalchemy.exc import SQLAlchemyError
+import asyncio
 import logging
 from app.core.config import settings
 from app.core.database import engine, Base
+from app.repositories.audit_log_repository import create_audit_log_partitions, AuditLogNotPartitionedError
+from app.repositories.event_repository import create_organizer_stats_view, refresh_organizer_stats_view
 from app.api import api_router
 
 # Configure logging
@@ -26,6 +29,8 @@ app = FastAPI(
     description="Event management system for University of Maryland students",
     docs_url="/docs" if settings.DEBUG else None,
     redoc_url="/redoc" if settings.DEBUG else None,
+    # Routes that return models or dicts are encoded with orjson, not json.dumps
+    default_response_class=ORJSONResponse,
 )
 
 # Configure CORS
@@ -94,6 +99,46 @@ async def general_exception_handler(request: Request, exc: Exception):
     )
 
 
+async def refresh_organizer_stats_periodically():
+    """
+    Refresh the organizer_stats materialized view now and on a fixed interval.
+    
+    Runs in every worker; an advisory lock in refresh_organizer_stats_view
+    lets only one of them refresh per round.
+    """
+    while True:
+        try:
+            await asyncio.to_thread(refresh_organizer_stats_view, engine)
+        except Exception as e:
+            logger.warning(f"Failed to refresh organizer stats view: {str(e)}")
+        await asyncio.sleep(settings.ORGANIZER_STATS_REFRESH_SECONDS)
+
+
+async def ensure_audit_log_partitions():
+    """
+    Create upcoming monthly audit log partitions (PostgreSQL only).
+    
+    Returns:
+        bool: False if audit_logs is not partitioned, so there is nothing
+        to maintain
+    """
+    try:
+        await asyncio.to_thread(create_audit_log_partitions, engine)
+    except AuditLogNotPartitionedError as e:
+        logger.error(str(e))
+        return False
+    except Exception as e:
+        logger.error(f"Failed to create audit log partitions: {str(e)}")
+    return True
+
+
+async def maintain_audit_log_partitions_periodically():
+    """Keep upcoming monthly audit log partitions in place while running."""
+    while True:
+        await asyncio.sleep(settings.AUDIT_LOG_PARTITION_CHECK_SECONDS)
+        await ensure_audit_log_partitions()
+
+
 # Lifecycle events
 @app.on_event("startup")
 async def startup_event():
@@ -109,11 +154,27 @@ async def startup_event():
         logger.error(f"Failed to create database tables: {str(e)}")
         raise
 
+    # Make sure upcoming monthly audit log partitions exist (PostgreSQL only),
+    # now and for as long as the process runs
+    if engine.dialect.name == "postgresql" and await ensure_audit_log_partitions():
+        app.state.partition_task = asyncio.create_task(maintain_audit_log_partitions_periodically())
+
+    # Pre-aggregated organizer statistics (PostgreSQL only)
+    try:
+        if create_organizer_stats_view(engine):
+            app.state.stats_refresh_task = asyncio.create_task(refresh_organizer_stats_periodically())
+    except Exception as e:
+        logger.warning(f"Failed to create organizer stats view: {str(e)}")
+
 
 @app.on_event("shutdown")
 async def shutdown_event():
     """Cleanup on shutdown."""
     logger.info(f"Shutting down {settings.APP_NAME}")
+    for task_name in ("stats_refresh_task", "partition_task"):
+        task = getattr(app.state, task_name, None)
+        if task:
+            task.cancel()
 
 
 # Include API routers
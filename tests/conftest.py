@@ -5,10 +5,14 @@ import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
-from app.core.database import Base, get_db
+from app.core.database import Base, SessionLocal, get_db
 from app.models.user import User, UserRole
+from app.models.category import Category
+from app.models.event import Event, EventStatus
 from app.core.security import get_password_hash
+from app.repositories.category_repository import _category_cache
 from main import app
+from datetime import date, time, timedelta
 import uuid
 
 # Use in-memory SQLite for testing
@@ -18,7 +22,9 @@ engine = create_engine(
     SQLALCHEMY_TEST_DATABASE_URL,
     connect_args={"check_same_thread": False}
 )
-TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Same session options as production (expire_on_commit=False in particular),
+# bound to the test database
+TestingSessionLocal = sessionmaker(**{**SessionLocal.kw, "bind": engine})
 
 
 def override_get_db():
@@ -38,6 +44,8 @@ def db():
     yield db
     db.close()
     Base.metadata.drop_all(bind=engine)
+    # Cached categories would outlive the dropped tables
+    _category_cache.clear()
 
 
 @pytest.fixture(scope="function")
@@ -98,3 +106,75 @@ def sample_admin(db):
     db.commit()
     db.refresh(user)
     return user
+
+
+@pytest.fixture
+def sample_category(db):
+    """Create a sample event category."""
+    category = Category(
+        id=str(uuid.uuid4()),
+        name="Academic",
+        slug="academic",
+        color="blue"
+    )
+    db.add(category)
+    db.commit()
+    db.refresh(category)
+    return category
+
+
+@pytest.fixture
+def make_event(db, sample_organizer, sample_category):
+    """Factory creating published events a week out."""
+    def _make_event(capacity=10, registered_count=0, title="Test Event"):
+        event = Event(
+            id=str(uuid.uuid4()),
+            title=title,
+            description="An event for testing",
+            category_id=sample_category.id,
+            organizer_id=sample_organizer.id,
+            date=date.today() + timedelta(days=7),
+            start_time=time(10, 0),
+            end_time=time(12, 0),
+            venue="Stamp Student Union",
+            location="Room 2100",
+            capacity=capacity,
+            registered_count=registered_count,
+            status=EventStatus.PUBLISHED
+        )
+        db.add(event)
+        db.commit()
+        db.refresh(event)
+        return event
+    return _make_event
+
+
+@pytest.fixture
+def make_student(db):
+    """Factory creating additional student users."""
+    def _make_student(name):
+        user = User(
+            id=str(uuid.uuid4()),
+            email=f"{name.lower()}@umd.edu",
+            password=get_password_hash("password123"),
+            name=name,
+            role=UserRole.STUDENT,
+            is_approved=True
+        )
+        db.add(user)
+        db.commit()
+        db.refresh(user)
+        return user
+    return _make_student
+
+
+@pytest.fixture
+def auth_headers(client):
+    """Log a user in and return their Authorization header."""
+    def _auth_headers(email):
+        response = client.post(
+            "/api/auth/login",
+            json={"email": email, "password": "password123"}
+        )
+        return {"Authorization": f"Bearer {response.json()['token']}"}
+    return _auth_headers
@@ -0,0 +1,70 @@
+"""
+Tests for audit log writes.
+"""
+import pytest
+from fastapi import status
+from sqlalchemy.exc import IntegrityError
+from app.models.audit_log import AuditLog, AuditAction, TargetType
+from app.repositories.audit_log_repository import AuditLogRepository
+from tests.conftest import TestingSessionLocal
+
+
+class TestAuditLogCreate:
+    """Test that audit entries share the caller's transaction."""
+
+    def test_create_commits_with_caller(self, db, sample_admin):
+        """Test that an entry is written by the caller's commit."""
+        log = AuditLogRepository(db).create(
+            action=AuditAction.CATEGORY_CREATED,
+            actor_id=sample_admin.id,
+            actor_name=sample_admin.name,
+            actor_role=sample_admin.role.value,
+            target_type=TargetType.CATEGORY,
+            target_name="Academic"
+        )
+        db.commit()
+
+        other = TestingSessionLocal()
+        try:
+            stored = other.query(AuditLog).filter(AuditLog.id == log.id).one()
+            assert stored.action == AuditAction.CATEGORY_CREATED
+            assert stored.actor_id == sample_admin.id
+        finally:
+            other.close()
+
+    def test_create_discarded_on_rollback(self, db, sample_admin):
+        """Test that an entry is not written if the caller rolls back."""
+        AuditLogRepository(db).create(
+            action=AuditAction.CATEGORY_CREATED,
+            actor_id=sample_admin.id
+        )
+        db.rollback()
+
+        assert db.query(AuditLog).count() == 0
+
+    def test_create_failure_raises_on_commit(self, db, sample_admin):
+        """Test that an invalid entry fails the caller's commit instead of being dropped."""
+        AuditLogRepository(db).create(action=None, actor_id=sample_admin.id)
+
+        with pytest.raises(IntegrityError):
+            db.commit()
+        db.rollback()
+
+        assert db.query(AuditLog).count() == 0
+
+    def test_request_writes_to_session_database(self, client, db, sample_student, make_event, auth_headers):
+        """Test that entries from a request land in the request session's database."""
+        event = make_event(capacity=10)
+
+        response = client.post(
+            "/api/registrations",
+            json={"eventId": event.id},
+            headers=auth_headers(sample_student.email)
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        log = db.query(AuditLog).filter(
+            AuditLog.action == AuditAction.REGISTRATION_CREATED
+        ).one()
+        assert log.actor_id == sample_student.id
+        assert log.target_name == event.title
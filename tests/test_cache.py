@@ -0,0 +1,57 @@
+"""
+Tests for commit-time cache invalidation.
+"""
+import pytest
+from app.models.organizer_approval import OrganizerApprovalRequest
+from app.repositories.organizer_approval_repository import (
+    OrganizerApprovalRepository,
+    _pending_count_cache,
+)
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    """Start each test without a cached pending count."""
+    _pending_count_cache.clear()
+    yield
+    _pending_count_cache.clear()
+
+
+def _add_request(db, user):
+    """Flush a pending approval request for user."""
+    db.add(OrganizerApprovalRequest(user_id=user.id, reason="Running the campus robotics club"))
+    db.flush()
+
+
+class TestClearOnCommit:
+    """Test that cached reads are dropped when writes commit, not when they flush."""
+
+    def test_flush_keeps_cached_value(self, db, sample_organizer):
+        """Test that a flushed but uncommitted write leaves the cache alone."""
+        repo = OrganizerApprovalRepository(db)
+        assert repo.count_pending() == 0
+
+        _add_request(db, sample_organizer)
+
+        assert repo.count_pending() == 0
+
+    def test_commit_drops_cached_value(self, db, sample_organizer):
+        """Test that committing the write invalidates the cached count."""
+        repo = OrganizerApprovalRepository(db)
+        assert repo.count_pending() == 0
+
+        _add_request(db, sample_organizer)
+        db.commit()
+
+        assert repo.count_pending() == 1
+
+    def test_rollback_forgets_invalidation(self, db, sample_organizer):
+        """Test that a rolled-back write does not invalidate at the next commit."""
+        repo = OrganizerApprovalRepository(db)
+        _add_request(db, sample_organizer)
+        db.rollback()
+        _pending_count_cache.set("pending", 5)
+
+        db.commit()
+
+        assert repo.count_pending() == 5
@@ -0,0 +1,66 @@
+"""
+Tests for event listing endpoints.
+"""
+from fastapi import status
+
+
+class TestEventCursor:
+    """Test keyset cursors on event listings."""
+
+    def test_cursor_continues_listing(self, client, sample_student, make_event, auth_headers):
+        """Test that nextCursor fetches the following page."""
+        headers = auth_headers(sample_student.email)
+        first = make_event(title="First")
+        second = make_event(title="Second")
+
+        response = client.get("/api/events", params={"sortBy": "title", "limit": 1}, headers=headers)
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert [event["id"] for event in data["events"]] == [first.id]
+
+        response = client.get(
+            "/api/events",
+            params={"sortBy": "title", "limit": 1, "cursor": data["nextCursor"]},
+            headers=headers
+        )
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert [event["id"] for event in data["events"]] == [second.id]
+        assert data["pagination"]["currentPage"] is None
+
+    def test_malformed_cursor_rejected(self, client, sample_student, make_event, auth_headers):
+        """Test that a malformed cursor returns 400 instead of page 1."""
+        make_event()
+
+        response = client.get(
+            "/api/events",
+            params={"cursor": "not-a-cursor"},
+            headers=auth_headers(sample_student.email)
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_cursor_from_other_sort_rejected(self, client, sample_student, make_event, auth_headers):
+        """Test that a cursor is only accepted under the sort it was issued for."""
+        headers = auth_headers(sample_student.email)
+        make_event(title="First")
+        make_event(title="Second")
+        cursor = client.get(
+            "/api/events", params={"sortBy": "title", "limit": 1}, headers=headers
+        ).json()["nextCursor"]
+
+        response = client.get(
+            "/api/events", params={"sortBy": "date", "cursor": cursor}, headers=headers
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_malformed_organizer_cursor_rejected(self, client, sample_organizer, auth_headers):
+        """Test that the organizer event listing rejects a malformed cursor."""
+        response = client.get(
+            "/api/organizer/events",
+            params={"limit": 5, "cursor": "not-a-cursor"},
+            headers=auth_headers(sample_organizer.email)
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
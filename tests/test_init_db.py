@@ -0,0 +1,46 @@
+"""
+Tests for the sample data script.
+"""
+from app.core.security import verify_password
+from app.models.user import UserRole
+from app.utils.init_db import create_sample_users, create_sample_venues
+
+
+class TestSampleUsers:
+    """Test seeding sample users in one batch."""
+
+    def test_users_created_in_order(self, db):
+        """Test that every sample user is returned, admin first."""
+        users = create_sample_users(db)
+
+        assert len(users) == 11
+        assert users[0].email == "admin@umd.edu"
+        assert users[0].role == UserRole.ADMIN
+        organizers = [u for u in users if u.role == UserRole.ORGANIZER]
+        assert [u.email for u in organizers if not u.is_approved] == ["pending@umd.edu"]
+        assert len([u for u in organizers if u.is_approved]) == 4
+        student = next(u for u in users if u.email == "student@umd.edu")
+        assert student.graduation_year == "2026"
+        assert student.is_approved is True
+
+    def test_seeded_passwords_verify(self, db):
+        """Test that passwords hashed with the seeding cost factor still verify."""
+        users = create_sample_users(db)
+
+        admin = users[0]
+        assert verify_password("admin123", admin.password)
+        assert not verify_password("wrong", admin.password)
+
+
+class TestSampleVenues:
+    """Test seeding sample venues in one batch."""
+
+    def test_venues_created_in_order(self, db):
+        """Test that every sample venue is returned with its details."""
+        venues = create_sample_venues(db)
+
+        assert len(venues) == 8
+        assert venues[0].name == "Grand Ballroom"
+        assert venues[0].capacity == 500
+        assert "Stage" in venues[0].facilities
+        assert all(venue.is_active for venue in venues)
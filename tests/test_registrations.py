@@ -0,0 +1,130 @@
+"""
+Tests for registration endpoints and seat accounting.
+"""
+from fastapi import status
+from app.models.registration import Registration, RegistrationStatus
+from app.models.waitlist import WaitlistEntry
+from app.repositories.event_repository import EventRepository
+from app.repositories.registration_repository import RegistrationRepository
+
+
+class TestRegister:
+    """Test registering for an event."""
+
+    def test_register_success(self, client, db, sample_student, make_event, auth_headers):
+        """Test successful registration reserves a seat."""
+        event = make_event(capacity=10)
+
+        response = client.post(
+            "/api/registrations",
+            json={"eventId": event.id},
+            headers=auth_headers(sample_student.email)
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert data["success"] is True
+        assert data["registration"]["status"] == "confirmed"
+
+        db.refresh(event)
+        assert event.registered_count == 1
+
+    def test_register_duplicate(self, client, db, sample_student, make_event, auth_headers):
+        """Test that a second registration is refused and takes no seat."""
+        event = make_event(capacity=10)
+        headers = auth_headers(sample_student.email)
+
+        client.post("/api/registrations", json={"eventId": event.id}, headers=headers)
+        response = client.post("/api/registrations", json={"eventId": event.id}, headers=headers)
+
+        assert response.status_code == status.HTTP_409_CONFLICT
+        db.refresh(event)
+        assert event.registered_count == 1
+        assert db.query(Registration).filter(Registration.event_id == event.id).count() == 1
+
+    def test_register_full_event(self, client, db, sample_student, make_event, auth_headers):
+        """Test that a full event suggests the waitlist."""
+        event = make_event(capacity=1, registered_count=1)
+
+        response = client.post(
+            "/api/registrations",
+            json={"eventId": event.id},
+            headers=auth_headers(sample_student.email)
+        )
+
+        assert response.status_code == status.HTTP_409_CONFLICT
+        assert response.headers.get("X-Suggestion") == "join-waitlist"
+        db.refresh(event)
+        assert event.registered_count == 1
+
+
+class TestSeatAccounting:
+    """Test the atomic counter and duplicate-safe insert in the repositories."""
+
+    def test_increment_enforces_capacity(self, db, make_event):
+        """Test that a reservation past capacity matches no row."""
+        event = make_event(capacity=2, registered_count=1)
+        event_repo = EventRepository(db)
+
+        assert event_repo.increment_registered_count(event, 2, enforce_capacity=True) is None
+        assert event_repo.increment_registered_count(event, 1, enforce_capacity=True) is event
+        assert event.registered_count == 2
+        db.commit()
+
+        db.expire_all()
+        assert event.registered_count == 2
+
+    def test_create_if_absent_conflict_releases_seats(self, db, sample_student, make_event):
+        """Test that a conflicting insert rolls back the seat reservation."""
+        event = make_event(capacity=10)
+        event_repo = EventRepository(db)
+        registration_repo = RegistrationRepository(db)
+
+        assert registration_repo.create_if_absent(sample_student.id, event.id, "TKT-1") is not None
+        event_repo.increment_registered_count(event, 1, enforce_capacity=True)
+        db.commit()
+
+        event_repo.increment_registered_count(event, 1, enforce_capacity=True)
+        assert registration_repo.create_if_absent(sample_student.id, event.id, "TKT-2") is None
+
+        db.expire_all()
+        assert event.registered_count == 1
+        assert db.query(Registration).filter(Registration.event_id == event.id).count() == 1
+
+
+class TestCancelRegistration:
+    """Test cancelling a registration."""
+
+    def test_cancel_promotes_from_waitlist(self, client, db, sample_student, make_student, make_event, auth_headers):
+        """Test that a freed seat goes to the first user on the waitlist."""
+        event = make_event(capacity=1)
+        waiting = make_student("Waiting")
+
+        registered = client.post(
+            "/api/registrations",
+            json={"eventId": event.id},
+            headers=auth_headers(sample_student.email)
+        ).json()["registration"]
+        joined = client.post(
+            "/api/waitlist",
+            json={"eventId": event.id},
+            headers=auth_headers(waiting.email)
+        )
+        assert joined.status_code == status.HTTP_200_OK
+
+        response = client.delete(
+            f"/api/registrations/{registered['id']}",
+            headers=auth_headers(sample_student.email)
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        promoted = db.query(Registration).filter(
+            Registration.event_id == event.id,
+            Registration.user_id == waiting.id
+        ).one()
+        assert promoted.status == RegistrationStatus.CONFIRMED
+        assert db.query(WaitlistEntry).filter(WaitlistEntry.event_id == event.id).count() == 0
+
+        db.refresh(event)
+        assert event.registered_count == 1
+        assert event.waitlist_count == 0
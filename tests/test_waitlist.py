@@ -0,0 +1,126 @@
+"""
+Tests for waitlist endpoints.
+"""
+from fastapi import status
+from app.models.waitlist import WaitlistEntry
+
+
+class TestJoinWaitlist:
+    """Test joining an event's waitlist."""
+
+    def test_join_full_event(self, client, db, sample_student, make_event, auth_headers):
+        """Test joining the waitlist of a full event."""
+        event = make_event(capacity=1, registered_count=1)
+
+        response = client.post(
+            "/api/waitlist",
+            json={"eventId": event.id, "notificationPreference": "email"},
+            headers=auth_headers(sample_student.email)
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert data["success"] is True
+        assert data["message"] == "Added to waitlist at position 1"
+        assert data["waitlistEntry"]["position"] == 1
+        assert data["waitlistEntry"]["eventId"] == event.id
+        assert data["waitlistEntry"]["userId"] == sample_student.id
+
+        db.refresh(event)
+        assert event.waitlist_count == 1
+
+    def test_join_appends_to_line(self, client, db, sample_student, make_student, make_event, auth_headers):
+        """Test that later joins are placed behind earlier ones."""
+        event = make_event(capacity=1, registered_count=1)
+        second = make_student("Second")
+
+        client.post(
+            "/api/waitlist",
+            json={"eventId": event.id},
+            headers=auth_headers(sample_student.email)
+        )
+        response = client.post(
+            "/api/waitlist",
+            json={"eventId": event.id},
+            headers=auth_headers(second.email)
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert data["message"] == "Added to waitlist at position 2"
+        assert data["waitlistEntry"]["position"] == 2
+        assert db.query(WaitlistEntry).filter(WaitlistEntry.event_id == event.id).count() == 2
+
+    def test_join_twice(self, client, sample_student, make_event, auth_headers):
+        """Test that a user cannot join the same waitlist twice."""
+        event = make_event(capacity=1, registered_count=1)
+        headers = auth_headers(sample_student.email)
+
+        client.post("/api/waitlist", json={"eventId": event.id}, headers=headers)
+        response = client.post("/api/waitlist", json={"eventId": event.id}, headers=headers)
+
+        assert response.status_code == status.HTTP_409_CONFLICT
+
+    def test_join_event_not_full(self, client, sample_student, make_event, auth_headers):
+        """Test that the waitlist is refused while seats remain."""
+        event = make_event(capacity=10)
+
+        response = client.post(
+            "/api/waitlist",
+            json={"eventId": event.id},
+            headers=auth_headers(sample_student.email)
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+class TestGetWaitlist:
+    """Test listing the current user's waitlist entries."""
+
+    def test_list_shows_place_in_line(self, client, sample_student, make_student, make_event, auth_headers):
+        """Test that each entry reports its place in its event's line."""
+        event = make_event(capacity=1, registered_count=1)
+        second = make_student("Second")
+        headers = auth_headers(second.email)
+
+        client.post("/api/waitlist", json={"eventId": event.id}, headers=auth_headers(sample_student.email))
+        client.post("/api/waitlist", json={"eventId": event.id}, headers=headers)
+        response = client.get("/api/waitlist", headers=headers)
+
+        assert response.status_code == status.HTTP_200_OK
+        entries = response.json()["waitlist"]
+        assert len(entries) == 1
+        assert entries[0]["position"] == 2
+        assert entries[0]["event"]["id"] == event.id
+
+
+class TestEventPreview:
+    """Test the event preview copied onto waitlist entries."""
+
+    def test_event_edit_updates_preview(
+        self, client, db, sample_student, sample_organizer, sample_category, make_event, auth_headers
+    ):
+        """Test that renaming an event renames it in waitlist listings."""
+        event = make_event(capacity=1, registered_count=1)
+        headers = auth_headers(sample_student.email)
+        client.post("/api/waitlist", json={"eventId": event.id}, headers=headers)
+
+        response = client.put(
+            f"/api/organizer/events/{event.id}",
+            json={
+                "title": "Renamed Event",
+                "description": "An event for testing, with a description long enough to pass",
+                "categoryId": sample_category.id,
+                "date": event.date.isoformat(),
+                "startTime": "10:00",
+                "endTime": "12:00",
+                "venue": event.venue,
+                "location": event.location,
+                "capacity": event.capacity
+            },
+            headers=auth_headers(sample_organizer.email)
+        )
+        assert response.status_code == status.HTTP_200_OK
+
+        entries = client.get("/api/waitlist", headers=headers).json()["waitlist"]
+        assert entries[0]["event"]["title"] == "Renamed Event"